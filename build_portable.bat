@@ -18,6 +18,8 @@ pyinstaller --name="ProjectScanner" ^
     --windowed ^
     --icon=scanner_icon.ico ^
     --add-data="src/project_scanner.py;src" ^
+    --add-data="src/manifest_parser.py;src" ^
+    --add-data="src/import_scanner.py;src" ^
     --add-data="src/file_classifier.py;src" ^
     --add-data="src/analyzer.py;src" ^
     --add-data="src/detector.py;src" ^
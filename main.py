@@ -5,23 +5,35 @@ Main Script - YOLO 객체 검출 성능 분석 도구 메인 파이프라인
 
 import sys
 import os
+import time
 import argparse
+import threading
 from pathlib import Path
 
 # src 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from detector import YOLODetector
+# cv2/numpy/matplotlib/openpyxl 등 무거운 의존성은 해당 단계에서 로드
+# (--help, 클라이언트 모드 등에서 불필요한 import 비용 방지)
 from analyzer import DetectionAnalyzer
-from visualizer import ResultVisualizer
-from reporter import ExcelReporter
+from visualizer import ResultVisualizer, parse_chart_options
+from run_metrics import RunMetrics
+
+RAW_DETECTIONS_FILE = 'raw_detections.json'  # 임계값 스윕용 floor 신뢰도 검출 캐시
 
 
 class YOLOAnalysisPipeline:
     """YOLO 분석 도구의 전체 파이프라인"""
 
     def __init__(self, model_path: str, input_dir: str, output_dir: str,
-                 confidence: float = 0.5, iou: float = 0.45, annotation_dir: str = None):
+                 confidence: float = 0.5, iou: float = 0.45, annotation_dir: str = None,
+                 backend: str = None, tile_size: int = None, tile_overlap: float = 0.2, tile_batch: int = 8,
+                 server_url: str = None, chart_dpi: int = 300, chart_format: str = 'png',
+                 chart_options: dict = None, plot_workers: int = None, chart_cache: bool = True,
+                 chart_top_k: int = 20, chart_page_size: int = 50,
+                 sweep_thresholds: list = None, sweep_floor: float = 0.05,
+                 max_sheet_rows: int = 100_000, detail_format: str = 'auto', detail_shard_rows: int = 1_000_000,
+                 export_detections: bool = False):
         """
         Args:
             model_path: YOLO 모델 경로
@@ -30,6 +42,24 @@ class YOLOAnalysisPipeline:
             confidence: 신뢰도 임계값
             iou: NMS IOU 임계값
             annotation_dir: 주석 파일 디렉토리 (선택사항)
+            backend: 추론 백엔드 (None이면 모델 확장자로 선택)
+            tile_size: 타일 추론 크기 (None이면 이미지 전체 추론)
+            tile_overlap: 타일 겹침 비율
+            tile_batch: 배치당 타일 수
+            server_url: 검출 서버 주소 (지정하면 모델을 로드하지 않고 서버에 검출 요청)
+            chart_dpi: 차트 기본 해상도
+            chart_format: 차트 기본 저장 형식 ('png' 또는 'svg')
+            chart_options: 차트별 저장 설정 ({chart_name: {'format': ..., 'dpi': ...}})
+            plot_workers: 차트 렌더링 프로세스 수 (None이면 CPU 수, 0이면 순차 렌더링)
+            chart_cache: 입력 데이터가 바뀌지 않은 차트의 재렌더링 생략 여부
+            chart_top_k: 클래스별 차트에 표시할 최대 클래스 수 (나머지는 'Other')
+            chart_page_size: 전체 클래스 페이지 차트의 페이지당 클래스 수 (0이면 생략)
+            sweep_thresholds: 평가할 신뢰도 임계값 리스트 (지정하면 floor 신뢰도로 한 번만 검출)
+            sweep_floor: 임계값 스윕용 검출 신뢰도 하한
+            max_sheet_rows: 엑셀 시트에 직접 쓰는 검출 상세 행 최대 수 (초과 시 사이드카 파일)
+            detail_format: 사이드카 형식 ('auto', 'parquet', 'csv')
+            detail_shard_rows: 사이드카 샤드당 행 수
+            export_detections: 모든 검출 박스(매칭 상태 포함)를 사이드카 파일로 내보낼지 여부
         """
         self.model_path = model_path
         self.input_dir = input_dir
@@ -37,16 +67,48 @@ class YOLOAnalysisPipeline:
         self.annotation_dir = annotation_dir or os.path.join(os.path.dirname(input_dir), 'annotations')
         self.confidence = confidence
         self.iou = iou
+        self.server_url = server_url
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        self.sweep_thresholds = sorted(sweep_thresholds) if sweep_thresholds else None
+        # 스윕 모드는 가장 낮은 임계값까지 포함하도록 floor 신뢰도로 검출
+        self.sweep_floor = min([sweep_floor, confidence] + (self.sweep_thresholds or []))
+        detect_confidence = self.sweep_floor if self.sweep_thresholds else confidence
 
         # 모듈 초기화
-        self.detector = YOLODetector(model_path, confidence, iou)
+        if server_url:
+            # 서버에 이미 로드된 모델 사용 (모델/백엔드/타일 설정은 서버 기준)
+            from detection_server import DetectionClient
+
+            # --sweep 임계값과 floor는 연결 후 서버 신뢰도 임계값에 맞춤 (_apply_server_thresholds)
+            self.detector = DetectionClient(server_url)
+        else:
+            from detector import YOLODetector
+
+            self.detector = YOLODetector(model_path, detect_confidence, iou, backend=backend,
+                                         tile_size=tile_size, tile_overlap=tile_overlap, tile_batch=tile_batch)
         self.analyzer = DetectionAnalyzer()
-        self.visualizer = ResultVisualizer(output_dir)
-        self.reporter = ExcelReporter(output_dir)
+        self.visualizer = ResultVisualizer(output_dir, dpi=chart_dpi, chart_format=chart_format,
+                                           chart_options=chart_options, max_workers=plot_workers,
+                                           use_cache=chart_cache, top_k=chart_top_k or None,
+                                           page_size=chart_page_size)
+        self.reporter = None  # 엑셀 리포트 단계에서 생성
+        self.report_options = {
+            'max_sheet_rows': max_sheet_rows,
+            'detail_format': detail_format,
+            'detail_shard_rows': detail_shard_rows,
+        }
+        self.export_detections = export_detections
+
+        self.run_metrics = RunMetrics()
+        self.detector.run_metrics = self.run_metrics
 
         self.detection_results = []
+        self.raw_predictions = {}  # 스윕 모드의 floor 신뢰도 예측
         self.analysis_results = {}
         self.has_ground_truth = False
+        self._stop_event = threading.Event()  # 감시 모드 종료 신호
+        self._model_loaded = False
 
     def run(self):
         """전체 파이프라인 실행"""
@@ -54,28 +116,242 @@ class YOLOAnalysisPipeline:
         print("YOLO DETECTION ANALYSIS PIPELINE")
         print("="*70 + "\n")
 
-        # Step 1: 모델 로드
-        print("[STEP 1/5] Loading YOLO Model...")
-        print("-" * 70)
-        if not self.detector.load_model():
-            print("[!] Failed to load model")
+        # 서버 모드는 검출 임계값을 서버에서 받아 캐시 키에 쓰므로 먼저 연결 (모델 로드 비용 없음)
+        if self.server_url and not self._load_model():
             return False
 
-        # Step 2: 객체 검출
-        print("\n[STEP 2/5] Detecting Objects...")
+        # 스윕 모드: 같은 입력/모델의 floor 신뢰도 검출 결과가 캐시되어 있으면 추론 생략
+        raw_results = self._load_raw_detections() if self.sweep_thresholds else None
+
+        if raw_results is None:
+            # Step 1: 모델 로드
+            print("[STEP 1/5] Loading YOLO Model...")
+            print("-" * 70)
+            if not self._load_model():
+                return False
+
+            # Step 2: 객체 검출
+            print("\n[STEP 2/5] Detecting Objects...")
+            print("-" * 70)
+            self.detection_results = self.detector.detect_directory(self.input_dir)
+            if not self.detection_results:
+                print("[!] No detection results")
+                return False
+
+            if self.sweep_thresholds:
+                raw_results = self.detection_results
+                self._save_raw_detections(raw_results)
+        else:
+            print("[STEP 1-2/5] Reusing cached raw detections (inference skipped)")
+            print("-" * 70)
+
+        if self.sweep_thresholds:
+            # 기본 분석/리포트는 --confidence 기준, 스윕은 floor 예측 전체 사용
+            self.raw_predictions = self._to_predictions(raw_results)
+            self.detection_results = self._filter_by_confidence(raw_results, self.confidence)
+            self.detector.stats.reset()
+            for result in self.detection_results:
+                self.detector.stats.add_result(result)
+
+        # 검출 요약
+        detector_summary = self.detector.get_detection_summary()
+        self._print_detection_summary(detector_summary)
+
+        # Step 3: 분석
+        print("\n[STEP 3/5] Analyzing Results...")
         print("-" * 70)
-        self.detection_results = self.detector.detect_directory(self.input_dir)
-        if not self.detection_results:
-            print("[!] No detection results")
+        self._load_ground_truth()
+
+        # 파일 종류 분포와 신뢰도 히스토그램은 검출 중 스트리밍 집계기에서 이미 계산됨
+        # (detector_summary['file_type_distribution'], detector_summary['confidence_histogram'])
+
+        with self.run_metrics.stage('matching'):
+            # 검출 결과를 분석기에 추가
+            print("[*] Processing detection results...")
+            self._add_predictions(self.detection_results)
+            self._analyze(detector_summary, verbose=True)
+
+        if self.sweep_thresholds:
+            with self.run_metrics.stage('threshold_sweep'):
+                self.analysis_results['threshold_sweep'] = self.analyzer.sweep_confidence_thresholds(
+                    self.sweep_thresholds, iou_threshold=0.5, predictions=self.raw_predictions)
+            self._print_threshold_sweep(self.analysis_results['threshold_sweep'])
+
+        print(f"\n[+] Analysis completed")
+        print(f"    Precision: {self.analysis_results['metrics']['overall']['precision']:.4f}")
+        print(f"    Recall: {self.analysis_results['metrics']['overall']['recall']:.4f}")
+        print(f"    F1 Score: {self.analysis_results['metrics']['overall']['f1_score']:.4f}")
+
+        # Step 4, 5: 시각화 및 엑셀 리포트
+        self._create_reports(detector_summary)
+
+        # 실행 계측 저장 (리포트와 같은 위치)
+        metrics_path = self.run_metrics.save(self.output_dir)
+        print(f"[+] Run metrics saved to {metrics_path}")
+
+        self.visualizer.shutdown()
+
+        # 최종 요약
+        self._print_final_summary()
+        return True
+
+    def run_watch(self, snapshot_minutes: float = 10.0, snapshot_images: int = 100,
+                  poll_interval: float = 2.0, include_existing: bool = True):
+        """
+        감시 모드 실행: 모델을 한 번 로드한 뒤 입력 폴더의 새 이미지를 계속 검출하고
+        N분 또는 N장마다 통계/리포트 스냅샷 생성 (Ctrl+C 또는 stop()으로 종료)
+
+        스냅샷의 매칭 분석/상세 행은 직전 스냅샷 이후 구간만 다루고 구간마다 초기화하므로
+        실행 시간이 길어져도 메모리와 스냅샷 비용이 늘지 않는다. 검출 요약(클래스/파일 분류
+        분포, 신뢰도 분위수)은 스트리밍 집계기에서 전체 실행 기준으로 유지된다.
+
+        Args:
+            snapshot_minutes: 스냅샷 주기 (분)
+            snapshot_images: 스냅샷 주기 (새 이미지 수)
+            poll_interval: 폴링 주기 (초, watchdog 미설치 시)
+            include_existing: 시작 시점에 이미 있는 이미지도 처리할지 여부
+
+        Returns:
+            성공 여부
+        """
+        from folder_watcher import FolderWatcher
+
+        if snapshot_minutes <= 0 or snapshot_images < 1:
+            raise ValueError(f"snapshot_minutes must be > 0 and snapshot_images >= 1 "
+                             f"(got {snapshot_minutes}, {snapshot_images})")
+
+        print("\n" + "="*70)
+        print("YOLO DETECTION ANALYSIS PIPELINE (WATCH MODE)")
+        print("="*70 + "\n")
+
+        if not self._load_model():
             return False
+        self._load_ground_truth()
+
+        watcher = FolderWatcher(self.input_dir, poll_interval=poll_interval)
+        watcher.start(include_existing=include_existing)
+        print(f"[*] Snapshot every {snapshot_minutes:g} min or {snapshot_images} new image(s)")
+        print("[*] Press Ctrl+C to stop")
+
+        new_images = 0
+        last_snapshot = time.monotonic()
+        try:
+            for image_paths in watcher.iter_ready_files(self._stop_event):
+                for image_path in image_paths:
+                    result = self.detector.detect_image(image_path)
+                    if not result:
+                        print(f"    [!] Failed: {os.path.basename(image_path)}")
+                        continue
+
+                    self.detection_results.append(result)
+                    self._add_predictions([result])
+                    new_images += 1
+                    print(f"    [{self.detector.stats.total_images}] {result['image_name']} "
+                          f"✓ ({result['total_detections']} objects, {result['file_classification']})")
+
+                due = time.monotonic() - last_snapshot >= snapshot_minutes * 60
+                if new_images and (new_images >= snapshot_images or due):
+                    self._write_snapshot()
+                    watcher.forget_missing()
+                    new_images = 0
+                    last_snapshot = time.monotonic()
+        except KeyboardInterrupt:
+            print("\n[*] Stopping watch mode...")
+        finally:
+            watcher.stop()
+
+        # 마지막 스냅샷 이후 처리된 이미지 반영
+        if new_images:
+            self._write_snapshot()
+        self.visualizer.shutdown()
+
+        if self.analysis_results:
+            self._print_final_summary()
+        return True
 
-        # 검출 요약
+    def stop(self):
+        """감시 모드 종료 요청 (다른 스레드에서 호출 가능)"""
+        self._stop_event.set()
+
+    def _write_snapshot(self):
+        """
+        직전 스냅샷 이후 구간의 검출 결과로 통계/그래프/엑셀 리포트 스냅샷 생성
+
+        리포트 파일은 시각별로 따로 저장되고, 저장 후 구간 상태(검출 결과, 분석기 예측)를 비운다.
+        """
+        print(f"\n[*] Writing snapshot ({len(self.detection_results)} new images)...")
+        print("-" * 70)
         detector_summary = self.detector.get_detection_summary()
+        self.detector.stats.save(os.path.join(self.output_dir, 'detection_stats.json'))
+
+        with self.run_metrics.stage('matching'):
+            self._analyze(detector_summary)
+
+        self._create_reports(detector_summary)
+        self.run_metrics.save(self.output_dir)
+        print(f"[+] Snapshot written: {len(self.detection_results)} new images "
+              f"({detector_summary['total_images']} images, {detector_summary['total_objects']} objects in total)\n")
+
+        # 다음 구간 시작 (누적 집계는 detector.stats에 유지)
+        self.detection_results = []
+        self.detector.detections = []
+        self.analyzer.clear_predictions()
+
+    def _load_model(self) -> bool:
+        """모델 로드 (실패 시 False, 이미 로드했으면 생략)"""
+        if self._model_loaded:
+            return True
+        with self.run_metrics.stage('load_model'):
+            model_loaded = self.detector.load_model()
+        if not model_loaded:
+            print("[!] Failed to load model")
+            return False
+        self._model_loaded = True
+        if self.server_url:
+            self._apply_server_thresholds()
+        return True
+
+    def _apply_server_thresholds(self):
+        """서버 모드: 서버가 실제로 사용하는 임계값으로 분석/캐시 설정을 맞춤 (클라이언트 값과 다르면 경고)"""
+        server_confidence, server_iou = self.detector.confidence, self.detector.iou
+        if server_iou != self.iou:
+            print(f"[!] --iou {self.iou} differs from the detection server's {server_iou}; using the server's value")
+            self.iou = server_iou
+        if not self.sweep_thresholds and server_confidence != self.confidence:
+            print(f"[!] --confidence {self.confidence} differs from the detection server's {server_confidence}; "
+                  f"using the server's value")
+            self.confidence = server_confidence
+
+        if self.sweep_thresholds:
+            # 서버 임계값 미만은 서버가 이미 걸러냈으므로 평가할 수 없음 (같은 행이 반복됨)
+            below = [threshold for threshold in self.sweep_thresholds if threshold < server_confidence]
+            if below:
+                print(f"[!] --sweep thresholds {below} are below the detection server's confidence "
+                      f"{server_confidence}; clamped to {server_confidence}")
+                self.sweep_thresholds = sorted({max(threshold, server_confidence)
+                                                for threshold in self.sweep_thresholds})
+            if self.confidence < server_confidence:
+                print(f"[!] --confidence {self.confidence} is below the detection server's {server_confidence}; "
+                      f"using the server's value")
+                self.confidence = server_confidence
+            print(f"[*] Sweep detection floor: server confidence {server_confidence}")
+            self.sweep_floor = server_confidence
+
+    def _print_detection_summary(self, detector_summary):
+        """검출 요약 출력 및 집계 상태 저장"""
         print(f"\n[+] Detection Summary:")
         print(f"    Total images: {detector_summary['total_images']}")
         print(f"    Total objects: {detector_summary['total_objects']}")
         print(f"    Detection rate: {detector_summary['detection_rate']:.2f}%")
         print(f"    Class distribution: {detector_summary['class_distribution']}")
+        confidence_stats = detector_summary['confidence_stats']
+        if detector_summary['total_objects']:
+            print(f"    Confidence p1/p50/p99: {confidence_stats['p1']:.3f} / "
+                  f"{confidence_stats['p50']:.3f} / {confidence_stats['p99']:.3f}")
+
+        # 병합 가능한 집계 상태 저장 (병렬 작업자/다른 실행 결과와 병합용)
+        stats_path = self.detector.stats.save(os.path.join(self.output_dir, 'detection_stats.json'))
+        print(f"    [+] Detection stats saved to {stats_path}")
 
         # 파일명 분류 정보 출력
         if detector_summary.get('file_classification_stats'):
@@ -84,11 +360,13 @@ class YOLOAnalysisPipeline:
                 obj_count = detector_summary['file_classification_distribution'].get(classification, 0)
                 print(f"    {classification}: {count} files, {obj_count} objects")
 
-        # Step 3: 분석
-        print("\n[STEP 3/5] Analyzing Results...")
-        print("-" * 70)
+        if detector_summary.get('file_classification_levels', {}).get('line'):
+            print(f"\n[+] Line Summary:")
+            for line_key, counts in detector_summary['file_classification_levels']['line'].items():
+                print(f"    {line_key}: {counts['files']} files, {counts['objects']} objects")
 
-        # Ground Truth 로드 시도
+    def _load_ground_truth(self):
+        """Ground Truth 로드 시도"""
         print("[*] Attempting to load ground truth annotations...")
         if os.path.isdir(self.annotation_dir):
             if self.analyzer.load_ground_truth_from_dir(self.annotation_dir):
@@ -98,9 +376,16 @@ class YOLOAnalysisPipeline:
             print(f"[*] Annotation directory not found: {self.annotation_dir}")
             print("[*] Proceeding with detection results only (no ground truth comparison)")
 
-        # 검출 결과를 분석기에 추가
-        print("[*] Processing detection results...")
-        for result in self.detection_results:
+    def _add_predictions(self, detection_results):
+        """검출 결과를 분석기 예측으로 추가"""
+        for image_name, detections in self._to_predictions(detection_results).items():
+            self.analyzer.add_predictions(image_name, detections)
+
+    @staticmethod
+    def _to_predictions(detection_results):
+        """검출 결과를 분석기 예측 형식으로 변환 ({이미지명(확장자 제외): 예측 리스트})"""
+        predictions = {}
+        for result in detection_results:
             image_name = os.path.splitext(result['image_name'])[0]
             detections = []
 
@@ -116,85 +401,148 @@ class YOLOAnalysisPipeline:
                     'confidence': detection['confidence'],
                 })
 
-            self.analyzer.add_predictions(image_name, detections)
+            predictions[image_name] = detections
+        return predictions
+
+    @staticmethod
+    def _filter_by_confidence(detection_results, confidence):
+        """신뢰도 임계값 미만 검출을 제외한 검출 결과 (결과 딕셔너리는 복사본)"""
+        filtered = []
+        for result in detection_results:
+            detections = [d for d in result['detections'] if d['confidence'] >= confidence]
+            filtered.append(dict(result, detections=detections, total_detections=len(detections),
+                                 unique_classes=len({d['class_id'] for d in detections})))
+        return filtered
+
+    def _raw_detections_key(self):
+        """floor 검출 캐시 키 (모델/검출 설정/입력 파일 목록이 같을 때만 재사용)"""
+        model_mtime = os.path.getmtime(self.model_path) if os.path.isfile(self.model_path) else None
+        images = []
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.tiff')):
+                    stat = entry.stat()
+                    images.append([entry.name, stat.st_size, stat.st_mtime_ns])
 
-        # 파일 종류 분석
-        file_type_dist = self._analyze_file_types()
-        detector_summary['file_type_distribution'] = file_type_dist
+        return {
+            'model': os.path.abspath(self.model_path),
+            'model_mtime': model_mtime,
+            'server': self.server_url,
+            'floor': self.sweep_floor,
+            'iou': self.iou,
+            'tile_size': self.tile_size,
+            'tile_overlap': self.tile_overlap,
+            'images': sorted(images),
+        }
 
-        # 신뢰도 수집
-        all_confidences = []
-        for result in self.detection_results:
-            for detection in result['detections']:
-                all_confidences.append(detection['confidence'])
-        detector_summary['all_confidences'] = all_confidences
+    def _load_raw_detections(self):
+        """캐시된 floor 검출 결과 (없거나 키가 다르면 None)"""
+        import json
+
+        cache_path = os.path.join(self.output_dir, RAW_DETECTIONS_FILE)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get('key') != self._raw_detections_key() or not cache.get('results'):
+            print("[*] Raw detection cache is stale, re-running detection")
+            return None
+
+        print(f"[+] Loaded {len(cache['results'])} cached raw detection results from {cache_path}")
+        return cache['results']
+
+    def _save_raw_detections(self, raw_results):
+        """floor 검출 결과 캐시 저장 (다음 스윕에서 추론 생략)"""
+        import json
 
-        # 분석 실행
+        cache_path = os.path.join(self.output_dir, RAW_DETECTIONS_FILE)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': self._raw_detections_key(), 'results': raw_results}, f, ensure_ascii=False)
+        print(f"[+] Raw detections (confidence >= {self.sweep_floor}) cached to {cache_path}")
+
+    def _print_threshold_sweep(self, sweep_rows):
+        """임계값 스윕 결과 출력"""
+        print(f"\n[+] Confidence Threshold Sweep ({len(sweep_rows)} thresholds, floor {self.sweep_floor}):")
         if self.has_ground_truth:
-            print("[+] Running ground truth-based analysis...")
-            self.analysis_results = self.analyzer.analyze_all(iou_threshold=0.5)
-            self.analyzer.print_results(self.analysis_results)
+            print(f"    {'Conf':>6} {'Precision':>10} {'Recall':>8} {'F1':>8} {'mAP':>8} {'TP':>7} {'FP':>7} {'FN':>7}")
+            for row in sweep_rows:
+                print(f"    {row['confidence']:>6.2f} {row['precision']:>10.4f} {row['recall']:>8.4f} "
+                      f"{row['f1_score']:>8.4f} {row['mAP']:>8.4f} {row['tp']:>7} {row['fp']:>7} {row['fn']:>7}")
         else:
-            print("[*] Running detection-only analysis (no ground truth comparison)...")
-            self.analysis_results = self._generate_analysis_results()
+            print(f"    {'Conf':>6} {'Detections':>11} {'Images':>8} {'Rate (%)':>9}")
+            for row in sweep_rows:
+                print(f"    {row['confidence']:>6.2f} {row['detections']:>11} "
+                      f"{row['images_with_detections']:>8} {row['detection_rate']:>9.2f}")
 
-        print(f"\n[+] Analysis completed")
-        print(f"    Precision: {self.analysis_results['metrics']['overall']['precision']:.4f}")
-        print(f"    Recall: {self.analysis_results['metrics']['overall']['recall']:.4f}")
-        print(f"    F1 Score: {self.analysis_results['metrics']['overall']['f1_score']:.4f}")
+    def _analyze(self, detector_summary, verbose: bool = False):
+        """분석 실행 (Ground Truth가 있으면 매칭 기반, 없으면 검출 요약 기반)"""
+        if self.has_ground_truth:
+            if verbose:
+                print("[+] Running ground truth-based analysis...")
+            self.analysis_results = self.analyzer.analyze_all(iou_threshold=0.5)
+            if verbose:
+                self.analyzer.print_results(self.analysis_results)
+        else:
+            if verbose:
+                print("[*] Running detection-only analysis (no ground truth comparison)...")
+            self.analysis_results = self._generate_analysis_results(detector_summary)
 
-        # Step 4: 시각화
+    def _create_reports(self, detector_summary):
+        """시각화 및 엑셀 리포트 생성 (차트는 프로세스 풀에서 엑셀 생성과 동시에 렌더링)"""
+        # Step 4: 시각화 (렌더링 작업만 제출)
         print("\n[STEP 4/5] Creating Visualizations...")
         print("-" * 70)
-        graph_files = self.visualizer.create_full_report(self.analysis_results, detector_summary)
-        print(f"[+] Generated {len(graph_files)} visualization files")
+        plotting_start = time.perf_counter()
+        pending_charts = self.visualizer.submit_full_report(self.analysis_results, detector_summary)
+        print(f"[*] Rendering {len(pending_charts)} charts in background...")
 
         # Step 5: 엑셀 리포트
         print("\n[STEP 5/5] Generating Excel Report...")
         print("-" * 70)
-        report_file = self.reporter.generate_full_report(
-            self.analysis_results,
-            self.detection_results,
-            detector_summary
-        )
+        with self.run_metrics.stage('excel'):
+            from reporter import ExcelReporter
+
+            self.reporter = ExcelReporter(self.output_dir, **self.report_options)
+            report_file = self.reporter.generate_full_report(
+                self.analysis_results,
+                self.detection_results,
+                detector_summary,
+                detection_export_rows=self._iter_detection_export_rows() if self.export_detections else None
+            )
 
         if report_file:
             print(f"[+] Report saved to {report_file}")
         else:
             print("[!] Failed to generate Excel report")
 
-        # 최종 요약
-        self._print_final_summary()
-        return True
+        # 차트 렌더링 완료 대기 (plotting 단계 시간 = 제출부터 완료까지, 엑셀 단계와 겹침)
+        graph_files = self.visualizer.wait_for_report(pending_charts)
+        self.run_metrics.add_stage_time('plotting', time.perf_counter() - plotting_start)
+        print(f"[+] Generated {len(graph_files)} visualization files")
+        return report_file
 
-    def _analyze_file_types(self):
-        """파일 종류 분석"""
-        file_type_dist = {}
-        for result in self.detection_results:
-            image_name = result['image_name']
-            ext = os.path.splitext(image_name)[1].lower()
-            if ext:
-                file_type_dist[ext] = file_type_dist.get(ext, 0) + 1
-        return file_type_dist
-
-    def _generate_analysis_results(self):
-        """분석 결과 생성 (ground truth 없이)"""
-        # 실제 검출 기반 간단한 분석 결과 생성
-        total_detections = sum(r['total_detections'] for r in self.detection_results)
-        total_images = len(self.detection_results)
+    def _iter_detection_export_rows(self):
+        """검출 단위 내보내기 행 (분석기 매칭 행에 원본 이미지 파일명과 파일명 분류를 붙여 스트리밍)"""
+        image_info = {os.path.splitext(result['image_name'])[0]: (result['image_name'], result.get('file_classification'))
+                      for result in self.detection_results}
 
-        # 클래스 정보 추출
-        class_dist = {}
-        class_stats = {}
+        # Ground Truth가 없으면 매칭 결과가 없으므로 매칭 상태는 빈 값
+        match_result = self.analysis_results.get('matches')
+        image_matches = match_result['matches'] if match_result else None
+        for row in self.analyzer.iter_match_rows(image_matches):
+            image_name, file_classification = image_info.get(row[0], (row[0], None))
+            yield (image_name, file_classification) + row[1:]
 
-        for result in self.detection_results:
-            for detection in result['detections']:
-                class_name = detection['class_name']
-                class_dist[class_name] = class_dist.get(class_name, 0) + 1
+    def _generate_analysis_results(self, detector_summary):
+        """분석 결과 생성 (ground truth 없이)"""
+        # 실제 검출 기반 간단한 분석 결과 생성 (스트리밍 집계 요약 사용)
+        total_detections = detector_summary['total_objects']
+        total_images = detector_summary['total_images']
 
-                if class_name not in class_stats:
-                    class_stats[class_name] = {'tp': 0, 'fp': 0, 'fn': 0}
-                class_stats[class_name]['tp'] += 1
+        # 클래스 정보
+        class_dist = detector_summary['class_distribution']
 
         # 메트릭 생성 (간단한 통계)
         per_class_metrics = {}
@@ -234,6 +582,7 @@ class YOLOAnalysisPipeline:
         print(f"  - Visualization graphs (PNG)")
         print(f"  - Excel report (XLSX)")
         print(f"  - Detection results (JSON)")
+        print(f"  - Run metrics (run_metrics.json)")
 
         print(f"\nKey Findings:")
         overall = self.analysis_results['metrics']['overall']
@@ -247,6 +596,8 @@ class YOLOAnalysisPipeline:
             tp = self.analysis_results['metrics']['per_class'][class_name]['tp']
             print(f"  - {class_name}: {tp}")
 
+        self.run_metrics.print_summary()
+
         print("\n" + "="*70 + "\n")
 
 
@@ -260,6 +611,14 @@ Examples:
   python main.py
   python main.py --model yolov8m.pt --input ./test_images --confidence 0.6
   python main.py --model yolov4.pt --output ./results --iou 0.5
+  python main.py --model yolov8n.onnx --input ./test_images
+  python main.py --model yolov8n_openvino_model --backend openvino
+  python main.py --model yolov8n.onnx --tile-size 1280 --tile-overlap 0.2
+  python main.py --model yolov8n.pt --serve --port 8765
+  python main.py --server http://127.0.0.1:8765 --input ./test_images
+  python main.py --watch --input ./line_drop --snapshot-minutes 5 --snapshot-images 200
+  python main.py --chart-dpi 150 --chart-option metrics_summary=svg --chart-option detection_rate=png:96
+  python main.py --annotations ./annotations --sweep 0.1,0.25,0.4,0.5,0.6,0.75,0.9
         '''
     )
 
@@ -275,17 +634,119 @@ Examples:
                        help='Confidence threshold (0.0-1.0, default: 0.5)')
     parser.add_argument('--iou', type=float, default=0.45,
                        help='NMS IOU threshold (0.0-1.0, default: 0.45)')
+    parser.add_argument('--backend', type=str, default='auto',
+                       choices=['auto', 'ultralytics', 'onnxruntime', 'openvino'],
+                       help='Inference backend (default: auto, chosen by model file extension)')
+    parser.add_argument('--tile-size', type=int, default=None,
+                       help='Tiled inference tile size in pixels for large images (default: off)')
+    parser.add_argument('--tile-overlap', type=float, default=0.2,
+                       help='Overlap ratio between adjacent tiles (0.0-0.9, default: 0.2)')
+    parser.add_argument('--tile-batch', type=int, default=8,
+                       help='Number of tiles per inference batch (default: 8)')
+    parser.add_argument('--serve', action='store_true',
+                       help='Load the model once and serve detection requests (warm server mode)')
+    parser.add_argument('--host', type=str, default=None,
+                       help='Detection server bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=None,
+                       help='Detection server port (default: 8765)')
+    parser.add_argument('--server', type=str, default=None,
+                       help='Detection server URL; run as a thin client instead of loading the model')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running and detect new images dropped into the input directory')
+    parser.add_argument('--snapshot-minutes', type=float, default=10.0,
+                       help='Watch mode: write stats/report snapshot every N minutes (default: 10)')
+    parser.add_argument('--snapshot-images', type=int, default=100,
+                       help='Watch mode: write stats/report snapshot every N new images (default: 100)')
+    parser.add_argument('--poll-interval', type=float, default=2.0,
+                       help='Watch mode: polling interval in seconds when watchdog is unavailable (default: 2.0)')
+    parser.add_argument('--chart-dpi', type=int, default=300,
+                       help='Default chart resolution in DPI (default: 300)')
+    parser.add_argument('--chart-format', type=str, default='png', choices=['png', 'svg'],
+                       help='Default chart file format (default: png)')
+    parser.add_argument('--chart-option', action='append', default=[], metavar='NAME=FORMAT[:DPI]',
+                       help='Per-chart format/DPI override, e.g. metrics_summary=svg (repeatable)')
+    parser.add_argument('--plot-workers', type=int, default=None,
+                       help='Chart rendering processes (default: CPU count, 0: render serially)')
+    parser.add_argument('--no-chart-cache', action='store_true',
+                       help='Always re-render charts even if their input data is unchanged')
+    parser.add_argument('--chart-top-k', type=int, default=20,
+                       help='Max classes per class chart; the rest are summed as "Other" (default: 20, 0: all)')
+    parser.add_argument('--chart-page-size', type=int, default=50,
+                       help='Classes per page for full per-class charts when above top-K (default: 50, 0: off)')
+    parser.add_argument('--max-sheet-rows', type=int, default=100_000,
+                       help='Max detection rows written into the Excel sheet; larger runs go to sidecar files '
+                            '(default: 100000)')
+    parser.add_argument('--detail-format', type=str, default='auto', choices=['auto', 'parquet', 'csv'],
+                       help='Sidecar format for large detection detail (default: auto, Parquet if pyarrow is installed)')
+    parser.add_argument('--detail-shard-rows', type=int, default=1_000_000,
+                       help='Rows per sidecar shard file (default: 1000000)')
+    parser.add_argument('--export-detections', action='store_true',
+                       help='Export every detection box (class, confidence, bbox, file classification, TP/FP) '
+                            'to Parquet/CSV sidecar files')
+    parser.add_argument('--sweep', type=str, default=None, metavar='T1,T2,...',
+                       help='Evaluate these confidence thresholds from a single low-confidence detection pass')
+    parser.add_argument('--sweep-floor', type=float, default=0.05,
+                       help='Detection confidence floor for --sweep (default: 0.05)')
 
     args = parser.parse_args()
 
-    # 입력 디렉토리 확인
-    if not os.path.isdir(args.input):
+    # 타일 설정 확인 (detector.MAX_TILE_OVERLAP 범위, 겹침 1.0 이상이면 stride가 1픽셀이 되어 타일 수가 폭증)
+    if args.tile_size is not None and args.tile_size < 1:
+        print(f"[!] --tile-size must be >= 1 (got {args.tile_size})")
+        return 1
+    if not 0.0 <= args.tile_overlap <= 0.9:
+        print(f"[!] --tile-overlap must be between 0.0 and 0.9 (got {args.tile_overlap})")
+        return 1
+    if args.tile_batch < 1:
+        print(f"[!] --tile-batch must be >= 1 (got {args.tile_batch})")
+        return 1
+
+    sweep_thresholds = None
+    if args.sweep:
+        try:
+            sweep_thresholds = [float(value) for value in args.sweep.split(',') if value.strip()]
+        except ValueError:
+            print(f"[!] Invalid --sweep thresholds: {args.sweep}")
+            return 1
+        if not sweep_thresholds or not all(0.0 <= value <= 1.0 for value in sweep_thresholds):
+            print(f"[!] --sweep thresholds must be between 0.0 and 1.0: {args.sweep}")
+            return 1
+        if args.watch:
+            print("[!] --sweep cannot be combined with --watch")
+            return 1
+
+    # 서버 모드: 모델을 한 번 로드하고 요청 대기
+    if args.serve:
+        from detector import YOLODetector
+        from detection_server import serve, DEFAULT_HOST, DEFAULT_PORT
+
+        detector = YOLODetector(args.model, args.confidence, args.iou, backend=args.backend,
+                                tile_size=args.tile_size, tile_overlap=args.tile_overlap,
+                                tile_batch=args.tile_batch)
+        return serve(detector, args.host or DEFAULT_HOST, args.port or DEFAULT_PORT)
+
+    if args.watch and args.server:
+        print("[!] --watch requires a local model (cannot be combined with --server)")
+        return 1
+
+    if args.watch and (args.snapshot_minutes <= 0 or args.snapshot_images < 1):
+        print("[!] --snapshot-minutes must be > 0 and --snapshot-images must be >= 1")
+        return 1
+
+    # 입력 디렉토리 확인 (감시 모드는 빈 폴더에서 시작 가능)
+    if not os.path.isdir(args.input) and not args.watch:
         print(f"[!] Input directory not found: {args.input}")
         print("[*] Creating input directory...")
         os.makedirs(args.input, exist_ok=True)
         print(f"[+] Please add images to {args.input}")
         return 1
 
+    try:
+        chart_options = parse_chart_options(args.chart_option)
+    except ValueError as e:
+        print(f"[!] {e}")
+        return 1
+
     # 출력 디렉토리 생성
     os.makedirs(args.output, exist_ok=True)
 
@@ -296,10 +757,35 @@ Examples:
         output_dir=args.output,
         confidence=args.confidence,
         iou=args.iou,
-        annotation_dir=args.annotations
+        annotation_dir=args.annotations,
+        backend=args.backend,
+        tile_size=args.tile_size,
+        tile_overlap=args.tile_overlap,
+        tile_batch=args.tile_batch,
+        server_url=args.server,
+        chart_dpi=args.chart_dpi,
+        chart_format=args.chart_format,
+        chart_options=chart_options,
+        plot_workers=args.plot_workers,
+        chart_cache=not args.no_chart_cache,
+        chart_top_k=args.chart_top_k,
+        chart_page_size=args.chart_page_size,
+        sweep_thresholds=sweep_thresholds,
+        sweep_floor=args.sweep_floor,
+        max_sheet_rows=args.max_sheet_rows,
+        detail_format=args.detail_format,
+        detail_shard_rows=args.detail_shard_rows,
+        export_detections=args.export_detections
     )
 
-    success = pipeline.run()
+    if args.watch:
+        success = pipeline.run_watch(
+            snapshot_minutes=args.snapshot_minutes,
+            snapshot_images=args.snapshot_images,
+            poll_interval=args.poll_interval
+        )
+    else:
+        success = pipeline.run()
 
     return 0 if success else 1
 
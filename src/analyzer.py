@@ -3,12 +3,67 @@ Analyzer - 객체 검출 성능 분석 모듈 (Precision, Recall, AP, mAP 등)
 Ground Truth 주석을 기반으로 정확한 성능 메트릭 계산
 """
 
-import numpy as np
 from typing import Dict, List, Tuple, Any
 from collections import defaultdict
 import os
 from pathlib import Path
 
+# 저장할 Precision-Recall 곡선 점 개수 (예측 수와 무관하게 결과 크기 고정)
+PR_CURVE_POINTS = 101
+
+
+def _precision_recall_curve(confidences, is_tp, total_ground_truth: int) -> Dict[str, Any]:
+    """
+    신뢰도 내림차순 순위별 precision/recall/F1 배열
+
+    Args:
+        confidences: 예측 신뢰도 배열
+        is_tp: 예측별 TP 여부 배열
+        total_ground_truth: 해당 클래스(또는 전체) ground truth 수
+
+    Returns:
+        {'confidence', 'precision', 'recall', 'f1'} numpy 배열 (순위 순)
+    """
+    import numpy as np
+
+    order = np.argsort(-confidences, kind='stable')
+    tp_cumsum = np.cumsum(is_tp[order])
+    fp_cumsum = np.cumsum(~is_tp[order])
+
+    precision = tp_cumsum / (tp_cumsum + fp_cumsum)
+    recall = tp_cumsum / total_ground_truth
+    denominator = precision + recall
+    f1 = np.divide(2 * precision * recall, denominator, out=np.zeros_like(precision), where=denominator > 0)
+
+    return {
+        'confidence': confidences[order],
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+    }
+
+
+def _downsample_curve(curve: Dict[str, Any], num_points: int) -> Dict[str, List[float]]:
+    """
+    곡선을 순위 기준 균등 간격 num_points개로 줄여 리스트로 변환 (첫/마지막 점 포함)
+
+    Args:
+        curve: _precision_recall_curve() 결과
+        num_points: 최대 점 개수
+
+    Returns:
+        JSON 직렬화 가능한 곡선 딕셔너리
+    """
+    import numpy as np
+
+    length = len(curve['precision'])
+    if length > num_points:
+        indices = np.unique(np.linspace(0, length - 1, num_points).round().astype(int))
+    else:
+        indices = np.arange(length)
+
+    return {key: values[indices].tolist() for key, values in curve.items()}
+
 
 class DetectionAnalyzer:
     """객체 검출 성능을 분석하는 클래스"""
@@ -87,6 +142,11 @@ class DetectionAnalyzer:
         """
         self.predictions[image_name] = detections
 
+    def clear_predictions(self):
+        """예측 결과 초기화 (ground truth는 유지, 감시 모드의 스냅샷 구간 전환용)"""
+        self.predictions = {}
+        self.metrics = {}
+
     def calculate_iou(self, box1: Dict, box2: Dict) -> float:
         """
         IoU (Intersection over Union) 계산
@@ -193,6 +253,30 @@ class DetectionAnalyzer:
             'matches': dict(matches),
         }
 
+    def iter_match_rows(self, matches: Dict[str, List[Dict]] = None):
+        """
+        검출(예측) 단위 매칭 결과를 행 튜플로 반환 (열 기반 내보내기용, 중간 딕셔너리 없이 스트리밍)
+
+        Args:
+            matches: match_predictions_with_ground_truth()['matches'] (None이면 매칭 상태 없이 반환)
+
+        Yields:
+            (image_name, class, confidence, x1, y1, x2, y2, match, iou) 튜플
+            (match는 'TP'/'FP', Ground Truth가 없으면 match와 iou는 None)
+        """
+        for image_name, predictions in self.predictions.items():
+            # matches[image_name]은 예측 순서대로 예측마다 하나씩 기록됨
+            image_matches = matches.get(image_name) if matches else None
+            for index, pred in enumerate(predictions):
+                bbox = pred['bbox']
+                if image_matches:
+                    match = image_matches[index]['match']
+                    iou = image_matches[index]['iou']
+                else:
+                    match = iou = None
+                yield (image_name, pred['class'], pred.get('confidence', 0),
+                       bbox['x1'], bbox['y1'], bbox['x2'], bbox['y2'], match, iou)
+
     def calculate_metrics(self, matches: Dict[str, Any]) -> Dict[str, Any]:
         """
         Precision, Recall, F1 Score 계산
@@ -259,56 +343,243 @@ class DetectionAnalyzer:
         Returns:
             클래스별 AP 값
         """
+        return self.calculate_precision_recall(matches)['ap_scores']
+
+    def calculate_precision_recall(self, matches: Dict[str, Any],
+                                   num_points: int = PR_CURVE_POINTS) -> Dict[str, Any]:
+        """
+        클래스별 Precision-Recall 곡선과 AP 계산 (numpy 벡터화)
+
+        예측을 신뢰도 내림차순으로 정렬한 뒤 TP/FP 누적합으로 각 순위의 precision/recall을
+        구한다. AP는 기존 정의(각 순위 precision의 평균)를 그대로 사용한다.
+
+        Args:
+            matches: 매칭 결과
+            num_points: 저장할 곡선 점 개수 (크기 제한용 다운샘플링)
+
+        Returns:
+            {'ap_scores': {class: AP},
+             'pr_curves': {class: {'confidence', 'precision', 'recall', 'f1'}},
+             'overall_pr_curve': 전체 클래스 통합 곡선,
+             'best_confidence': 전체 F1이 최대인 신뢰도 임계값 정보}
+        """
+        import numpy as np
+
+        class_names = []
+        confidences = []
+        is_tp = []
+        for image_matches in matches['matches'].values():
+            for match in image_matches:
+                class_names.append(match['prediction']['class'])
+                confidences.append(match['prediction'].get('confidence', 0))
+                is_tp.append(match['match'] == 'TP')
+
+        class_names = np.asarray(class_names, dtype=object)
+        confidences = np.asarray(confidences, dtype=float)
+        is_tp = np.asarray(is_tp, dtype=bool)
+
         class_ap = {}
+        pr_curves = {}
 
         all_classes = set(list(matches['class_tp'].keys()) + list(matches['class_fp'].keys()))
 
         for class_name in all_classes:
-            # 해당 클래스의 모든 예측과 ground truth 수집
-            class_predictions = []
-            total_ground_truth = 0
-
-            for image_name, image_matches in matches['matches'].items():
-                for match in image_matches:
-                    if match['prediction']['class'] == class_name:
-                        class_predictions.append({
-                            'confidence': match['prediction'].get('confidence', 0),
-                            'is_tp': match['match'] == 'TP',
-                        })
-
-                total_ground_truth += matches['class_fn'].get(class_name, 0)
-
-            total_ground_truth += matches['class_tp'].get(class_name, 0)
+            total_ground_truth = matches['class_tp'].get(class_name, 0) + matches['class_fn'].get(class_name, 0)
+            mask = class_names == class_name
 
-            if total_ground_truth == 0 or not class_predictions:
+            if total_ground_truth == 0 or not mask.any():
                 class_ap[class_name] = 0.0
                 continue
 
-            # 신뢰도로 정렬
-            class_predictions.sort(key=lambda x: x['confidence'], reverse=True)
+            curve = _precision_recall_curve(confidences[mask], is_tp[mask], total_ground_truth)
 
-            # Precision-Recall 곡선 계산
-            tp_count = 0
-            fp_count = 0
-            precisions = []
-            recalls = []
+            # AP 계산 (간단한 버전: 각 순위 precision의 평균)
+            class_ap[class_name] = float(curve['precision'].mean())
+            pr_curves[class_name] = _downsample_curve(curve, num_points)
 
-            for pred in class_predictions:
-                if pred['is_tp']:
-                    tp_count += 1
-                else:
-                    fp_count += 1
+        result = {
+            'ap_scores': class_ap,
+            'pr_curves': pr_curves,
+            'overall_pr_curve': None,
+            'best_confidence': None,
+        }
+
+        # 전체 클래스 통합 곡선 (신뢰도 임계값별 전체 precision/recall/F1)
+        total_ground_truth = matches['total_tp'] + matches['total_fn']
+        if total_ground_truth > 0 and len(confidences):
+            curve = _precision_recall_curve(confidences, is_tp, total_ground_truth)
+            best = int(np.argmax(curve['f1']))
+            result['overall_pr_curve'] = _downsample_curve(curve, num_points)
+            result['best_confidence'] = {
+                'confidence': float(curve['confidence'][best]),
+                'precision': float(curve['precision'][best]),
+                'recall': float(curve['recall'][best]),
+                'f1_score': float(curve['f1'][best]),
+            }
+
+        return result
+
+    def _prepare_sweep_arrays(self, predictions: Dict[str, List[Dict]], class_index: Dict[str, int]) -> List[Dict[str, Any]]:
+        """
+        이미지별 예측/GT 배열과 IoU 행렬을 한 번만 계산 (임계값 스윕용)
 
-                precision = tp_count / (tp_count + fp_count)
-                recall = tp_count / total_ground_truth
+        match_predictions_with_ground_truth()와 같이 예측이 있는(검출을 실행한) 이미지만 대상으로 한다
+        (검출하지 않은 이미지의 GT를 FN으로 세지 않음).
 
-                precisions.append(precision)
-                recalls.append(recall)
+        Args:
+            predictions: {image_name: 예측 리스트}
+            class_index: {클래스명: 정수 인덱스} (새 클래스는 추가됨)
+
+        Returns:
+            이미지별 {'confidence', 'pred_class', 'gt_class', 'iou'} 배열 리스트
+        """
+        import numpy as np
+
+        def boxes_to_array(items):
+            return np.array([[item['bbox']['x1'], item['bbox']['y1'], item['bbox']['x2'], item['bbox']['y2']]
+                             for item in items], dtype=float).reshape(-1, 4)
+
+        def class_ids(items):
+            return np.array([class_index.setdefault(item['class'], len(class_index)) for item in items],
+                            dtype=int)
+
+        images = []
+        for image_name in predictions:
+            preds = predictions.get(image_name, [])
+            gts = self.ground_truth.get(image_name, [])
+
+            pred_boxes = boxes_to_array(preds)
+            gt_boxes = boxes_to_array(gts)
+            pred_class = class_ids(preds)
+            gt_class = class_ids(gts)
+
+            # IoU 행렬 (다른 클래스 쌍은 0으로 두어 매칭 후보에서 제외)
+            inter_w = np.clip(np.minimum(pred_boxes[:, None, 2], gt_boxes[None, :, 2]) -
+                              np.maximum(pred_boxes[:, None, 0], gt_boxes[None, :, 0]), 0, None)
+            inter_h = np.clip(np.minimum(pred_boxes[:, None, 3], gt_boxes[None, :, 3]) -
+                              np.maximum(pred_boxes[:, None, 1], gt_boxes[None, :, 1]), 0, None)
+            inter = inter_w * inter_h
+            pred_area = (pred_boxes[:, 2] - pred_boxes[:, 0]) * (pred_boxes[:, 3] - pred_boxes[:, 1])
+            gt_area = (gt_boxes[:, 2] - gt_boxes[:, 0]) * (gt_boxes[:, 3] - gt_boxes[:, 1])
+            union = pred_area[:, None] + gt_area[None, :] - inter
+            iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+            iou[pred_class[:, None] != gt_class[None, :]] = 0.0
+
+            images.append({
+                'confidence': np.array([pred.get('confidence', 0) for pred in preds], dtype=float),
+                'pred_class': pred_class,
+                'gt_class': gt_class,
+                'iou': iou,
+            })
+        return images
+
+    def sweep_confidence_thresholds(self, thresholds: List[float], iou_threshold: float = 0.5,
+                                    predictions: Dict[str, List[Dict]] = None) -> List[Dict[str, Any]]:
+        """
+        추론을 다시 하지 않고 여러 신뢰도 임계값의 성능 계산
 
-            # AP 계산 (간단한 버전)
-            class_ap[class_name] = np.mean(precisions) if precisions else 0.0
+        낮은 신뢰도(floor)로 한 번 검출한 예측에서 임계값별로 예측을 걸러낸 뒤
+        match_predictions_with_ground_truth()와 같은 규칙(예측 순서대로, 같은 클래스의
+        매칭되지 않은 GT 중 IoU 최대)으로 다시 매칭한다. IoU 행렬은 이미지당 한 번만 계산한다.
 
-        return class_ap
+        Args:
+            thresholds: 평가할 신뢰도 임계값 리스트
+            iou_threshold: TP 판정 IoU 임계값
+            predictions: floor 신뢰도 예측 (None이면 self.predictions)
+
+        Returns:
+            임계값별 메트릭 행 리스트 (Ground Truth가 없으면 검출 수만 포함)
+        """
+        import numpy as np
+
+        predictions = self.predictions if predictions is None else predictions
+        class_index = {}
+        images = self._prepare_sweep_arrays(predictions, class_index)
+        num_classes = max(len(class_index), 1)
+        has_ground_truth = bool(self.ground_truth)
+
+        gt_per_class = np.zeros(num_classes, dtype=int)
+        for image in images:
+            gt_per_class += np.bincount(image['gt_class'], minlength=num_classes)
+        total_gt = int(gt_per_class.sum())
+
+        rows = []
+        for threshold in sorted(thresholds):
+            tp_per_class = np.zeros(num_classes, dtype=int)
+            fp_per_class = np.zeros(num_classes, dtype=int)
+            kept_confidence = []
+            kept_class = []
+            kept_tp = []
+            images_with_detections = 0
+
+            for image in images:
+                kept = np.flatnonzero(image['confidence'] >= threshold)
+                if len(kept):
+                    images_with_detections += 1
+                if not has_ground_truth:
+                    kept_class.append(image['pred_class'][kept])
+                    continue
+
+                iou = image['iou']
+                matched = np.zeros(iou.shape[1], dtype=bool)
+                is_tp = np.zeros(len(kept), dtype=bool)
+                for position, pred_index in enumerate(kept):
+                    if not iou.shape[1]:
+                        break
+                    row = np.where(matched, 0.0, iou[pred_index])
+                    best = int(np.argmax(row))
+                    if row[best] > 0 and row[best] >= iou_threshold:
+                        matched[best] = True
+                        is_tp[position] = True
+
+                kept_confidence.append(image['confidence'][kept])
+                kept_class.append(image['pred_class'][kept])
+                kept_tp.append(is_tp)
+
+            kept_class = np.concatenate(kept_class) if kept_class else np.zeros(0, dtype=int)
+            row = {
+                'confidence': threshold,
+                'detections': int(len(kept_class)),
+                'images_with_detections': images_with_detections,
+                'detection_rate': images_with_detections / len(predictions) * 100 if predictions else 0.0,
+            }
+
+            if has_ground_truth:
+                kept_confidence = np.concatenate(kept_confidence)
+                kept_tp = np.concatenate(kept_tp)
+                tp_per_class = np.bincount(kept_class[kept_tp], minlength=num_classes)
+                fp_per_class = np.bincount(kept_class[~kept_tp], minlength=num_classes)
+
+                tp = int(tp_per_class.sum())
+                fp = int(fp_per_class.sum())
+                fn = total_gt - tp
+                precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+                recall = tp / (tp + fn) if (tp + fn) > 0 else 0
+                f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
+
+                # AP는 calculate_precision_recall()과 같은 정의 (예측이 있는 클래스 대상)
+                ap_scores = []
+                for class_id in np.flatnonzero(tp_per_class + fp_per_class):
+                    if gt_per_class[class_id] == 0:
+                        ap_scores.append(0.0)
+                        continue
+                    mask = kept_class == class_id
+                    curve = _precision_recall_curve(kept_confidence[mask], kept_tp[mask], int(gt_per_class[class_id]))
+                    ap_scores.append(float(curve['precision'].mean()))
+
+                row.update({
+                    'precision': precision,
+                    'recall': recall,
+                    'f1_score': f1_score,
+                    'tp': tp,
+                    'fp': fp,
+                    'fn': fn,
+                    'mAP': sum(ap_scores) / len(ap_scores) if ap_scores else 0.0,
+                })
+
+            rows.append(row)
+
+        return rows
 
     def get_detection_rate(self, total_objects: int = None) -> float:
         """
@@ -342,12 +613,15 @@ class DetectionAnalyzer:
         """
         matches = self.match_predictions_with_ground_truth(iou_threshold)
         metrics = self.calculate_metrics(matches)
-        ap_scores = self.calculate_ap(matches, iou_threshold)
+        precision_recall = self.calculate_precision_recall(matches)
 
         return {
             'matches': matches,
             'metrics': metrics,
-            'ap_scores': ap_scores,
+            'ap_scores': precision_recall['ap_scores'],
+            'pr_curves': precision_recall['pr_curves'],
+            'overall_pr_curve': precision_recall['overall_pr_curve'],
+            'best_confidence': precision_recall['best_confidence'],
             'detection_rate': self.get_detection_rate(),
             'iou_threshold': iou_threshold,
         }
@@ -382,9 +656,15 @@ class DetectionAnalyzer:
                 print(f"  {class_name}: {ap:.4f}")
 
         # mAP
-        mAP = np.mean(list(results['ap_scores'].values())) if results['ap_scores'] else 0
+        mAP = sum(results['ap_scores'].values()) / len(results['ap_scores']) if results['ap_scores'] else 0
         print(f"\nmAP (mean Average Precision): {mAP:.4f}")
 
+        # F1 최대 신뢰도 임계값
+        best = results.get('best_confidence')
+        if best:
+            print(f"\nBest Confidence Threshold (max F1): {best['confidence']:.3f}")
+            print(f"  Precision: {best['precision']:.4f}, Recall: {best['recall']:.4f}, F1 Score: {best['f1_score']:.4f}")
+
         # 검출률
         print(f"\nDetection Rate: {results['detection_rate']:.2f}%")
 
@@ -407,12 +687,25 @@ def main():
         {'class': 'cat', 'bbox': {'x1': 125, 'y1': 35, 'x2': 205, 'y2': 185}, 'confidence': 0.85},
     ])
 
+    # 검출하지 않은 이미지의 GT (분석/스윕 모두에서 제외되어야 함)
+    analyzer.add_ground_truth('image2.jpg', [
+        {'class': 'dog', 'bbox': {'x1': 0, 'y1': 0, 'x2': 50, 'y2': 50}},
+    ])
+
     # 분석 실행
     results = analyzer.analyze_all()
 
     # 결과 출력
     analyzer.print_results(results)
 
+    # 스윕(최저 임계값)과 analyze_all()의 TP/FP/FN 비교
+    sweep_row = analyzer.sweep_confidence_thresholds([0.5])[0]
+    overall = results['metrics']['overall']
+    if all(sweep_row[key] == overall[key] for key in ('tp', 'fp', 'fn')):
+        print(f"[+] Sweep matches analysis: TP={overall['tp']} FP={overall['fp']} FN={overall['fn']}")
+    else:
+        print(f"[!] Sweep/analysis mismatch: {sweep_row} vs {overall}")
+
 
 if __name__ == "__main__":
     main()
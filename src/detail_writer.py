@@ -0,0 +1,191 @@
+"""
+Detail Writer - 이미지/검출 단위 상세 데이터를 열 기반 사이드카 파일로 기록
+pyarrow가 설치되어 있으면 Parquet, 없으면 gzip CSV로 기록하며
+행 수 기준으로 자동 분할(샤딩)
+"""
+
+import os
+import csv
+import gzip
+from typing import Dict, List, Any, Tuple
+
+DEFAULT_SHARD_ROWS = 1_000_000
+DEFAULT_BATCH_ROWS = 65_536
+DETAIL_FORMATS = ('auto', 'parquet', 'csv')
+
+# 열 타입 → pyarrow 타입 이름
+_ARROW_TYPES = {'string': 'string', 'int': 'int64', 'float': 'float64'}
+
+
+def resolve_detail_format(detail_format: str = 'auto') -> str:
+    """
+    사이드카 형식 결정
+
+    Args:
+        detail_format: 'auto', 'parquet', 'csv'
+
+    Returns:
+        'parquet' 또는 'csv' ('auto'는 pyarrow 설치 여부로 선택)
+    """
+    if detail_format not in DETAIL_FORMATS:
+        raise ValueError(f"Unknown detail format: {detail_format} (choose from {', '.join(DETAIL_FORMATS)})")
+
+    if detail_format == 'csv':
+        return 'csv'
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        if detail_format == 'parquet':
+            print("[!] pyarrow not installed, writing gzip CSV instead (pip install pyarrow)")
+        return 'csv'
+    return 'parquet'
+
+
+class ShardedTableWriter:
+    """
+    행 단위로 받은 데이터를 열 기반 파일 샤드로 기록
+
+    행은 batch_rows개씩 모아 기록하고(Parquet row group), 샤드 하나가 shard_rows행에
+    도달하면 다음 샤드 파일을 연다. 파일 이름은 '{basename}_{샤드번호:05d}.parquet'
+    또는 '.csv.gz'.
+    """
+
+    def __init__(self, output_dir: str, basename: str, columns: List[Tuple[str, str]],
+                 shard_rows: int = DEFAULT_SHARD_ROWS, detail_format: str = 'auto',
+                 batch_rows: int = DEFAULT_BATCH_ROWS):
+        """
+        Args:
+            output_dir: 샤드 저장 디렉토리
+            basename: 샤드 파일 이름 앞부분
+            columns: [(열 이름, 'string' | 'int' | 'float')]
+            shard_rows: 샤드당 최대 행 수
+            detail_format: 'auto', 'parquet', 'csv'
+            batch_rows: 한 번에 기록할 행 수
+        """
+        self.output_dir = output_dir
+        self.basename = basename
+        self.columns = columns
+        self.shard_rows = max(1, shard_rows)
+        self.batch_rows = max(1, min(batch_rows, self.shard_rows))
+        self.format = resolve_detail_format(detail_format)
+
+        self.shards = []  # [{'path', 'rows', 'format'}]
+        self.total_rows = 0
+        self._buffer = []
+        self._file = None  # 현재 샤드 (ParquetWriter 또는 gzip 텍스트 파일)
+        self._csv_writer = None
+        self._schema = None
+
+    @property
+    def extension(self) -> str:
+        return '.parquet' if self.format == 'parquet' else '.csv.gz'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_row(self, values: List[Any]):
+        """
+        행 추가 (values는 columns 순서)
+
+        Args:
+            values: 셀 값 리스트
+        """
+        self._buffer.append(values)
+        if len(self._buffer) >= self.batch_rows:
+            self._flush()
+
+    def write_rows(self, rows):
+        """여러 행 추가"""
+        for values in rows:
+            self.write_row(values)
+
+    def _open_shard(self):
+        """다음 샤드 파일 열기"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{self.basename}_{len(self.shards):05d}{self.extension}")
+
+        if self.format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._schema is None:
+                self._schema = pa.schema([(name, getattr(pa, _ARROW_TYPES[kind])()) for name, kind in self.columns])
+            self._file = pq.ParquetWriter(path, self._schema, compression='zstd')
+        else:
+            self._file = gzip.open(path, 'wt', encoding='utf-8', newline='')
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow([name for name, _ in self.columns])
+
+        self.shards.append({'path': path, 'rows': 0, 'format': self.format})
+
+    def _close_shard(self):
+        """현재 샤드 파일 닫기"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def _write_batch(self, rows: List[List[Any]]):
+        """현재 샤드에 행 묶음 기록"""
+        if self.format == 'parquet':
+            import pyarrow as pa
+
+            data = {name: [row[index] for row in rows] for index, (name, _) in enumerate(self.columns)}
+            self._file.write_table(pa.Table.from_pydict(data, schema=self._schema))
+        else:
+            self._csv_writer.writerows(rows)
+
+    def _flush(self):
+        """버퍼의 행을 샤드 크기에 맞춰 나누어 기록"""
+        rows = self._buffer
+        self._buffer = []
+
+        while rows:
+            if self._file is None:
+                self._open_shard()
+
+            shard = self.shards[-1]
+            take = min(len(rows), self.shard_rows - shard['rows'])
+            self._write_batch(rows[:take])
+            shard['rows'] += take
+            self.total_rows += take
+            rows = rows[take:]
+
+            if shard['rows'] >= self.shard_rows:
+                self._close_shard()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        남은 행을 기록하고 파일 닫기
+
+        Returns:
+            샤드 정보 리스트 [{'path', 'rows', 'format'}]
+        """
+        if self._buffer:
+            self._flush()
+        self._close_shard()
+        return self.shards
+
+
+def main():
+    """테스트 코드"""
+    import tempfile
+
+    columns = [('image_name', 'string'), ('total_detections', 'int'), ('confidence_avg', 'float')]
+    with tempfile.TemporaryDirectory() as output_dir:
+        with ShardedTableWriter(output_dir, 'detections', columns, shard_rows=2500, batch_rows=1000) as writer:
+            for index in range(6000):
+                writer.write_row([f'image_{index:05d}.jpg', index % 5, (index % 100) / 100])
+
+        print(f"Format: {writer.format}")
+        for shard in writer.shards:
+            print(f"  {os.path.basename(shard['path'])}: {shard['rows']} rows, "
+                  f"{os.path.getsize(shard['path'])} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Detection Server - 모델을 메모리에 유지하는 로컬 검출 서비스
+모델 로드 비용(import ultralytics/torch, YOLO(model_path))을 한 번만 지불하고
+main.py 클라이언트 모드에서 디렉토리 단위 검출 요청을 처리
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import argparse
+import http.client
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional
+
+from detection_stats import DetectionStatsAggregator
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+
+class DetectionRequestHandler(BaseHTTPRequestHandler):
+    """
+    검출 요청 핸들러
+
+    GET  /health  → 서버/모델 상태 (JSON)
+    POST /detect  → {"input_dir": str, "image_extensions": [str]} 요청,
+                    이미지별 결과를 한 줄씩 JSON(NDJSON)으로 스트리밍
+    """
+
+    server_version = 'YOLODetectionServer/1.0'
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(404, {'error': f'Unknown path: {self.path}'})
+            return
+
+        detector = self.server.detector
+        self._send_json(200, {
+            'status': 'ok',
+            'model': detector.model_path,
+            'backend': detector.backend.name if detector.backend else None,
+            'device': detector.device,
+            'class_names': {str(k): v for k, v in detector.class_names.items()},
+            'confidence': detector.confidence,
+            'iou': detector.iou,
+        })
+
+    def do_POST(self):
+        if self.path != '/detect':
+            self._send_json(404, {'error': f'Unknown path: {self.path}'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            input_dir = request['input_dir']
+        except (ValueError, KeyError) as e:
+            self._send_json(400, {'error': f'Invalid request: {e}'})
+            return
+
+        if not os.path.isdir(input_dir):
+            self._send_json(404, {'error': f'Directory not found: {input_dir}'})
+            return
+
+        # 연결 종료로 스트림 끝을 알림 (HTTP/1.0)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.end_headers()
+
+        detector = self.server.detector
+        total = 0
+        # 모델은 하나이므로 요청은 순차 처리
+        with self.server.detector_lock:
+            detector.clear_detections()
+            try:
+                for result in detector.iter_detect_directory(input_dir, request.get('image_extensions')):
+                    self.wfile.write((json.dumps({'result': result}, ensure_ascii=False) + '\n').encode('utf-8'))
+                    self.wfile.flush()
+                    total += 1
+            except (BrokenPipeError, ConnectionResetError):
+                print("[!] Client disconnected")
+                return
+            finally:
+                # 서버에 결과가 쌓이지 않도록 요청마다 초기화
+                detector.clear_detections()
+
+        self.wfile.write((json.dumps({'done': True, 'total': total}) + '\n').encode('utf-8'))
+        self.wfile.flush()
+
+
+def serve(detector, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+    """
+    모델을 로드하고 검출 서버 실행 (Ctrl+C로 종료)
+
+    Args:
+        detector: YOLODetector 객체 (아직 로드되지 않은 상태)
+        host: 바인드 주소 (기본값: localhost만 허용)
+        port: 포트
+
+    Returns:
+        종료 코드
+    """
+    if not detector.load_model():
+        print("[!] Failed to load model")
+        return 1
+
+    server = ThreadingHTTPServer((host, port), DetectionRequestHandler)
+    server.detector = detector
+    server.detector_lock = threading.Lock()
+
+    print(f"[+] Detection server listening on http://{host}:{port}")
+    print("[*] Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[*] Shutting down detection server")
+    finally:
+        server.server_close()
+    return 0
+
+
+class DetectionClient:
+    """
+    검출 서버 클라이언트
+
+    YOLODetector와 같은 인터페이스(load_model, detect_directory, get_detection_summary,
+    stats, run_metrics)를 제공하므로 YOLOAnalysisPipeline에서 그대로 대체할 수 있다.
+    """
+
+    def __init__(self, server_url: str, timeout: float = 30.0, read_timeout: Optional[float] = None):
+        """
+        Args:
+            server_url: 서버 주소 (예: 'http://127.0.0.1:8765')
+            timeout: 연결 및 /health 응답 대기 시간 (초)
+            read_timeout: /detect 스트림에서 다음 결과를 기다리는 최대 시간 (초, None이면 무제한).
+                타일 분할 대형 이미지는 한 장에 수십 초 이상 걸릴 수 있음
+        """
+        self.server_url = server_url.rstrip('/')
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self.model_path = None
+        self.device = None
+        self.confidence = None  # 서버의 검출 임계값 (load_model()에서 설정)
+        self.iou = None
+        self.class_names = {}
+        self.detections = []
+        self.stats = DetectionStatsAggregator()
+        self.run_metrics = None
+
+    def load_model(self) -> bool:
+        """서버 상태 확인 (모델은 서버에 이미 로드되어 있음)"""
+        print(f"[*] Connecting to detection server at {self.server_url}...")
+
+        try:
+            with urllib.request.urlopen(f"{self.server_url}/health", timeout=self.timeout) as response:
+                health = json.loads(response.read().decode('utf-8'))
+        except Exception as e:
+            print(f"    [!] Error connecting to detection server: {e}")
+            return False
+
+        self.model_path = health['model']
+        self.device = health['device']
+        self.confidence = health['confidence']
+        self.iou = health['iou']
+        self.class_names = {int(k): v for k, v in health['class_names'].items()}
+        print(f"    [+] Server model: {self.model_path} ({health['backend']}, {self.device})")
+        print(f"    [+] Server thresholds: confidence {self.confidence}, IoU {self.iou}")
+        print(f"    [+] Classes: {len(self.class_names)}")
+        return True
+
+    def iter_detect_directory(self, directory_path: str, image_extensions: List[str] = None):
+        """
+        서버에 디렉토리 검출을 요청하고 결과를 도착하는 대로 반환
+
+        Yields:
+            이미지별 검출 결과 딕셔너리
+        """
+        print(f"\n[*] Submitting {directory_path} to detection server...")
+
+        payload = {'input_dir': os.path.abspath(directory_path)}
+        if image_extensions:
+            payload['image_extensions'] = image_extensions
+
+        url = urllib.parse.urlsplit(self.server_url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(url.hostname, url.port, timeout=self.timeout)
+        try:
+            # 연결까지만 timeout 적용, 이후 스트림 읽기는 read_timeout (이미지 한 장 처리 시간에 제한 없음)
+            connection.connect()
+            connection.sock.settimeout(self.read_timeout)
+            connection.request('POST', f"{url.path.rstrip('/')}/detect", body=json.dumps(payload).encode('utf-8'),
+                               headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+        except Exception as e:
+            print(f"[!] Error connecting to detection server: {e}")
+            connection.close()
+            return
+
+        if response.status != 200:
+            print(f"[!] Detection server error: {response.read().decode('utf-8', 'replace')}")
+            connection.close()
+            return
+
+        try:
+            last_time = time.perf_counter()
+            while True:
+                # 읽기 실패/잘못된 줄은 보고하고 지금까지 받은 결과로 종료
+                try:
+                    line = response.readline()
+                    if not line:
+                        print(f"[!] Detection stream ended early after {len(self.detections)} image(s)")
+                        break
+                    message = json.loads(line.decode('utf-8'))
+                    if message.get('done'):
+                        print(f"    [+] Server processed {message['total']} image(s)")
+                        break
+                    result = message['result']
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"[!] Detection stream interrupted after {len(self.detections)} image(s): {e!r}")
+                    break
+
+                self.detections.append(result)
+                self.stats.add_result(result)
+
+                now = time.perf_counter()
+                if self.run_metrics is not None:
+                    # 서버 측 decode/추론/후처리를 합친 시간 (요청 간 도착 간격)
+                    self.run_metrics.add_stage_time('remote_detection', now - last_time)
+                    self.run_metrics.record_image(now - last_time)
+                last_time = now
+
+                print(f"    [{len(self.detections)}] {result['image_name']} "
+                      f"✓ ({result['total_detections']} objects, {result['file_classification']})")
+                yield result
+        finally:
+            connection.close()
+
+    def detect_directory(self, directory_path: str, image_extensions: List[str] = None) -> List[Dict[str, Any]]:
+        """서버 검출 결과 전체 리스트"""
+        return list(self.iter_detect_directory(directory_path, image_extensions))
+
+    def get_detection_summary(self) -> Dict[str, Any]:
+        """검출 결과 요약 (클라이언트 측 스트리밍 집계)"""
+        return self.stats.get_summary()
+
+    def clear_detections(self):
+        """검출 결과 초기화"""
+        self.detections = []
+        self.stats.reset()
+
+
+def main():
+    """서버 실행"""
+    from detector import YOLODetector
+
+    parser = argparse.ArgumentParser(description='YOLO Detection Server')
+    parser.add_argument('--model', type=str, default='yolov8n.pt', help='YOLO model path')
+    parser.add_argument('--confidence', type=float, default=0.5, help='Confidence threshold')
+    parser.add_argument('--iou', type=float, default=0.45, help='NMS IOU threshold')
+    parser.add_argument('--backend', type=str, default='auto', help='Inference backend')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help='Bind address')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port')
+    args = parser.parse_args()
+
+    detector = YOLODetector(args.model, args.confidence, args.iou, backend=args.backend)
+    return serve(detector, args.host, args.port)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
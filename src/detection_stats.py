@@ -0,0 +1,285 @@
+"""
+Detection Stats - 검출 결과 스트리밍 집계 모듈
+이미지 한 장의 검출이 끝날 때마다 통계를 갱신하여 요약을 O(1)로 생성
+"""
+
+import os
+import json
+from typing import Dict, List, Any
+
+from file_classifier import ClassificationTree
+from quantile_sketch import KLLSketch
+
+# 요약에 포함할 신뢰도 분위수
+CONFIDENCE_QUANTILES = (0.01, 0.5, 0.99)
+
+
+class ConfidenceHistogram:
+    """[0, 1] 구간의 고정 bin 신뢰도 히스토그램 (원본 점수 리스트 대신 사용)"""
+
+    def __init__(self, bins: int = 30):
+        """
+        Args:
+            bins: bin 개수
+        """
+        self.bins = bins
+        self.counts = [0] * bins
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+        """신뢰도 점수 하나 추가"""
+        index = int(value * self.bins)
+        if index >= self.bins:
+            index = self.bins - 1
+        elif index < 0:
+            index = 0
+
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+
+    @property
+    def bin_edges(self) -> List[float]:
+        return [i / self.bins for i in range(self.bins + 1)]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        히스토그램 bin 내 선형 보간으로 분위수 추정
+
+        Args:
+            q: 분위 (0.0-1.0)
+
+        Returns:
+            추정 분위수 (데이터가 없으면 0.0)
+        """
+        if not self.count:
+            return 0.0
+
+        target = q * self.count
+        cumulative = 0
+        for index, bin_count in enumerate(self.counts):
+            if bin_count and cumulative + bin_count >= target:
+                fraction = (target - cumulative) / bin_count
+                value = (index + fraction) / self.bins
+                return min(max(value, self.min), self.max)
+            cumulative += bin_count
+
+        return self.max
+
+    def merge(self, other: 'ConfidenceHistogram') -> 'ConfidenceHistogram':
+        """
+        같은 bin 구성의 히스토그램 병합
+
+        Args:
+            other: 병합할 히스토그램
+
+        Returns:
+            self
+        """
+        if other.bins != self.bins:
+            raise ValueError(f"Histogram bins mismatch: {self.bins} != {other.bins}")
+
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConfidenceHistogram':
+        """to_dict() 결과로부터 복원"""
+        histogram = cls(len(data['counts']))
+        histogram.counts = list(data['counts'])
+        histogram.count = data['count']
+        histogram.total = data['sum']
+        histogram.min = data['min'] if data['count'] else None
+        histogram.max = data['max'] if data['count'] else None
+        return histogram
+
+    def to_dict(self) -> Dict[str, Any]:
+        """요약용 딕셔너리 변환"""
+        return {
+            'bin_edges': self.bin_edges,
+            'counts': list(self.counts),
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min if self.min is not None else 0.0,
+            'max': self.max if self.max is not None else 0.0,
+        }
+
+
+class DetectionStatsAggregator:
+    """검출 결과를 한 번의 순회로 집계하는 스트리밍 집계기"""
+
+    def __init__(self, confidence_bins: int = 30, sketch_k: int = 200):
+        """
+        Args:
+            confidence_bins: 신뢰도 히스토그램 bin 개수
+            sketch_k: 신뢰도 분위수 스케치 정확도 파라미터
+        """
+        self.confidence_bins = confidence_bins
+        self.sketch_k = sketch_k
+        self.reset()
+
+    def reset(self):
+        """집계 초기화"""
+        self.total_images = 0
+        self.total_objects = 0
+        self.images_with_objects = 0
+        self.class_distribution = {}
+        self.file_type_distribution = {}
+        self.file_classification_count = {}
+        self.file_classification_objects = {}
+        self.classification_tree = ClassificationTree()
+        self.confidence_histogram = ConfidenceHistogram(self.confidence_bins)
+        self.confidence_sketch = KLLSketch(self.sketch_k)
+
+    def add_result(self, result: Dict[str, Any]):
+        """
+        이미지 한 장의 검출 결과 반영
+
+        Args:
+            result: YOLODetector.detect_image() 결과 딕셔너리
+        """
+        total_detections = result['total_detections']
+
+        self.total_images += 1
+        self.total_objects += total_detections
+        if total_detections > 0:
+            self.images_with_objects += 1
+
+        for detection in result['detections']:
+            class_name = detection['class_name']
+            self.class_distribution[class_name] = self.class_distribution.get(class_name, 0) + 1
+            self.confidence_histogram.add(detection['confidence'])
+            self.confidence_sketch.add(detection['confidence'])
+
+        ext = os.path.splitext(result['image_name'])[1].lower()
+        if ext:
+            self.file_type_distribution[ext] = self.file_type_distribution.get(ext, 0) + 1
+
+        file_class = result.get('file_classification', 'Unknown')
+        self.file_classification_count[file_class] = self.file_classification_count.get(file_class, 0) + 1
+        self.file_classification_objects[file_class] = \
+            self.file_classification_objects.get(file_class, 0) + total_detections
+
+        hierarchy = result.get('file_hierarchy')
+        if hierarchy:
+            self.classification_tree.add(tuple(hierarchy), objects=total_detections)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 집계로 요약 생성 (검출 결과를 다시 순회하지 않음)
+
+        Returns:
+            YOLODetector.get_detection_summary() 형식의 요약 딕셔너리
+        """
+        histogram = self.confidence_histogram
+        p1, p50, p99 = self.confidence_sketch.quantiles(CONFIDENCE_QUANTILES)
+
+        return {
+            'total_images': self.total_images,
+            'total_objects': self.total_objects,
+            'avg_objects_per_image': self.total_objects / self.total_images if self.total_images else 0,
+            'class_distribution': dict(self.class_distribution),
+            'file_classification_stats': dict(self.file_classification_count),  # 파일명 분류별 통계
+            'file_classification_distribution': dict(self.file_classification_objects),  # 파일명 분류별 객체 수
+            'file_classification_levels': self.classification_tree.get_all_levels(),  # 계층 레벨별 파일/객체 수
+            'file_classification_hierarchy': self.classification_tree.to_dict(),  # 계층 분류 트리
+            'file_type_distribution': dict(self.file_type_distribution),
+            'confidence_stats': {
+                'min': histogram.min if histogram.count else 1.0,
+                'max': histogram.max if histogram.count else 0.0,
+                'avg': histogram.mean,
+                'p1': p1,
+                'p50': p50,
+                'p99': p99,
+            },
+            'confidence_histogram': histogram.to_dict(),
+            'confidence_sketch': self.confidence_sketch.to_dict(),
+            'detection_rate': (self.images_with_objects / self.total_images * 100) if self.total_images else 0.0,  # 객체가 검출된 이미지 비율
+        }
+
+    def merge(self, other: 'DetectionStatsAggregator') -> 'DetectionStatsAggregator':
+        """
+        다른 집계기(병렬 작업자 또는 이전 실행)의 집계를 병합
+
+        Args:
+            other: 병합할 집계기
+
+        Returns:
+            self
+        """
+        self.total_images += other.total_images
+        self.total_objects += other.total_objects
+        self.images_with_objects += other.images_with_objects
+
+        for target, source in ((self.class_distribution, other.class_distribution),
+                               (self.file_type_distribution, other.file_type_distribution),
+                               (self.file_classification_count, other.file_classification_count),
+                               (self.file_classification_objects, other.file_classification_objects)):
+            for key, count in source.items():
+                target[key] = target.get(key, 0) + count
+
+        self.classification_tree.merge(other.classification_tree)
+        self.confidence_histogram.merge(other.confidence_histogram)
+        self.confidence_sketch.merge(other.confidence_sketch)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """병합 가능한 상태 전체를 JSON 직렬화 가능한 딕셔너리로 변환"""
+        return {
+            'total_images': self.total_images,
+            'total_objects': self.total_objects,
+            'images_with_objects': self.images_with_objects,
+            'class_distribution': self.class_distribution,
+            'file_type_distribution': self.file_type_distribution,
+            'file_classification_count': self.file_classification_count,
+            'file_classification_objects': self.file_classification_objects,
+            'classification_tree': self.classification_tree.to_dict(),
+            'confidence_histogram': self.confidence_histogram.to_dict(),
+            'confidence_sketch': self.confidence_sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DetectionStatsAggregator':
+        """to_dict() 결과로부터 복원"""
+        histogram = ConfidenceHistogram.from_dict(data['confidence_histogram'])
+        sketch = KLLSketch.from_dict(data['confidence_sketch'])
+
+        aggregator = cls(confidence_bins=histogram.bins, sketch_k=sketch.k)
+        aggregator.total_images = data['total_images']
+        aggregator.total_objects = data['total_objects']
+        aggregator.images_with_objects = data['images_with_objects']
+        aggregator.class_distribution = dict(data['class_distribution'])
+        aggregator.file_type_distribution = dict(data['file_type_distribution'])
+        aggregator.file_classification_count = dict(data['file_classification_count'])
+        aggregator.file_classification_objects = dict(data['file_classification_objects'])
+        aggregator.classification_tree = ClassificationTree.from_dict(data['classification_tree'])
+        aggregator.confidence_histogram = histogram
+        aggregator.confidence_sketch = sketch
+        return aggregator
+
+    def save(self, output_path: str) -> str:
+        """집계 상태를 JSON으로 저장 (다음 실행에서 병합용)"""
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return output_path
+
+    @classmethod
+    def load(cls, input_path: str) -> 'DetectionStatsAggregator':
+        """save()로 저장된 집계 상태 로드"""
+        with open(input_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -4,63 +4,352 @@ Detector - YOLO4/YOLO8 모델을 사용한 객체 검출 모듈
 """
 
 import os
+import sys
+import time
 import cv2
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from datetime import datetime
+from contextlib import nullcontext
+import yolo_ops
 from file_classifier import FileClassifier
+from detection_stats import DetectionStatsAggregator
+
+
+class InferenceBackend:
+    """
+    추론 백엔드 기본 클래스
+
+    모든 백엔드는 preprocess → infer → postprocess 단계를 거쳐
+    원본 이미지 좌표의 (N, 6) 배열 [x1, y1, x2, y2, confidence, class_id]를 반환한다.
+    YOLODetector는 이 배열을 공통 결과 딕셔너리 형식으로 변환한다.
+    """
+
+    name = 'base'
+
+    def __init__(self, model_path: str, confidence: float = 0.5, iou: float = 0.45):
+        """
+        Args:
+            model_path: 모델 경로
+            confidence: 신뢰도 임계값 (0.0-1.0)
+            iou: NMS IOU 임계값 (0.0-1.0)
+        """
+        self.model_path = model_path
+        self.confidence = confidence
+        self.iou = iou
+        self.model = None
+        self.device = 'cpu'
+
+    def load(self) -> Dict[int, str]:
+        """모델 로드 후 클래스 이름 딕셔너리 반환"""
+        raise NotImplementedError
+
+    def preprocess(self, image: np.ndarray) -> Tuple[Any, Any]:
+        """BGR 이미지를 모델 입력으로 변환, (입력, 좌표 복원 정보) 반환"""
+        return image, None
+
+    def infer(self, model_input: Any) -> Any:
+        """모델 실행"""
+        raise NotImplementedError
+
+    def postprocess(self, outputs: Any, meta: Any) -> np.ndarray:
+        """모델 출력을 (N, 6) 배열로 변환"""
+        raise NotImplementedError
+
+    def preprocess_batch(self, images: List[np.ndarray]) -> Tuple[Any, List[Any]]:
+        """여러 이미지(타일)를 배치 입력으로 변환 (기본: 이미지별 preprocess)"""
+        inputs, metas = zip(*(self.preprocess(image) for image in images))
+        return list(inputs), list(metas)
+
+    def infer_batch(self, model_inputs: Any) -> List[Any]:
+        """배치 실행 (기본: 입력별 infer)"""
+        return [self.infer(model_input) for model_input in model_inputs]
+
+    def postprocess_batch(self, outputs: List[Any], metas: List[Any]) -> List[np.ndarray]:
+        """배치 출력을 이미지별 (N, 6) 배열 리스트로 변환"""
+        return [self.postprocess(output, meta) for output, meta in zip(outputs, metas)]
+
+
+class UltralyticsBackend(InferenceBackend):
+    """ultralytics YOLO (PyTorch) 백엔드 - 전처리/NMS는 ultralytics 내부에서 수행"""
+
+    name = 'ultralytics'
+
+    def load(self) -> Dict[int, str]:
+        from ultralytics import YOLO
+        import torch
+
+        # GPU 여부 확인
+        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self.model = YOLO(self.model_path)
+        return dict(self.model.names) if hasattr(self.model, 'names') else {}
+
+    def infer(self, model_input: np.ndarray) -> Any:
+        return self.model(model_input, conf=self.confidence, iou=self.iou, device=self.device, verbose=False)
+
+    def postprocess(self, outputs: Any, meta: Any) -> np.ndarray:
+        rows = [result.boxes.data.cpu().numpy() for result in outputs or [] if result.boxes is not None]
+        if not rows:
+            return np.zeros((0, 6), dtype=np.float32)
+        return np.concatenate(rows, axis=0)[:, :6]
+
+    def preprocess_batch(self, images: List[np.ndarray]) -> Tuple[List[np.ndarray], List[Any]]:
+        return list(images), [None] * len(images)
+
+    def infer_batch(self, model_inputs: List[np.ndarray]) -> List[Any]:
+        # ultralytics는 이미지 리스트를 한 번에 배치 추론
+        return [[result] for result in self.infer(model_inputs)]
+
+
+class ExportedModelBackend(InferenceBackend):
+    """
+    내보낸(export) YOLO 그래프용 공통 백엔드
+
+    전처리(letterbox)와 후처리(디코딩 + 클래스별 NMS)는 yolo_ops의 NumPy 구현을 사용하므로
+    ONNX Runtime / OpenVINO 백엔드는 모델 실행(infer)만 구현하면 되고 torch가 필요 없다.
+    """
+
+    default_input_size = 640
+    max_det = yolo_ops.MAX_DET
+    max_per_class = None  # 클래스별 최대 검출 수 (None이면 제한 없음)
+
+    def __init__(self, model_path: str, confidence: float = 0.5, iou: float = 0.45):
+        super().__init__(model_path, confidence, iou)
+        self.input_size = (self.default_input_size, self.default_input_size)  # (height, width)
+        self.class_names = {}
+        self.letterbox = None
+        self.max_batch = 1  # 모델 입력의 배치 크기 (None이면 동적 배치)
+
+    def preprocess(self, image: np.ndarray) -> Tuple[np.ndarray, Tuple[Any, Tuple[int, int]]]:
+        """letterbox 리사이즈 + 정규화 + HWC(BGR) → NCHW(RGB) (버퍼 재사용)"""
+        if self.letterbox is None or self.letterbox.input_size != self.input_size:
+            self.letterbox = yolo_ops.Letterbox(self.input_size)
+        blob, meta = self.letterbox(image)
+        return blob, (meta, image.shape[:2])
+
+    def postprocess(self, outputs: np.ndarray, meta: Tuple[Any, Tuple[int, int]]) -> np.ndarray:
+        """YOLO 출력 디코딩 → 신뢰도 필터 → 클래스별 NMS → 원본 좌표 복원"""
+        letterbox_meta, image_shape = meta
+        return yolo_ops.postprocess(np.asarray(outputs)[0], letterbox_meta, image_shape,
+                                    len(self.class_names), self.confidence, self.iou,
+                                    max_det=self.max_det, max_per_class=self.max_per_class)
+
+    def preprocess_batch(self, images: List[np.ndarray]) -> Tuple[np.ndarray, List[Any]]:
+        """배치 크기만큼의 입력 버퍼를 재사용하여 여러 타일을 한 텐서로 전처리"""
+        if (self.letterbox is None or self.letterbox.input_size != self.input_size
+                or self.letterbox.blob.shape[0] < len(images)):
+            self.letterbox = yolo_ops.Letterbox(self.input_size, batch_size=len(images))
+        metas = [(self.letterbox.fill(image, index), image.shape[:2]) for index, image in enumerate(images)]
+        return self.letterbox.blob[:len(images)], metas
+
+    def infer_batch(self, model_inputs: np.ndarray) -> List[np.ndarray]:
+        """동적 배치 모델이면 한 번에, 고정 배치 모델이면 max_batch 단위로 실행"""
+        step = self.max_batch or len(model_inputs)
+        outputs = []
+        for start in range(0, len(model_inputs), step):
+            batch_output = np.asarray(self.infer(model_inputs[start:start + step]))
+            outputs.extend(batch_output[i:i + 1] for i in range(len(batch_output)))
+        return outputs
+
+    def _set_input_size(self, shape: List[Any]):
+        """모델 입력 shape (N, 3, H, W)에서 입력 크기/배치 크기 설정 (동적 축이면 기본값 유지)"""
+        if len(shape) == 4 and isinstance(shape[2], int) and isinstance(shape[3], int):
+            self.input_size = (shape[2], shape[3])
+        if len(shape) == 4:
+            self.max_batch = shape[0] if isinstance(shape[0], int) else None
+
+    def _check_output_layout(self, shape: List[Any]):
+        """
+        클래스 이름(메타데이터)이 없으면 출력 shape (1, C, N)만으로 디코딩할 수 있는지 로드 시점에 확인
+
+        Raises:
+            ValueError: YOLOv5/전치된 YOLOv8 출력을 구분할 수 없는 경우 (yolo_ops.prediction_layout)
+        """
+        if not self.class_names and len(shape) == 3 and all(isinstance(dim, int) for dim in shape[1:]):
+            yolo_ops.prediction_layout(shape[1:], 0)
+
+    @staticmethod
+    def _parse_names(raw_names: Any) -> Dict[int, str]:
+        """ultralytics export 메타데이터의 names ("{0: 'person', ...}" 문자열 또는 dict) 파싱"""
+        import ast
+
+        if isinstance(raw_names, str):
+            raw_names = ast.literal_eval(raw_names)
+        if isinstance(raw_names, (list, tuple)):
+            raw_names = dict(enumerate(raw_names))
+        return {int(k): str(v) for k, v in (raw_names or {}).items()}
+
+
+class OnnxRuntimeBackend(ExportedModelBackend):
+    """ONNX Runtime 백엔드 (.onnx)"""
+
+    name = 'onnxruntime'
+
+    def load(self) -> Dict[int, str]:
+        import onnxruntime as ort
+
+        available = ort.get_available_providers()
+        providers = [p for p in ('CUDAExecutionProvider', 'CPUExecutionProvider') if p in available]
+        self.model = ort.InferenceSession(self.model_path, providers=providers)
+        self.device = 'cuda' if providers[0] == 'CUDAExecutionProvider' else 'cpu'
+
+        model_input = self.model.get_inputs()[0]
+        self.input_name = model_input.name
+        self._set_input_size(model_input.shape)
+
+        metadata = self.model.get_modelmeta().custom_metadata_map
+        self.class_names = self._parse_names(metadata.get('names'))
+        self._check_output_layout(self.model.get_outputs()[0].shape)
+        return self.class_names
+
+    def infer(self, model_input: np.ndarray) -> np.ndarray:
+        return self.model.run(None, {self.input_name: model_input})[0]
+
+
+class OpenVINOBackend(ExportedModelBackend):
+    """OpenVINO 백엔드 (.xml 또는 ultralytics의 *_openvino_model 디렉토리)"""
+
+    name = 'openvino'
+
+    def load(self) -> Dict[int, str]:
+        import openvino as ov
+
+        model_xml = self.model_path
+        if os.path.isdir(model_xml):
+            model_xml = str(next(Path(model_xml).glob('*.xml')))
+
+        core = ov.Core()
+        model = core.read_model(model_xml)
+        self._set_input_size([dim.get_length() if dim.is_static else None
+                              for dim in model.input(0).get_partial_shape()])
+        self.model = core.compile_model(model, 'CPU')
+        self.device = 'cpu'
+
+        # ultralytics export는 모델 옆에 metadata.yaml을 저장함
+        metadata_path = Path(model_xml).with_name('metadata.yaml')
+        if metadata_path.exists():
+            import yaml
+
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                self.class_names = self._parse_names(yaml.safe_load(f).get('names'))
+        self._check_output_layout([dim.get_length() if dim.is_static else None
+                                   for dim in model.output(0).get_partial_shape()])
+        return self.class_names
+
+    def infer(self, model_input: np.ndarray) -> np.ndarray:
+        return self.model([model_input])[self.model.output(0)]
+
+
+# 사용 가능한 추론 백엔드
+BACKENDS = {
+    'ultralytics': UltralyticsBackend,
+    'onnxruntime': OnnxRuntimeBackend,
+    'openvino': OpenVINOBackend,
+}
+
+
+def select_backend(model_path: str, backend: str = None) -> str:
+    """
+    모델 파일 확장자로 백엔드 선택
+
+    Args:
+        model_path: 모델 경로
+        backend: 명시적 백엔드 이름 (None 또는 'auto'면 확장자로 결정)
+
+    Returns:
+        백엔드 이름
+    """
+    if backend and backend != 'auto':
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (choose from {', '.join(BACKENDS)})")
+        return backend
+
+    ext = os.path.splitext(model_path)[1].lower()
+    if ext == '.onnx':
+        return 'onnxruntime'
+    if ext == '.xml' or (os.path.isdir(model_path) and any(Path(model_path).glob('*.xml'))):
+        return 'openvino'
+    return 'ultralytics'
+
+
+MAX_TILE_OVERLAP = 0.9  # 타일 겹침 비율 상한 (stride = tile_size * 0.1 이상)
 
 
 class YOLODetector:
     """YOLO 모델을 사용하여 객체를 검출하는 클래스"""
 
-    def __init__(self, model_path: str, confidence: float = 0.5, iou: float = 0.45):
+    def __init__(self, model_path: str, confidence: float = 0.5, iou: float = 0.45, backend: str = None,
+                 tile_size: int = None, tile_overlap: float = 0.2, tile_batch: int = 8):
         """
         Args:
-            model_path: YOLO 모델 경로 (예: 'yolov8n.pt')
+            model_path: YOLO 모델 경로 (예: 'yolov8n.pt', 'yolov8n.onnx', 'yolov8n_openvino_model')
             confidence: 신뢰도 임계값 (0.0-1.0)
             iou: NMS IOU 임계값 (0.0-1.0)
+            backend: 추론 백엔드 ('ultralytics', 'onnxruntime', 'openvino', None이면 확장자로 선택)
+            tile_size: 타일 추론 크기 (픽셀, None이면 이미지 전체를 한 번에 추론)
+            tile_overlap: 인접 타일 겹침 비율 (0.0-0.9)
+            tile_batch: 한 번에 모델에 넣을 타일 수 (메모리 사용량 상한)
+
+        Raises:
+            ValueError: 타일 설정이 범위를 벗어난 경우 (겹침 1.0 이상이면 stride가 1픽셀이 됨)
         """
+        if tile_size is not None and tile_size < 1:
+            raise ValueError(f"tile_size must be >= 1 (got {tile_size})")
+        if not 0.0 <= tile_overlap <= MAX_TILE_OVERLAP:
+            raise ValueError(f"tile_overlap must be between 0.0 and {MAX_TILE_OVERLAP} (got {tile_overlap})")
+        if tile_batch < 1:
+            raise ValueError(f"tile_batch must be >= 1 (got {tile_batch})")
+
         self.model_path = model_path
         self.confidence = confidence
         self.iou = iou
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        self.tile_batch = tile_batch
+        self.backend_name = backend
+        self.backend = None
         self.model = None
         self.device = None
         self.class_names = {}
         self.detections = []
         self.file_classifier = FileClassifier()  # 파일명 분류기 초기화
+        self.stats = DetectionStatsAggregator()  # 이미지별 스트리밍 집계기
+        self.run_metrics = None  # RunMetrics (설정 시 decode/preprocess/inference/postprocess 시간 기록)
 
     def load_model(self) -> bool:
-        """YOLO 모델 로드"""
+        """YOLO 모델 로드 (모델 확장자 또는 backend 인자로 추론 백엔드 선택)"""
         print(f"[*] Loading YOLO model from {self.model_path}...")
 
         try:
-            from ultralytics import YOLO
-            import torch
-
-            # GPU 여부 확인
-            self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
-            print(f"    [+] Using device: {self.device}")
+            backend_name = select_backend(self.model_path, self.backend_name)
+            self.backend = BACKENDS[backend_name](self.model_path, self.confidence, self.iou)
 
             # 모델 로드
-            self.model = YOLO(self.model_path)
+            self.class_names = self.backend.load()
+            self.model = self.backend.model
+            self.device = self.backend.device
+            print(f"    [+] Backend: {backend_name}")
+            print(f"    [+] Using device: {self.device}")
             print(f"    [+] Model loaded successfully: {self.model_path}")
 
-            # 클래스 이름 추출
-            if hasattr(self.model, 'names'):
-                self.class_names = self.model.names
+            # 클래스 이름
+            if self.class_names:
                 print(f"    [+] Classes: {len(self.class_names)}")
 
             return True
 
         except ImportError as e:
-            print(f"    [!] Error: ultralytics not installed: {e}")
+            print(f"    [!] Error: inference backend not installed: {e}")
             return False
         except Exception as e:
             print(f"    [!] Error loading model: {e}")
             return False
 
+    def _stage(self, name: str):
+        """run_metrics가 설정된 경우 단계 시간 측정 컨텍스트"""
+        return self.run_metrics.stage(name) if self.run_metrics is not None else nullcontext()
+
     def detect_image(self, image_path: str) -> Dict[str, Any]:
         """
         단일 이미지 객체 검출
@@ -71,7 +360,7 @@ class YOLODetector:
         Returns:
             검출 결과 딕셔너리
         """
-        if self.model is None:
+        if self.backend is None:
             print("[!] Model not loaded. Please load model first.")
             return {}
 
@@ -80,53 +369,151 @@ class YOLODetector:
             return {}
 
         try:
+            image_start = time.perf_counter()
+
             # 이미지 로드
-            image = cv2.imread(image_path)
+            with self._stage('decode'):
+                image = cv2.imread(image_path)
             if image is None:
                 print(f"[!] Failed to load image: {image_path}")
                 return {}
 
             height, width = image.shape[:2]
 
-            # 객체 검출
-            results = self.model(image_path, conf=self.confidence, iou=self.iou, device=self.device)
+            # 객체 검출 (모든 백엔드 공통: preprocess → infer → postprocess)
+            if self.tile_size and max(height, width) > self.tile_size:
+                boxes = self._detect_tiled(image)
+            else:
+                with self._stage('preprocess'):
+                    model_input, meta = self.backend.preprocess(image)
+                with self._stage('inference'):
+                    outputs = self.backend.infer(model_input)
+                with self._stage('postprocess'):
+                    boxes = self.backend.postprocess(outputs, meta)
 
             # 결과 처리
-            detections = []
-            if results and len(results) > 0:
-                for result in results:
-                    if result.boxes is not None:
-                        for box in result.boxes:
-                            detection = {
-                                'class_id': int(box.cls.item()),
-                                'class_name': self.class_names.get(int(box.cls.item()), 'Unknown'),
-                                'confidence': float(box.conf.item()),
-                                'bbox': {
-                                    'x1': float(box.xyxy[0][0].item()),
-                                    'y1': float(box.xyxy[0][1].item()),
-                                    'x2': float(box.xyxy[0][2].item()),
-                                    'y2': float(box.xyxy[0][3].item()),
-                                },
-                            }
-                            detections.append(detection)
+            with self._stage('postprocess'):
+                detections = self._to_detections(boxes)
+
+            # 파일명 분류 정보 (detect_directory에서 미리 분류되지 않았으면 여기서 분류)
+            image_name = os.path.basename(image_path)
+            hierarchy = self.file_classifier.hierarchies.get(image_name)
+            if hierarchy is None:
+                hierarchy = self.file_classifier.extract_hierarchy(image_name)
 
             result_dict = {
                 'image_path': image_path,
-                'image_name': os.path.basename(image_path),
+                'image_name': image_name,
                 'image_size': {'width': width, 'height': height},
                 'timestamp': datetime.now().isoformat(),
                 'detections': detections,
                 'total_detections': len(detections),
                 'unique_classes': len(set([d['class_id'] for d in detections])),
+                'file_classification': hierarchy[1],
+                'file_hierarchy': list(hierarchy),
             }
 
             self.detections.append(result_dict)
+            self.stats.add_result(result_dict)
+
+            if self.run_metrics is not None:
+                self.run_metrics.record_image(time.perf_counter() - image_start)
             return result_dict
 
         except Exception as e:
             print(f"[!] Error detecting objects in {image_path}: {e}")
             return {}
 
+    def _iter_tiles(self, height: int, width: int):
+        """
+        겹치는 타일 영역 생성 (마지막 타일은 이미지 경계에 맞춤)
+
+        Yields:
+            (x0, y0, x1, y1) 타일 좌표
+        """
+        tile = self.tile_size
+        stride = max(1, int(tile * (1 - self.tile_overlap)))
+
+        def starts(length):
+            if length <= tile:
+                return [0]
+            positions = list(range(0, length - tile, stride))
+            positions.append(length - tile)
+            return positions
+
+        for y0 in starts(height):
+            for x0 in starts(width):
+                yield x0, y0, min(x0 + tile, width), min(y0 + tile, height)
+
+    def _detect_tiled(self, image: np.ndarray) -> np.ndarray:
+        """
+        타일 단위 추론 후 전체 이미지 좌표로 병합 (타일 간 NMS)
+
+        타일은 원본 이미지의 view이며, 모델 입력은 tile_batch 개씩만 만들어지므로
+        메모리 사용량은 이미지 크기가 아니라 배치당 타일 수에 비례한다.
+
+        Args:
+            image: BGR 이미지
+
+        Returns:
+            (N, 6) [x1, y1, x2, y2, confidence, class_id] 배열 (원본 좌표)
+        """
+        height, width = image.shape[:2]
+        merged = []
+        tiles = list(self._iter_tiles(height, width))
+
+        for start in range(0, len(tiles), self.tile_batch):
+            windows = tiles[start:start + self.tile_batch]
+            crops = [image[y0:y1, x0:x1] for x0, y0, x1, y1 in windows]
+
+            with self._stage('preprocess'):
+                model_inputs, metas = self.backend.preprocess_batch(crops)
+            with self._stage('inference'):
+                outputs = self.backend.infer_batch(model_inputs)
+            with self._stage('postprocess'):
+                for (x0, y0, _, _), boxes in zip(windows, self.backend.postprocess_batch(outputs, metas)):
+                    if len(boxes):
+                        boxes = boxes.copy()
+                        boxes[:, [0, 2]] += x0
+                        boxes[:, [1, 3]] += y0
+                        merged.append(boxes)
+
+        if not merged:
+            return np.zeros((0, 6), dtype=np.float32)
+
+        # 타일 경계에서 중복된 박스 제거 (클래스별 NMS)
+        with self._stage('postprocess'):
+            boxes = np.concatenate(merged, axis=0)
+            keep = yolo_ops.non_max_suppression(boxes[:, :4], boxes[:, 4], boxes[:, 5].astype(np.int64),
+                                                self.iou, max_det=len(boxes))
+            return boxes[keep]
+
+    def _to_detections(self, boxes: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        (N, 6) 배열을 공통 검출 결과 딕셔너리 리스트로 변환
+
+        Args:
+            boxes: [x1, y1, x2, y2, confidence, class_id] 배열
+
+        Returns:
+            검출 결과 리스트
+        """
+        detections = []
+        for x1, y1, x2, y2, confidence, class_id in boxes.tolist():
+            class_id = int(class_id)
+            detections.append({
+                'class_id': class_id,
+                'class_name': self.class_names.get(class_id, 'Unknown'),
+                'confidence': float(confidence),
+                'bbox': {
+                    'x1': float(x1),
+                    'y1': float(y1),
+                    'x2': float(x2),
+                    'y2': float(y2),
+                },
+            })
+        return detections
+
     def detect_directory(self, directory_path: str, image_extensions: List[str] = None) -> List[Dict[str, Any]]:
         """
         디렉토리 내 모든 이미지 객체 검출
@@ -138,6 +525,19 @@ class YOLODetector:
         Returns:
             모든 검출 결과 리스트
         """
+        return list(self.iter_detect_directory(directory_path, image_extensions))
+
+    def iter_detect_directory(self, directory_path: str, image_extensions: List[str] = None):
+        """
+        디렉토리 내 이미지를 검출하면서 결과를 한 장씩 반환 (스트리밍용)
+
+        Args:
+            directory_path: 이미지가 있는 디렉토리 경로
+            image_extensions: 처리할 이미지 확장자 (기본값: jpg, jpeg, png, bmp, tiff)
+
+        Yields:
+            이미지별 검출 결과 딕셔너리 (실패한 이미지는 제외)
+        """
         if image_extensions is None:
             image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
 
@@ -145,7 +545,7 @@ class YOLODetector:
 
         if not os.path.isdir(directory_path):
             print(f"[!] Directory not found: {directory_path}")
-            return []
+            return
 
         image_files = []
         for ext in image_extensions:
@@ -157,7 +557,7 @@ class YOLODetector:
 
         if total_images == 0:
             print(f"[!] No image files found in {directory_path}")
-            return []
+            return
 
         print(f"    [+] Found {total_images} image(s)")
 
@@ -170,21 +570,15 @@ class YOLODetector:
         print(f"    [+] File classification completed")
         print(f"        - Classification types: {len(self.file_classifier.classification_groups)}")
 
-        all_results = []
         for idx, image_file in enumerate(sorted(image_files), 1):
             print(f"    [{idx}/{total_images}] Processing {image_file.name}...", end=' ')
             result = self.detect_image(str(image_file))
             if result:
-                # 파일 분류 정보 추가
-                file_classification = self.file_classifier.classifications.get(image_file.name, 'Unknown')
-                result['file_classification'] = file_classification
-                all_results.append(result)
-                print(f"✓ ({result['total_detections']} objects, {file_classification})")
+                print(f"✓ ({result['total_detections']} objects, {result['file_classification']})")
+                yield result
             else:
                 print("✗ Failed")
 
-        return all_results
-
     def draw_detections(self, image_path: str, detections: List[Dict], output_path: str = None) -> bool:
         """
         이미지에 검출 결과 그리기
@@ -234,78 +628,120 @@ class YOLODetector:
             return False
 
     def get_detection_summary(self) -> Dict[str, Any]:
-        """검출 결과 요약"""
-        summary = {
-            'total_images': len(self.detections),
-            'total_objects': sum(d['total_detections'] for d in self.detections),
-            'avg_objects_per_image': 0,
-            'class_distribution': {},
-            'file_classification_stats': {},  # 파일명 분류별 통계
-            'file_classification_distribution': {},  # 파일명 분류별 객체 수
-            'confidence_stats': {
-                'min': 1.0,
-                'max': 0.0,
-                'avg': 0.0,
-            },
-            'detection_rate': 0.0,  # 객체가 검출된 이미지 비율
-        }
-
-        if not self.detections:
-            return summary
-
-        # 평균 객체 수
-        summary['avg_objects_per_image'] = summary['total_objects'] / summary['total_images']
-
-        # 클래스 분포
-        for detection_result in self.detections:
-            for detection in detection_result['detections']:
-                class_name = detection['class_name']
-                summary['class_distribution'][class_name] = \
-                    summary['class_distribution'].get(class_name, 0) + 1
-
-        # 신뢰도 통계
-        all_confidences = []
-        for detection_result in self.detections:
-            for detection in detection_result['detections']:
-                all_confidences.append(detection['confidence'])
-
-        if all_confidences:
-            summary['confidence_stats']['min'] = min(all_confidences)
-            summary['confidence_stats']['max'] = max(all_confidences)
-            summary['confidence_stats']['avg'] = sum(all_confidences) / len(all_confidences)
-
-        # 검출률 (객체가 검출된 이미지 비율)
-        images_with_objects = sum(1 for d in self.detections if d['total_detections'] > 0)
-        summary['detection_rate'] = (images_with_objects / summary['total_images'] * 100) if summary['total_images'] > 0 else 0
-
-        # 파일명 분류별 통계
-        file_classification_count = {}
-        file_classification_objects = {}
-
-        for detection_result in self.detections:
-            file_class = detection_result.get('file_classification', 'Unknown')
-            file_classification_count[file_class] = file_classification_count.get(file_class, 0) + 1
-            file_classification_objects[file_class] = file_classification_objects.get(file_class, 0) + detection_result['total_detections']
-
-        summary['file_classification_stats'] = file_classification_count
-        summary['file_classification_distribution'] = file_classification_objects
-
-        return summary
+        """검출 결과 요약 (detect_image마다 갱신되는 스트리밍 집계에서 생성)"""
+        return self.stats.get_summary()
 
     def clear_detections(self):
-        """검출 결과 초기화"""
+        """검출 결과 초기화 (파일명 분류 결과 포함, 서버는 요청마다 호출)"""
         self.detections = []
+        self.stats.reset()
+        self.file_classifier.reset()
         print("[*] Detection results cleared")
 
 
+def _box_iou(box: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """박스 하나와 여러 박스의 IoU"""
+    x1 = np.maximum(box[0], boxes[:, 0])
+    y1 = np.maximum(box[1], boxes[:, 1])
+    x2 = np.minimum(box[2], boxes[:, 2])
+    y2 = np.minimum(box[3], boxes[:, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    union = area + areas - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+def test_backend_parity(model_paths: Dict[str, str], image_dir: str, confidence: float = 0.25,
+                        iou: float = 0.45, min_box_iou: float = 0.9, conf_tolerance: float = 0.05) -> bool:
+    """
+    백엔드 간 정확도 동등성 테스트
+
+    ultralytics 결과를 기준으로, 다른 백엔드의 각 검출이 같은 클래스·IoU ≥ min_box_iou·
+    신뢰도 차이 ≤ conf_tolerance 인 기준 검출과 일치하는지 확인한다.
+
+    Args:
+        model_paths: {backend_name: model_path} (ultralytics 포함)
+        image_dir: 테스트 이미지 디렉토리
+        confidence: 신뢰도 임계값
+        iou: NMS IOU 임계값
+        min_box_iou: 박스 일치 IoU 기준
+        conf_tolerance: 신뢰도 허용 오차
+
+    Returns:
+        모든 백엔드 통과 여부
+    """
+    image_files = sorted(p for p in Path(image_dir).iterdir()
+                         if p.suffix.lower() in ('.jpg', '.jpeg', '.png', '.bmp', '.tiff'))
+
+    outputs = {}
+    for backend_name, model_path in model_paths.items():
+        detector = YOLODetector(model_path, confidence, iou, backend=backend_name)
+        if not detector.load_model():
+            print(f"[!] Skipping {backend_name}: failed to load {model_path}")
+            continue
+        outputs[backend_name] = {}
+        for image_file in image_files:
+            image = cv2.imread(str(image_file))
+            model_input, meta = detector.backend.preprocess(image)
+            outputs[backend_name][image_file.name] = detector.backend.postprocess(detector.backend.infer(model_input), meta)
+
+    if 'ultralytics' not in outputs:
+        print("[!] ultralytics reference backend is required for parity test")
+        return False
+
+    print("\n" + "="*70)
+    print("BACKEND PARITY TEST")
+    print("="*70)
+
+    all_pass = True
+    reference = outputs['ultralytics']
+    for backend_name, backend_outputs in outputs.items():
+        if backend_name == 'ultralytics':
+            continue
+
+        matched = total = 0
+        for image_name, boxes in backend_outputs.items():
+            ref_boxes = reference[image_name]
+            total += max(len(boxes), len(ref_boxes))
+            for box in boxes:
+                same_class = ref_boxes[ref_boxes[:, 5] == box[5]]
+                if len(same_class) == 0:
+                    continue
+                ious = _box_iou(box, same_class)
+                best = int(ious.argmax())
+                if ious[best] >= min_box_iou and abs(same_class[best, 4] - box[4]) <= conf_tolerance:
+                    matched += 1
+
+        ratio = matched / total if total else 1.0
+        status = "[PASS]" if ratio >= 0.95 else "[FAIL]"
+        all_pass = all_pass and ratio >= 0.95
+        print(f"{backend_name:<15} matched {matched}/{total} ({ratio * 100:.1f}%) {status}")
+
+    print("="*70 + "\n")
+    return all_pass
+
+
 def main():
     """테스트 코드"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='YOLO Detector test')
+    parser.add_argument('--parity', nargs='+', metavar='BACKEND=MODEL',
+                        help='Backend parity test, e.g. ultralytics=yolov8n.pt onnxruntime=yolov8n.onnx')
+    parser.add_argument('--images', default='D:/project/data-tools/inputs', help='Test image directory')
+    args = parser.parse_args()
+
+    if args.parity:
+        model_paths = dict(item.split('=', 1) for item in args.parity)
+        return 0 if test_backend_parity(model_paths, args.images) else 1
+
     # YOLO8 nano 모델 사용
     detector = YOLODetector('yolov8n.pt', confidence=0.5)
 
     if detector.load_model():
         # 샘플 이미지 디렉토리 검출
-        results = detector.detect_directory('D:/project/data-tools/inputs')
+        results = detector.detect_directory(args.images)
 
         # 요약 출력
         summary = detector.get_detection_summary()
@@ -317,4 +753,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main() or 0)
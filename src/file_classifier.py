@@ -9,14 +9,149 @@ from typing import Dict, List, Tuple, Any
 from collections import defaultdict
 
 
+# 계층 분류 레벨 (상위 → 하위)
+HIERARCHY_LEVELS = ('line', 'product', 'lot')
+
+
+class ClassificationTree:
+    """
+    계층 분류 키의 접두사 트리 (prefix tree)
+
+    각 노드는 자신의 하위 전체에 대한 파일 수와 객체 수를 누적하므로
+    어느 레벨의 집계든 경로 조회만으로 O(1)에 얻을 수 있다.
+    """
+
+    def __init__(self, levels: Tuple[str, ...] = HIERARCHY_LEVELS):
+        """
+        Args:
+            levels: 레벨 이름 튜플 (상위 → 하위)
+        """
+        self.levels = tuple(levels)
+        self.root = self._new_node()
+        self.level_index = {level: {} for level in self.levels}  # {level: {key_path: node}}
+
+    @staticmethod
+    def _new_node() -> Dict[str, Any]:
+        return {'files': 0, 'objects': 0, 'children': {}}
+
+    def add(self, path: Tuple[str, ...], files: int = 1, objects: int = 0):
+        """
+        경로 상의 모든 노드에 파일/객체 수 누적
+
+        Args:
+            path: 계층 키 튜플 (예: ('A', 'A_H', 'A_H8'))
+            files: 추가할 파일 수
+            objects: 추가할 객체 수
+        """
+        node = self.root
+        node['files'] += files
+        node['objects'] += objects
+
+        for depth, key in enumerate(path[:len(self.levels)]):
+            child = node['children'].get(key)
+            if child is None:
+                child = self._new_node()
+                node['children'][key] = child
+                self.level_index[self.levels[depth]][tuple(path[:depth + 1])] = child
+            child['files'] += files
+            child['objects'] += objects
+            node = child
+
+    def get(self, path: Tuple[str, ...]) -> Dict[str, int]:
+        """
+        접두사 경로의 집계 조회
+
+        Args:
+            path: 계층 키 튜플 (빈 튜플이면 전체)
+
+        Returns:
+            {'files': int, 'objects': int}
+        """
+        if not path:
+            node = self.root
+        else:
+            node = self.level_index[self.levels[len(path) - 1]].get(tuple(path))
+        if node is None:
+            return {'files': 0, 'objects': 0}
+        return {'files': node['files'], 'objects': node['objects']}
+
+    def get_level_breakdown(self, level: str) -> Dict[str, Dict[str, int]]:
+        """
+        특정 레벨의 키별 집계
+
+        Args:
+            level: 레벨 이름 (예: 'product')
+
+        Returns:
+            {'A > A_H': {'files': int, 'objects': int}} 딕셔너리
+        """
+        return {
+            ' > '.join(path): {'files': node['files'], 'objects': node['objects']}
+            for path, node in sorted(self.level_index[level].items())
+        }
+
+    def get_all_levels(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """모든 레벨의 키별 집계"""
+        return {level: self.get_level_breakdown(level) for level in self.levels}
+
+    def merge(self, other: 'ClassificationTree') -> 'ClassificationTree':
+        """
+        다른 트리의 집계를 현재 트리에 병합
+
+        Args:
+            other: 병합할 트리 (같은 레벨 구성)
+
+        Returns:
+            self
+        """
+        def merge_node(node, other_node, path):
+            node['files'] += other_node['files']
+            node['objects'] += other_node['objects']
+            for key, other_child in other_node['children'].items():
+                child_path = path + (key,)
+                child = node['children'].get(key)
+                if child is None:
+                    child = self._new_node()
+                    node['children'][key] = child
+                    self.level_index[self.levels[len(child_path) - 1]][child_path] = child
+                merge_node(child, other_child, child_path)
+
+        merge_node(self.root, other.root, ())
+        return self
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], levels: Tuple[str, ...] = HIERARCHY_LEVELS) -> 'ClassificationTree':
+        """to_dict() 결과로부터 복원"""
+        tree = cls(levels)
+        source = cls(levels)
+        source.root = data
+        return tree.merge(source)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 중첩 딕셔너리로 변환"""
+        def convert(node):
+            return {
+                'files': node['files'],
+                'objects': node['objects'],
+                'children': {key: convert(child) for key, child in sorted(node['children'].items())},
+            }
+
+        return convert(self.root)
+
+
 class FileClassifier:
     """파일명 패턴을 기반으로 파일을 분류하는 클래스"""
 
     def __init__(self):
         """초기화"""
+        self.reset()
+
+    def reset(self):
+        """분류 결과 초기화 (같은 분류기로 여러 디렉토리를 처리할 때 이전 결과가 누적되지 않도록)"""
         self.classifications = {}  # {original_filename: classified_type}
         self.classification_groups = {}  # {classification_type: [files]}
         self.classification_stats = {}  # {classification_type: count}
+        self.hierarchies = {}  # {original_filename: (line, product, lot)}
 
     def extract_classification(self, filename: str) -> str:
         """
@@ -40,6 +175,24 @@ class FileClassifier:
         Returns:
             분류 타입 (문자열)
         """
+        return self.extract_hierarchy(filename)[1]
+
+    def extract_hierarchy(self, filename: str) -> Tuple[str, str, str]:
+        """
+        파일명을 한 번만 파싱하여 계층 분류 키 (line → product → lot) 추출
+
+        - line: '_' 이전 부분 ('_'가 없으면 product와 동일)
+        - product: extract_classification()과 동일한 분류 타입
+        - lot: '(' 이전의 전체 이름
+        - 예: A_H8(1)8888 → ('A', 'A_H', 'A_H8')
+        - 예: AB7(1) → ('AB', 'AB', 'AB7')
+
+        Args:
+            filename: 파일명 (확장자 포함)
+
+        Returns:
+            HIERARCHY_LEVELS 순서의 분류 키 튜플
+        """
         # 확장자 제거
         name_without_ext = os.path.splitext(filename)[0]
 
@@ -63,6 +216,8 @@ class FileClassifier:
                 # '_' 이후에 알파벳이 없으면 '_' 앞까지만
                 classification = before_underscore
 
+            line = before_underscore
+
         else:
             # '_'가 없는 경우
             # 알파벳만 추출
@@ -75,7 +230,9 @@ class FileClassifier:
                 # 알파벳이 없으면 전체 (숫자만)
                 classification = before_paren
 
-        return classification
+            line = classification
+
+        return (line, classification, before_paren)
 
     def classify_files(self, filenames: List[str]) -> Dict[str, str]:
         """
@@ -88,8 +245,9 @@ class FileClassifier:
             {filename: classification_type} 딕셔너리
         """
         for filename in filenames:
-            classification = self.extract_classification(filename)
-            self.classifications[filename] = classification
+            hierarchy = self.extract_hierarchy(filename)
+            self.hierarchies[filename] = hierarchy
+            self.classifications[filename] = hierarchy[1]
 
         return self.classifications
 
@@ -127,6 +285,20 @@ class FileClassifier:
 
         return self.classification_stats
 
+    def get_classification_tree(self) -> ClassificationTree:
+        """
+        분류된 파일로 계층 분류 트리 생성 (파일 수만 집계)
+
+        Returns:
+            ClassificationTree 객체
+        """
+        tree = ClassificationTree()
+
+        for hierarchy in self.hierarchies.values():
+            tree.add(hierarchy)
+
+        return tree
+
     def print_classification_report(self):
         """분류 결과 리포트 출력"""
         if not self.classifications:
@@ -197,6 +369,8 @@ class FileClassifier:
             },
             'groups': self.classification_groups,
             'statistics': self.classification_stats,
+            'hierarchy_levels': list(HIERARCHY_LEVELS),
+            'hierarchy': self.get_classification_tree().to_dict(),
         }
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -242,6 +416,25 @@ def test_classification():
         else:
             print(f"{filename:<35} {result:<20} {status:<10}")
 
+    print("-" * 70)
+
+    hierarchy_cases = [
+        ('A_H8(1)8888.jpg', ('A', 'A_H', 'A_H8')),
+        ('AB7(1).jpg', ('AB', 'AB', 'AB7')),
+        ('2211(1)8888.jpg', ('2211', '2211', '2211')),
+        ('AB_123(1).jpg', ('AB', 'AB', 'AB_123')),
+    ]
+
+    for filename, expected in hierarchy_cases:
+        result = classifier.extract_hierarchy(filename)
+        status = "[PASS]" if result == expected else "[FAIL]"
+
+        if result != expected:
+            all_pass = False
+            print(f"{filename:<35} {' > '.join(result):<20} {status:<10} (expected: {' > '.join(expected)})")
+        else:
+            print(f"{filename:<35} {' > '.join(result):<20} {status:<10}")
+
     print("-" * 70)
     if all_pass:
         print("[+] All tests passed!")
@@ -271,7 +464,12 @@ def main():
     classifier = FileClassifier()
     classifier.classify_files(sample_files)
     classifier.print_classification_report()
-    classifier.export_classification()
+
+    # 내보내기 확인은 임시 폴더에 (기본 경로 D:/...는 Windows 외에서 상대 경로 폴더가 됨)
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        classifier.export_classification(os.path.join(output_dir, 'file_classification.json'))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+"""
+Folder Watcher - 입력 폴더에 새로 들어온 이미지 감지
+watchdog(inotify/FSEvents/ReadDirectoryChangesW)이 설치되어 있으면 파일 시스템 이벤트를,
+없으면 주기적인 디렉토리 스캔(폴링)을 사용
+"""
+
+import os
+import time
+import queue
+import threading
+from typing import List, Optional
+
+DEFAULT_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+
+
+class FolderWatcher:
+    """
+    감시 폴더의 새 이미지 파일 감지기
+
+    쓰기 중인 파일을 읽지 않도록 크기/수정 시각이 settle_time 동안 변하지 않은
+    파일만 준비된 파일로 반환한다. 한 번 반환한 파일은 다시 반환하지 않는다.
+    """
+
+    def __init__(self, directory: str, image_extensions: List[str] = None,
+                 poll_interval: float = 2.0, settle_time: float = 1.0, use_watchdog: bool = True):
+        """
+        Args:
+            directory: 감시할 디렉토리
+            image_extensions: 처리할 이미지 확장자 (기본값: jpg, jpeg, png, bmp, tiff)
+            poll_interval: 폴링 주기 (초, watchdog 미사용 시)
+            settle_time: 파일 쓰기 완료로 판단할 무변경 시간 (초)
+            use_watchdog: watchdog 사용 여부 (False면 항상 폴링)
+        """
+        self.directory = directory
+        self.image_extensions = tuple(ext.lower() for ext in (image_extensions or DEFAULT_IMAGE_EXTENSIONS))
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.use_watchdog = use_watchdog
+
+        self.mode = None
+        self.seen = set()  # 이미 반환한 파일 경로
+        self.pending = {}  # {path: (size, mtime, last_change_time)}
+        self._events = queue.Queue()  # watchdog 이벤트로 들어온 경로
+        self._observer = None
+        self._last_scan = 0.0
+
+    def _is_image(self, path: str) -> bool:
+        return path.lower().endswith(self.image_extensions)
+
+    def _scan(self) -> List[str]:
+        """디렉토리에서 아직 반환하지 않은 이미지 경로 목록"""
+        paths = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and self._is_image(entry.name) and entry.path not in self.seen:
+                        paths.append(entry.path)
+        except FileNotFoundError:
+            pass
+        return paths
+
+    def start(self, include_existing: bool = True):
+        """
+        감시 시작
+
+        Args:
+            include_existing: 시작 시점에 이미 있는 파일도 처리 대상에 포함할지 여부
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        existing = self._scan()
+        if include_existing:
+            for path in existing:
+                self._events.put(path)
+        else:
+            self.seen.update(existing)
+
+        if self.use_watchdog:
+            try:
+                from watchdog.observers import Observer
+                from watchdog.events import FileSystemEventHandler
+
+                watcher = self
+
+                class _Handler(FileSystemEventHandler):
+                    def on_created(self, event):
+                        if not event.is_directory:
+                            watcher._events.put(event.src_path)
+
+                    def on_modified(self, event):
+                        if not event.is_directory:
+                            watcher._events.put(event.src_path)
+
+                    def on_moved(self, event):
+                        if not event.is_directory:
+                            watcher._events.put(event.dest_path)
+
+                self._observer = Observer()
+                self._observer.schedule(_Handler(), self.directory, recursive=False)
+                self._observer.daemon = True
+                self._observer.start()
+                self.mode = 'watchdog'
+            except ImportError:
+                print("[*] watchdog not installed, falling back to polling (pip install watchdog)")
+                self._observer = None
+
+        if self._observer is None:
+            self.mode = 'polling'
+
+        print(f"[+] Watching {self.directory} ({self.mode})")
+
+    def stop(self):
+        """감시 중지"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _collect_events(self, timeout: float):
+        """이벤트 큐(또는 폴링 스캔)에서 후보 경로를 pending에 추가"""
+        candidates = []
+        try:
+            candidates.append(self._events.get(timeout=timeout))
+            while True:
+                candidates.append(self._events.get_nowait())
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+        # 폴링 모드이거나, 이벤트가 누락된 경우(네트워크 드라이브 등)를 대비해 주기적으로 재스캔
+        rescan_interval = self.poll_interval if self.mode == 'polling' else max(self.poll_interval, 30.0)
+        if now - self._last_scan >= rescan_interval:
+            candidates.extend(self._scan())
+            self._last_scan = now
+
+        for path in candidates:
+            if path not in self.seen and path not in self.pending and self._is_image(path):
+                self.pending[path] = (None, None, now)
+
+    def get_ready_files(self, timeout: float = None) -> List[str]:
+        """
+        쓰기가 끝난 새 이미지 파일 목록 (최대 timeout초 대기)
+
+        Args:
+            timeout: 새 이벤트 대기 시간 (초, 기본값: poll_interval)
+
+        Returns:
+            준비된 파일 경로 리스트 (이름 순)
+        """
+        wait = self.poll_interval if timeout is None else timeout
+        if self.pending:
+            # 대기 중인 파일이 있으면 settle 확인을 위해 짧게 대기
+            wait = min(wait, self.settle_time / 2)
+        self._collect_events(wait)
+
+        now = time.monotonic()
+        ready = []
+        for path, (size, mtime, changed_at) in list(self.pending.items()):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # 처리 전에 삭제/이동된 파일
+                del self.pending[path]
+                continue
+
+            if (stat.st_size, stat.st_mtime) != (size, mtime):
+                self.pending[path] = (stat.st_size, stat.st_mtime, now)
+            elif stat.st_size > 0 and now - changed_at >= self.settle_time:
+                del self.pending[path]
+                self.seen.add(path)
+                ready.append(path)
+
+        return sorted(ready)
+
+    def forget_missing(self) -> int:
+        """
+        삭제/이동된 파일을 반환 기록(seen)에서 제거 (장시간 감시 시 기록이 계속 커지지 않도록)
+
+        Returns:
+            제거한 경로 수
+        """
+        missing = [path for path in self.seen if not os.path.exists(path)]
+        self.seen.difference_update(missing)
+        return len(missing)
+
+    def iter_ready_files(self, stop_event: Optional[threading.Event] = None):
+        """
+        준비된 파일을 계속 반환 (stop_event가 설정될 때까지)
+
+        Yields:
+            준비된 파일 경로 리스트 (새 파일이 없으면 빈 리스트, 스냅샷 주기 확인용)
+        """
+        while stop_event is None or not stop_event.is_set():
+            yield self.get_ready_files()
+
+
+def main():
+    """테스트 코드"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        watcher = FolderWatcher(directory, poll_interval=0.2, settle_time=0.3, use_watchdog=False)
+        open(os.path.join(directory, 'existing.jpg'), 'wb').write(b'x')
+        watcher.start()
+
+        found = []
+        deadline = time.monotonic() + 3
+        written = False
+        while time.monotonic() < deadline and len(found) < 2:
+            if not written:
+                open(os.path.join(directory, 'new.png'), 'wb').write(b'y')
+                open(os.path.join(directory, 'notes.txt'), 'wb').write(b'z')
+                written = True
+            found.extend(os.path.basename(path) for path in watcher.get_ready_files())
+        watcher.stop()
+
+        print(f"Mode: {watcher.mode}")
+        print(f"Ready files: {found}")
+
+
+if __name__ == "__main__":
+    main()
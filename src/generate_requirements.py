@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from packaging import version as pkg_version
 
+from manifest_parser import canonical_name
+
 
 class RequirementsGenerator:
     """requirements.txt를 생성하는 클래스"""
@@ -66,10 +68,13 @@ class RequirementsGenerator:
             project_name = project.get('name', 'Unknown')
             dependencies = project.get('dependencies', [])
 
+            # 표기가 달라도(PyYAML / pyyaml) 같은 패키지로 통합
             for dep in dependencies:
+                dep = canonical_name(dep)
                 if dep not in merged:
                     merged[dep] = []
-                merged[dep].append(project_name)
+                if project_name not in merged[dep]:
+                    merged[dep].append(project_name)
 
         self.merged_dependencies = merged
         print(f"    [+] Merged {len(merged)} unique dependencies")
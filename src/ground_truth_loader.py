@@ -6,7 +6,7 @@ JSON 형식의 주석 파일을 읽어 검출 결과와 비교
 import os
 import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 
 class GroundTruthLoader:
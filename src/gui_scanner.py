@@ -8,6 +8,8 @@ import PySimpleGUI as sg
 import json
 import os
 import sys
+import threading
+import multiprocessing
 from pathlib import Path
 
 if getattr(sys, 'frozen', False):
@@ -41,70 +43,100 @@ def save_config(config):
     with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
         json.dump(config, f, ensure_ascii=False)
 
-config = load_config()
-
-layout = [
-    [sg.Text('Project Scanner GUI', font=('Arial', 14, 'bold'))],
-    [sg.Frame('Scan Settings', [
-        [sg.Text('Folder:', size=(12, 1)), 
-         sg.InputText(config['last_root'], key='-PATH-', size=(45, 1)),
-         sg.FolderBrowse()],
-    ])],
-    [sg.Frame('Execution', [
-        [sg.Button('Scan', size=(12, 2)), sg.Button('Clear', size=(12, 2)), sg.Button('Exit', size=(12, 2))],
-        [sg.Multiline(size=(70, 20), disabled=True, key='-OUTPUT-')],
-    ])],
-    [sg.Frame('Results', [
-        [sg.Text('Projects: '), sg.Text('0', key='-PROJ-', size=(5, 1))],
-        [sg.Text('Dependencies: '), sg.Text('0', key='-DEPS-', size=(5, 1))],
-    ])]
-]
-
-window = sg.Window('Project Scanner', layout, size=(700, 600))
-
-while True:
-    event, values = window.read()
+def run_scan(window, path):
+    # 스캔은 작업 스레드에서 실행하고 진행 상황/결과는 이벤트로 GUI 스레드에 전달
+    try:
+        scanner = ProjectScanner(path, progress=lambda event: window.write_event_value('-PROGRESS-', event))
+        scanner.scan()
+        window.write_event_value('-SCAN-DONE-', (path, scanner))
+    except Exception as e:
+        window.write_event_value('-SCAN-ERROR-', str(e))
+
+def main():
+    config = load_config()
+
+    layout = [
+        [sg.Text('Project Scanner GUI', font=('Arial', 14, 'bold'))],
+        [sg.Frame('Scan Settings', [
+            [sg.Text('Folder:', size=(12, 1)), 
+             sg.InputText(config['last_root'], key='-PATH-', size=(45, 1)),
+             sg.FolderBrowse()],
+        ])],
+        [sg.Frame('Execution', [
+            [sg.Button('Scan', size=(12, 2)), sg.Button('Clear', size=(12, 2)), sg.Button('Exit', size=(12, 2))],
+            [sg.Multiline(size=(70, 20), disabled=True, key='-OUTPUT-')],
+        ])],
+        [sg.Frame('Results', [
+            [sg.Text('Projects: '), sg.Text('0', key='-PROJ-', size=(5, 1))],
+            [sg.Text('Dependencies: '), sg.Text('0', key='-DEPS-', size=(5, 1))],
+            [sg.Text('Progress: '), sg.Text('', key='-STATUS-', size=(50, 1))],
+        ])]
+    ]
+
+    window = sg.Window('Project Scanner', layout, size=(700, 600))
+
+    while True:
+        event, values = window.read()
     
-    if event == sg.WINDOW_CLOSED or event == 'Exit':
-        break
+        if event == sg.WINDOW_CLOSED or event == 'Exit':
+            break
     
-    if event == 'Scan':
-        path = values['-PATH-']
-        if not os.path.isdir(path):
-            sg.popup_error('Invalid path')
-            continue
-        
-        window['-OUTPUT-'].update('')
-        window['-OUTPUT-'].print('[*] Scanning...')
-        
-        try:
-            scanner = ProjectScanner(path)
-            scanner.scan()
-            
+        if event == 'Scan':
+            path = values['-PATH-']
+            if not os.path.isdir(path):
+                sg.popup_error('Invalid path')
+                continue
+
+            window['-OUTPUT-'].update('')
+            window['-OUTPUT-'].print('[*] Scanning...')
+            window['-PROJ-'].update('0')
+            window['-DEPS-'].update('0')
+            window['Scan'].update(disabled=True)
+            threading.Thread(target=run_scan, args=(window, path), daemon=True).start()
+
+        if event == '-PROGRESS-':
+            progress = values['-PROGRESS-']
+            if progress['project']:
+                window['-OUTPUT-'].print(f"Found: {progress['project']['name']}")
+            window['-PROJ-'].update(str(progress['parsed']))
+            window['-STATUS-'].update(f"{progress['dirs']} dirs, "
+                                      f"{progress['parsed']}/{progress['candidates']} projects parsed")
+
+        if event == '-SCAN-DONE-':
+            path, scanner = values['-SCAN-DONE-']
             window['-PROJ-'].update(str(len(scanner.projects)))
             window['-DEPS-'].update(str(len(scanner.get_all_dependencies())))
-            
-            for proj in scanner.projects:
-                window['-OUTPUT-'].print(f"Found: {proj['name']}")
-            
-            report_path = OUTPUT_DIR / "scan_report.json"
-            report = {
-                'root': path,
-                'projects': len(scanner.projects),
-                'dependencies': len(scanner.get_all_dependencies()),
-            }
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False)
-            
-            window['-OUTPUT-'].print('[+] Done!')
-            config['last_root'] = path
-            save_config(config)
-        except Exception as e:
-            window['-OUTPUT-'].print(f'[!] Error: {e}')
-    
-    if event == 'Clear':
-        window['-OUTPUT-'].update('')
-        window['-PROJ-'].update('0')
-        window['-DEPS-'].update('0')
 
-window.close()
+            try:
+                report_path = OUTPUT_DIR / "scan_report.json"
+                report = {
+                    'root': path,
+                    'projects': len(scanner.projects),
+                    'dependencies': len(scanner.get_all_dependencies()),
+                }
+                with open(report_path, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, ensure_ascii=False)
+
+                window['-OUTPUT-'].print('[+] Done!')
+                config['last_root'] = path
+                save_config(config)
+            except Exception as e:
+                window['-OUTPUT-'].print(f'[!] Error: {e}')
+            window['Scan'].update(disabled=False)
+
+        if event == '-SCAN-ERROR-':
+            window['-OUTPUT-'].print(f"[!] Error: {values['-SCAN-ERROR-']}")
+            window['Scan'].update(disabled=False)
+
+        if event == 'Clear':
+            window['-OUTPUT-'].update('')
+            window['-PROJ-'].update('0')
+            window['-DEPS-'].update('0')
+            window['-STATUS-'].update('')
+
+    window.close()
+
+if __name__ == "__main__":
+    # 스캔 중 import 파싱 프로세스 풀이 이 스크립트를 다시 실행하지 않도록 (Windows spawn, PyInstaller exe)
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,200 @@
+"""
+Import Scanner - 매니페스트가 없는 프로젝트의 의존성을 import 문으로 추정
+.py 파일을 ast로 파싱해 최상위 import 이름을 모으고, 표준 라이브러리와
+프로젝트 내부 모듈을 제외한 뒤 배포(pip) 패키지 이름으로 변환
+"""
+
+import os
+import sys
+import ast
+from typing import Dict, List, Any, Iterable
+
+# import 이름과 배포 이름이 다른 패키지 (그 외는 설치된 패키지 메타데이터, 없으면 import 이름 사용)
+IMPORT_TO_DISTRIBUTION = {
+    'cv2': 'opencv-python',
+    'PIL': 'pillow',
+    'sklearn': 'scikit-learn',
+    'skimage': 'scikit-image',
+    'yaml': 'pyyaml',
+    'bs4': 'beautifulsoup4',
+    'dateutil': 'python-dateutil',
+    'dotenv': 'python-dotenv',
+    'docx': 'python-docx',
+    'pptx': 'python-pptx',
+    'fitz': 'pymupdf',
+    'serial': 'pyserial',
+    'usb': 'pyusb',
+    'zmq': 'pyzmq',
+    'jwt': 'pyjwt',
+    'Crypto': 'pycryptodome',
+    'OpenSSL': 'pyopenssl',
+    'attr': 'attrs',
+    'magic': 'python-magic',
+    'gi': 'pygobject',
+    'mpl_toolkits': 'matplotlib',
+    'pkg_resources': 'setuptools',
+    'win32api': 'pywin32',
+    'win32con': 'pywin32',
+    'win32gui': 'pywin32',
+    'win32com': 'pywin32',
+    'pythoncom': 'pywin32',
+    'pywintypes': 'pywin32',
+    'Levenshtein': 'python-levenshtein',
+    'telegram': 'python-telegram-bot',
+}
+
+_stdlib_modules = None
+_installed_distributions = None
+
+
+def extract_imports(filepath: str) -> List[str]:
+    """
+    .py 파일의 절대 import 최상위 모듈 이름 (함수/try 블록 안의 import 포함)
+
+    Args:
+        filepath: 파이썬 파일 경로
+
+    Returns:
+        정렬된 모듈 이름 리스트 (읽기/문법 오류 시 빈 리스트)
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            tree = ast.parse(f.read(), filename=filepath)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            # 상대 import(from . import x)는 프로젝트 내부 모듈
+            if node.level == 0 and node.module:
+                modules.add(node.module.split('.')[0])
+        elif isinstance(node, ast.Call) and node.args and isinstance(node.args[0], ast.Constant):
+            # importlib.import_module('x') / __import__('x')
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+            if name in ('import_module', '__import__') and isinstance(node.args[0].value, str):
+                if not node.args[0].value.startswith('.'):
+                    modules.add(node.args[0].value.split('.')[0])
+    return sorted(modules)
+
+
+def stdlib_modules() -> set:
+    """표준 라이브러리 최상위 모듈 이름 (3.10+ sys.stdlib_module_names)"""
+    global _stdlib_modules
+    if _stdlib_modules is None:
+        names = getattr(sys, 'stdlib_module_names', None)
+        if names is None:
+            # 3.9 이하: 표준 라이브러리 디렉토리의 모듈/패키지 이름
+            import sysconfig
+            stdlib_dir = sysconfig.get_paths()['stdlib']
+            names = set(sys.builtin_module_names)
+            for name in os.listdir(stdlib_dir):
+                if name.endswith('.py'):
+                    names.add(name[:-3])
+                elif os.path.isdir(os.path.join(stdlib_dir, name)) and name != 'site-packages':
+                    names.add(name)
+        _stdlib_modules = set(names) | {'__future__'}
+    return _stdlib_modules
+
+
+def _installed_distribution(module: str) -> str or None:
+    """설치된 패키지 메타데이터로 import 이름 → 배포 이름 (3.10+)"""
+    global _installed_distributions
+    if _installed_distributions is None:
+        try:
+            from importlib.metadata import packages_distributions
+            _installed_distributions = packages_distributions()
+        except Exception:
+            _installed_distributions = {}
+    distributions = _installed_distributions.get(module)
+    return distributions[0] if distributions else None
+
+
+def resolve_distributions(modules: Iterable[str], project_dir: str,
+                          python_files: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    import 이름을 배포 이름으로 변환 (표준 라이브러리, 프로젝트 내부 모듈 제외)
+
+    Args:
+        modules: 최상위 모듈 이름
+        project_dir: 프로젝트 디렉토리 (하위 패키지 판별용)
+        python_files: 프로젝트 디렉토리의 .py 파일 이름
+
+    Returns:
+        {배포 이름: [import 이름, ...]} (처음 나온 순서)
+    """
+    stdlib = stdlib_modules()
+    local = {os.path.splitext(name)[0] for name in python_files}
+
+    distributions = {}
+    for module in modules:
+        if not module or module in stdlib or module in local or module.startswith('_'):
+            continue
+        if os.path.isdir(os.path.join(project_dir, module)):
+            continue  # 프로젝트 하위 패키지
+        distribution = (IMPORT_TO_DISTRIBUTION.get(module)
+                        or _installed_distribution(module)
+                        or module)
+        distributions.setdefault(distribution, [])
+        if module not in distributions[distribution]:
+            distributions[distribution].append(module)
+    return distributions
+
+
+def infer_requirements(project_dir: str, python_files: List[str],
+                       imports: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    파일별 import 결과로 프로젝트 요구사항 추정
+
+    Args:
+        project_dir: 프로젝트 디렉토리
+        python_files: 프로젝트 디렉토리의 .py 파일 이름
+        imports: {파일 이름: 모듈 이름 리스트}
+
+    Returns:
+        manifest_parser 요구사항 형식의 리스트 (sources=['imports'], imports=[import 이름])
+    """
+    modules = []
+    for filename in sorted(python_files):
+        # setup.py의 import(setuptools 등)는 빌드 도구이므로 실행 의존성에서 제외
+        if filename != 'setup.py':
+            modules.extend(imports.get(filename, []))
+
+    return [
+        {'name': distribution, 'specifier': '', 'extras': [], 'marker': None, 'group': None,
+         'sources': ['imports'], 'imports': module_names}
+        for distribution, module_names in resolve_distributions(modules, project_dir, python_files).items()
+    ]
+
+
+def main():
+    """테스트 코드"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as project_dir:
+        os.makedirs(os.path.join(project_dir, 'utils'))
+        sources = {
+            'main.py': 'import os, sys\nimport cv2\nimport numpy as np\nfrom PIL import Image\n'
+                       'from sklearn.metrics import f1_score\nimport helpers\nfrom utils import io\n'
+                       'from . import sibling\n',
+            'helpers.py': 'import json\ntry:\n    import yaml\nexcept ImportError:\n    yaml = None\n\n'
+                          'def load():\n    import requests\n    return importlib.import_module("torch")\n',
+            'broken.py': 'def oops(:\n',
+        }
+        for filename, source in sources.items():
+            with open(os.path.join(project_dir, filename), 'w', encoding='utf-8') as f:
+                f.write(source)
+
+        paths = [os.path.join(project_dir, filename) for filename in sources]
+        imports = {os.path.basename(path): extract_imports(path) for path in paths}
+        for filename, modules in imports.items():
+            print(f"  {filename:<12} {modules}")
+        for req in infer_requirements(project_dir, list(sources), imports):
+            print(f"  -> {req['name']:<16} (import {', '.join(req['imports'])})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Manifest Parser - requirements.txt / setup.py / pyproject.toml / Pipfile 의존성 파싱
+TOML은 tomllib(3.11+, 없으면 tomli), setup.py는 실행하지 않고 AST로 분석하며
+요구사항 문자열은 packaging.requirements로 해석 (packaging이 없으면 이름만 추출)
+"""
+
+import os
+import re
+import ast
+import hashlib
+from typing import Dict, List, Any, Optional
+
+MANIFEST_FILES = ('requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile')
+
+# (파일 이름, 내용 sha256) → 파싱 결과. 같은 내용의 매니페스트는 한 번만 파싱
+_PARSE_CACHE = {}
+
+_NAME_PATTERN = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+_EGG_PATTERN = re.compile(r'#egg=([A-Za-z0-9][A-Za-z0-9._-]*)')
+# URL/VCS 설치 줄 (git+https://..., https://.../pkg.whl, file:///...)
+_URL_PATTERN = re.compile(r'^(?:(?:git|hg|svn|bzr)\+|[A-Za-z][A-Za-z0-9+.-]*://)')
+_SDIST_SUFFIXES = ('.tar.gz', '.tar.bz2', '.tar.xz', '.tgz', '.zip')
+
+
+def canonical_name(name: str) -> str:
+    """PEP 503 정규화 이름 (대소문자, '-', '_', '.' 차이 무시)"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def parse_requirement(text: str, group: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    요구사항 문자열 하나 파싱 (예: 'requests[socks]>=2.0; python_version < "3.12"')
+
+    Args:
+        text: PEP 508 요구사항 문자열
+        group: 선택 의존성 그룹 이름 (extras/dev 등, 필수 의존성은 None)
+
+    Returns:
+        {'name', 'specifier', 'extras', 'marker', 'group'} 또는 None (이름을 찾을 수 없음)
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    try:
+        from packaging.requirements import Requirement, InvalidRequirement
+    except ImportError:
+        Requirement = None
+
+    if Requirement is not None:
+        try:
+            req = Requirement(text)
+            return {
+                'name': req.name,
+                'specifier': str(req.specifier),
+                'extras': sorted(req.extras),
+                'marker': str(req.marker) if req.marker else None,
+                'group': group,
+            }
+        except InvalidRequirement:
+            pass
+
+    # packaging이 없거나 PEP 508이 아닌 문자열 (Poetry '^1.2' 등): 이름만 신뢰
+    match = _NAME_PATTERN.match(text)
+    if not match:
+        return None
+    rest = text[match.end():]
+    extras = []
+    if rest.startswith('['):
+        extras_text, _, rest = rest[1:].partition(']')
+        extras = sorted(e.strip() for e in extras_text.split(',') if e.strip())
+    specifier, _, marker = rest.partition(';')
+    return {
+        'name': match.group(1),
+        'specifier': specifier.strip(),
+        'extras': extras,
+        'marker': marker.strip() or None,
+        'group': group,
+    }
+
+
+def _requirements_from_strings(values, group: Optional[str] = None) -> List[Dict[str, Any]]:
+    if isinstance(values, str):
+        values = values.splitlines()
+    requirements = []
+    for value in values or []:
+        if isinstance(value, str) and not value.strip().startswith('#'):
+            req = parse_requirement(value, group)
+            if req:
+                requirements.append(req)
+    return requirements
+
+
+def _archive_name(location: str) -> Optional[str]:
+    """URL/경로의 wheel 또는 sdist 파일 이름에서 패키지 이름 (예: 'pkg_name-1.0-py3-none-any.whl' → 'pkg_name')"""
+    filename = location.split('#', 1)[0].split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+    if filename.endswith('.whl'):
+        name = filename.split('-', 1)[0]
+    elif filename.endswith(_SDIST_SUFFIXES):
+        # sdist: <이름>-<버전>.tar.gz (이름에 '-'가 있을 수 있으므로 마지막 '-' 기준)
+        name = filename.rsplit('-', 1)[0] if '-' in filename else ''
+    else:
+        return None
+    return name if _NAME_PATTERN.fullmatch(name) else None
+
+
+def _url_requirement(line: str) -> Optional[Dict[str, Any]]:
+    """URL/VCS/아카이브 파일 줄의 요구사항 (#egg= 이름, 없으면 아카이브 파일 이름, 둘 다 없으면 None)"""
+    location, _, marker = line.partition(';')
+    egg = _EGG_PATTERN.search(location)
+    name = egg.group(1) if egg else _archive_name(location.strip())
+    if not name:
+        return None
+    return parse_requirement(f"{name}; {marker.strip()}" if marker.strip() else name)
+
+
+def parse_requirements_txt(content: str) -> List[Dict[str, Any]]:
+    """
+    requirements.txt 파싱 (줄 이어쓰기, 인라인 주석, --hash 등 옵션 처리)
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        요구사항 딕셔너리 리스트
+    """
+    requirements = []
+    content = re.sub(r'\\\r?\n', ' ', content)
+    for line in content.splitlines():
+        line = re.sub(r'(^|\s)#.*$', '', line).strip()
+        if not line:
+            continue
+        if line.startswith('-'):
+            # -r/-c/--index-url 등 옵션은 건너뛰고, 편집 가능 설치는 #egg= 이름만 사용
+            egg = _EGG_PATTERN.search(line)
+            if egg and line.startswith(('-e', '--editable')):
+                requirements.append(parse_requirement(egg.group(1)))
+            continue
+        line = re.split(r'\s+--?\w', line, maxsplit=1)[0]
+        is_direct_reference = '@' in line.split('://', 1)[0]  # PEP 508 'name @ URL'
+        if not is_direct_reference and (_URL_PATTERN.match(line) or line.endswith(('.whl',) + _SDIST_SUFFIXES)):
+            # 'name @ URL'이 아닌 URL/VCS/로컬 아카이브 줄: 스킴을 이름으로 읽지 않음 (이름을 모르면 건너뜀)
+            req = _url_requirement(line)
+        else:
+            req = parse_requirement(line)
+        if req:
+            requirements.append(req)
+    return requirements
+
+
+def _load_toml(content: str) -> Dict[str, Any]:
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError("tomllib (Python 3.11+) or tomli is required to parse TOML manifests (pip install tomli)")
+    return tomllib.loads(content)
+
+
+def _requirements_from_table(table: Dict[str, Any], group: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Poetry/Pipfile 형식 {이름: 버전 문자열 | {'version': ..., 'extras': [...], ...}}"""
+    requirements = []
+    for name, value in (table or {}).items():
+        if name.lower() == 'python':
+            continue
+        specifier, extras, marker, req_group = '', [], None, group
+        if isinstance(value, str):
+            specifier = '' if value.strip() == '*' else value.strip()
+        elif isinstance(value, dict):
+            version = value.get('version', '')
+            specifier = '' if version == '*' else version
+            extras = sorted(value.get('extras', []))
+            marker = value.get('markers')
+            if value.get('optional') and req_group is None:
+                req_group = 'optional'
+        requirements.append({'name': name, 'specifier': specifier, 'extras': extras,
+                             'marker': marker, 'group': req_group})
+    return requirements
+
+
+def parse_pyproject(content: str) -> List[Dict[str, Any]]:
+    """
+    pyproject.toml 파싱 (PEP 621 [project], Poetry [tool.poetry])
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        요구사항 딕셔너리 리스트
+    """
+    data = _load_toml(content)
+    requirements = []
+
+    project = data.get('project', {})
+    requirements.extend(_requirements_from_strings(project.get('dependencies', [])))
+    for extra, values in project.get('optional-dependencies', {}).items():
+        requirements.extend(_requirements_from_strings(values, extra))
+
+    poetry = data.get('tool', {}).get('poetry', {})
+    requirements.extend(_requirements_from_table(poetry.get('dependencies', {})))
+    requirements.extend(_requirements_from_table(poetry.get('dev-dependencies', {}), 'dev'))
+    for group, table in poetry.get('group', {}).items():
+        requirements.extend(_requirements_from_table(table.get('dependencies', {}), group))
+    return requirements
+
+
+def parse_pipfile(content: str) -> List[Dict[str, Any]]:
+    """
+    Pipfile 파싱 ([packages], [dev-packages])
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        요구사항 딕셔너리 리스트
+    """
+    data = _load_toml(content)
+    return (_requirements_from_table(data.get('packages', {}))
+            + _requirements_from_table(data.get('dev-packages', {}), 'dev'))
+
+
+def _literal(node: ast.AST, assignments: Dict[str, ast.AST], depth: int = 0):
+    """리터럴, 모듈 수준 변수 참조, 리스트 덧셈만 평가 (그 외는 None)"""
+    if node is None or depth > 10:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        pass
+    if isinstance(node, ast.Name) and node.id in assignments:
+        return _literal(assignments[node.id], assignments, depth + 1)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _literal(node.left, assignments, depth + 1)
+        right = _literal(node.right, assignments, depth + 1)
+        if isinstance(left, list) and isinstance(right, list):
+            return left + right
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = [_literal(elt, assignments, depth + 1) for elt in node.elts]
+        return [v for v in values if isinstance(v, str)]
+    if isinstance(node, ast.Dict):
+        result = {}
+        for key, value in zip(node.keys, node.values):
+            key = _literal(key, assignments, depth + 1)
+            if isinstance(key, str):
+                result[key] = _literal(value, assignments, depth + 1)
+        return result
+    return None
+
+
+def parse_setup_py(content: str) -> List[Dict[str, Any]]:
+    """
+    setup.py 파싱 (실행하지 않고 AST로 setup() 호출의 install_requires/extras_require 추출)
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        요구사항 딕셔너리 리스트 (파일을 읽어 만드는 등 정적으로 알 수 없는 값은 제외)
+    """
+    tree = ast.parse(content)
+
+    assignments = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    assignments[target.id] = node.value
+
+    requirements = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        if name != 'setup':
+            continue
+
+        keywords = {}
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                # setup(**kwargs)
+                expanded = _literal(keyword.value, assignments)
+                if isinstance(expanded, dict):
+                    keywords.update({k: ast.Constant(v) for k, v in expanded.items()})
+            else:
+                keywords[keyword.arg] = keyword.value
+
+        requirements.extend(_requirements_from_strings(_literal(keywords.get('install_requires'), assignments)))
+        extras = _literal(keywords.get('extras_require'), assignments)
+        if isinstance(extras, dict):
+            for key, values in extras.items():
+                # 'extra:marker' 키 (':marker'만 있으면 조건부 필수 의존성)
+                extra, _, marker = key.partition(':')
+                for req in _requirements_from_strings(values, extra or None):
+                    if marker and not req['marker']:
+                        req['marker'] = marker.strip()
+                    requirements.append(req)
+    return requirements
+
+
+_PARSERS = {
+    'requirements.txt': parse_requirements_txt,
+    'setup.py': parse_setup_py,
+    'pyproject.toml': parse_pyproject,
+    'Pipfile': parse_pipfile,
+}
+
+
+def parse_manifest(filepath: str) -> List[Dict[str, Any]]:
+    """
+    매니페스트 파일 하나 파싱 (같은 내용의 파일은 해시 캐시에서 반환)
+
+    Args:
+        filepath: MANIFEST_FILES 중 하나의 경로
+
+    Returns:
+        요구사항 딕셔너리 리스트 (읽기/파싱 오류 시 빈 리스트)
+    """
+    filename = os.path.basename(filepath)
+    parser = _PARSERS.get(filename)
+    if parser is None:
+        return []
+
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        print(f"    [!] Error reading {filepath}: {e}")
+        return []
+
+    key = (filename, hashlib.sha256(data).hexdigest())
+    if key not in _PARSE_CACHE:
+        try:
+            _PARSE_CACHE[key] = parser(data.decode('utf-8', errors='replace'))
+        except Exception as e:
+            print(f"    [!] Error parsing {filepath}: {e}")
+            _PARSE_CACHE[key] = []
+    return [dict(req) for req in _PARSE_CACHE[key]]
+
+
+def merge_requirements(requirements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    여러 매니페스트의 요구사항을 정규화 이름 기준으로 병합
+
+    Args:
+        requirements: 'source' 키가 붙은 요구사항 딕셔너리 리스트
+
+    Returns:
+        병합된 리스트 (처음 나온 순서, 'sources' 목록 포함, 한 곳이라도 필수면 group=None)
+    """
+    merged = {}
+    for req in requirements:
+        key = canonical_name(req['name'])
+        if key not in merged:
+            entry = {k: v for k, v in req.items() if k != 'source'}
+            entry['sources'] = []
+            merged[key] = entry
+        entry = merged[key]
+        if req.get('source') and req['source'] not in entry['sources']:
+            entry['sources'].append(req['source'])
+        if not entry['specifier'] and req['specifier']:
+            entry['specifier'] = req['specifier']
+        entry['extras'] = sorted(set(entry['extras']) | set(req['extras']))
+        if req['group'] is None:
+            entry['group'] = None
+    return list(merged.values())
+
+
+def parse_manifests(directory: str, files: List[str] = None) -> List[Dict[str, Any]]:
+    """
+    디렉토리의 모든 매니페스트를 파싱해 병합
+
+    Args:
+        directory: 프로젝트 디렉토리
+        files: 디렉토리 파일 이름 목록 (None이면 MANIFEST_FILES 존재 여부 확인)
+
+    Returns:
+        merge_requirements() 결과
+    """
+    if files is None:
+        files = [f for f in MANIFEST_FILES if os.path.isfile(os.path.join(directory, f))]
+
+    requirements = []
+    for filename in MANIFEST_FILES:
+        if filename in files:
+            for req in parse_manifest(os.path.join(directory, filename)):
+                req['source'] = filename
+                requirements.append(req)
+    return merge_requirements(requirements)
+
+
+def main():
+    """테스트 코드"""
+    import tempfile
+
+    manifests = {
+        'requirements.txt': 'numpy>=1.24  # arrays\nrequests[socks]==2.31.0 \\\n    --hash=sha256:abc\n'
+                            '-r dev.txt\n-e git+https://example.com/repo.git#egg=my_tool\n'
+                            'git+https://example.com/other.git@v1#egg=other_tool\n'
+                            'https://example.com/wheels/fast_lib-1.0-py3-none-any.whl\n'
+                            'https://example.com/sdist/slow-lib-2.1.tar.gz\n'
+                            'https://example.com/archive/master.zip\n'
+                            'demo-core @ https://example.com/demo_core-0.1.tar.gz\n',
+        'setup.py': 'from setuptools import setup\nBASE = ["numpy", "opencv-python>=4.8"]\n'
+                    'setup(name="demo", install_requires=BASE + ["PyYAML"],\n'
+                    '      extras_require={"gui": ["PySimpleGUI"], ":sys_platform == \'win32\'": ["pywin32"]})\n',
+        'pyproject.toml': '[project]\nname = "demo"\ndependencies = [\n  "pandas>=2; python_version >= \'3.9\'",\n'
+                          '  "Requests",\n]\n[project.optional-dependencies]\ntest = ["pytest"]\n',
+        'Pipfile': '[packages]\ntorch = "*"\nultralytics = {version = ">=8.0", extras = ["export"]}\n'
+                   '[dev-packages]\nblack = "*"\n',
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for filename, content in manifests.items():
+            with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
+                f.write(content)
+
+        for req in parse_manifests(directory):
+            print(f"  {req['name']:<16} {req['specifier']:<12} extras={req['extras']} "
+                  f"group={req['group']} marker={req['marker']} sources={req['sources']}")
+
+
+if __name__ == "__main__":
+    main()
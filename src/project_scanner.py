@@ -2,67 +2,512 @@
 Project Scanner
 """
 import os
+import sys
 import json
+import time
+import queue
+import hashlib
 import argparse
+import fnmatch
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 import re
 
+from manifest_parser import MANIFEST_FILES, canonical_name, parse_manifest, merge_requirements
+from import_scanner import extract_imports, infer_requirements
+
+PRUNE_DIRS = {'venv', 'env', '__pycache__', 'node_modules', 'dist', 'build', 'site-packages'}
+INDICATORS = ['requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile', 'main.py', 'app.py']
+# 프로젝트 루트로 확정하는 매니페스트 (stop_at_project 모드에서 하위 탐색 중단)
+MANIFESTS = set(MANIFEST_FILES)
+# 이 항목이 있는 디렉토리는 가상환경/conda 환경이므로 내부를 보지 않음
+ENV_MARKERS = {'pyvenv.cfg', 'conda-meta'}
+# 스캔 인덱스 기본 위치: 스캔 대상 트리가 아닌 도구의 출력 폴더 (gui_scanner의 OUTPUT_DIR과 같은 기준)
+_PROGRAM_DIR = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__file__).resolve().parent
+INDEX_DIR = _PROGRAM_DIR.parent / 'outputs' / 'scan_index'
+INDEX_VERSION = 5
+# 파일 파싱 결과 캐시 구역: 설정 파일(매니페스트, .gitignore) / .py import (setup.py는 둘 다 해당)
+CACHE_SECTIONS = ('files', 'imports')
+# 파일 시스템 mtime 해상도(FAT 2초) 안에서 바뀐 항목은 변경을 놓칠 수 있으므로 캐시하지 않음
+RACY_MTIME_NS = 2_000_000_000
+PROGRESS_INTERVAL = 1.0
+
+
+def _gitignore_regex(pattern: str):
+    """.gitignore 패턴 하나를 정규식으로 변환 (*, ?, [...], ** 지원). 잘못된 패턴([z-a] 등)은 None"""
+    parts = re.split(r'(\*\*/|/\*\*$|\*\*|\*|\?|\[[^\]]*\])', pattern)
+    regex = []
+    for part in parts:
+        if part == '**/':
+            regex.append('(?:.*/)?')
+        elif part == '/**':
+            regex.append('/.*')
+        elif part == '**':
+            regex.append('.*')
+        elif part == '*':
+            regex.append('[^/]*')
+        elif part == '?':
+            regex.append('[^/]')
+        elif part.startswith('[') and part.endswith(']') and len(part) > 2:
+            body = part[1:-1]
+            negate = body[0] in '!^'
+            if negate:
+                body = body[1:]
+            # 범위 '-' 외의 정규식 특수 문자는 문자 그대로 취급
+            body = body.replace('\\', '\\\\').replace('[', '\\[').replace('^', '\\^')
+            regex.append('[' + ('^' if negate else '') + body + ']')
+        else:
+            regex.append(re.escape(part))
+    try:
+        return re.compile(''.join(regex) + '$')
+    except re.error:
+        return None
+
+
+def _parse_gitignore(filepath: str) -> List[List[Any]]:
+    """.gitignore를 [패턴, 제외 취소 여부, 경로 기준 여부] 목록으로 읽음 (디렉토리 가지치기에만 사용)"""
+    rules = []
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.rstrip('\n').rstrip()
+                if not line or line.startswith('#'):
+                    continue
+                negate = line.startswith('!')
+                if negate:
+                    line = line[1:]
+                line = line.rstrip('/')
+                # 중간/앞에 '/'가 있으면 .gitignore 위치 기준 경로, 없으면 모든 깊이의 이름과 비교
+                anchored = '/' in line
+                line = line.lstrip('/')
+                if line:
+                    rules.append([line, negate, anchored])
+    except OSError:
+        pass
+    return rules
+
+
+def parse_project(job: Dict[str, Any]) -> Dict[str, Any]:
+    """프로세스 풀 작업: 후보 디렉토리의 매니페스트(없으면 .py import)를 파싱. 인덱스에 값이 있으면 재사용"""
+    parsed = {section: {} for section in CACHE_SECTIONS}
+    requirements = []
+    for filename, path, value in job['manifests']:
+        if value is None:
+            value = parsed['files'][path] = parse_manifest(path)
+        requirements.extend(dict(req, source=filename) for req in value)
+    requirements = merge_requirements(requirements)
+
+    if not requirements and job['sources'] is not None:
+        imports = {}
+        for path, value in job['sources']:
+            if value is None:
+                value = parsed['imports'][path] = extract_imports(path)
+            imports[os.path.basename(path)] = value
+        requirements = infer_requirements(job['root'], job['python_files'], imports)
+    return {'requirements': requirements, 'parsed': parsed}
+
+
+def default_index_path(root_path: str) -> str:
+    """루트별 기본 스캔 인덱스 경로 (INDEX_DIR 아래, 루트 절대 경로의 해시로 구분)"""
+    root = os.path.normcase(os.path.abspath(root_path))
+    digest = hashlib.sha1(root.encode('utf-8')).hexdigest()[:16]
+    return str(INDEX_DIR / f"{Path(root).name or 'root'}-{digest}.json")
+
+
 class ProjectScanner:
-    def __init__(self, root_path: str):
+    def __init__(self, root_path: str, workers: int = None, index_path: str = None,
+                 excludes: List[str] = None, use_gitignore: bool = True, max_depth: int = None,
+                 stop_at_project: bool = False, infer_imports: bool = True, parse_workers: int = None,
+                 progress=None):
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1 (got {workers})")
+        if parse_workers is not None and parse_workers < 0:
+            raise ValueError(f"parse_workers must be >= 0 (got {parse_workers})")
         self.root_path = Path(root_path)
         self.projects = []
         self.project_dependencies = {}
+        # 디렉토리 순회는 stat 지연(네트워크 드라이브)이 대부분이므로 CPU 수보다 많은 스레드 사용
+        self.workers = min(32, (os.cpu_count() or 1) * 4) if workers is None else workers
+        self.index_path = index_path or default_index_path(root_path)
+        # 가지치기 규칙: glob 제외(이름 또는 루트 기준 상대 경로), .gitignore, 최대 깊이(루트=0)
+        self.excludes = list(excludes or [])
+        self.use_gitignore = use_gitignore
+        self.max_depth = max_depth
+        self.stop_at_project = stop_at_project
+        # 매니페스트가 없는 프로젝트는 .py 파일의 import로 의존성 추정
+        self.infer_imports = infer_imports
+        # 매니페스트/소스 파싱 프로세스 수 (0이면 현재 프로세스에서 파싱)
+        self.parse_workers = (os.cpu_count() or 1) if parse_workers is None else parse_workers
+        # progress(dict) 콜백: dirs, candidates, parsed, project(새로 확정된 프로젝트 또는 None), done
+        self.progress = progress
+        self._lock = threading.Lock()
+        # 이전 스캔 인덱스(읽기 전용)와 이번 스캔에서 새로 만드는 인덱스
+        self._old_dirs, self._old_cache = {}, {section: {} for section in CACHE_SECTIONS}
+        self._new_dirs, self._new_cache = {}, {section: {} for section in CACHE_SECTIONS}
+        self.index_stats = {}
+
+    def scan(self, full: bool = False) -> List[Dict[str, Any]]:
+        self._load_index(full)
+        self._new_dirs, self._new_cache = {}, {section: {} for section in CACHE_SECTIONS}
+        self.index_stats = {'dirs': 0, 'dirs_reused': 0, 'pruned': 0, 'files': 0, 'files_parsed': 0}
+        self._scan_start_ns = time.time_ns()
 
-    def scan(self) -> List[Dict[str, Any]]:
-        print(f"[*] Scanning projects in {self.root_path}...")
-        for root, dirs, files in os.walk(self.root_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['venv', 'env', '__pycache__', 'node_modules']]
-            project_info = self._check_project(root, files)
-            if project_info:
-                self.projects.append(project_info)
-                print(f"    [+] Found: {project_info['name']}")
+        mode = 'full' if full or not self._old_dirs else 'incremental'
+        print(f"[*] Scanning projects in {self.root_path} ({self.workers} walkers, "
+              f"{self.parse_workers} parsers, {mode})...")
+        # 1단계(작업자 스레드)가 후보 디렉토리를 내보내면 2단계(프로세스 풀)가 파싱, 완료 순으로 self.projects에 추가
+        first = len(self.projects)
+        self._counts = {'candidates': 0, 'parsed': 0}
+        self._last_progress = 0.0
+        completed = queue.Queue()
+        executor = None
+        running = 0
+        try:
+            for root, files in self._walk():
+                task = self._project_task(root, files)
+                if task is not None:
+                    self._counts['candidates'] += 1
+                    if self.parse_workers == 0 or not task['needs_parse']:
+                        self._finish_project(task, parse_project(task['job']))
+                    else:
+                        if executor is None:
+                            executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+                        future = executor.submit(parse_project, task['job'])
+                        future.add_done_callback(lambda f, task=task: completed.put((task, f)))
+                        running += 1
+                while not completed.empty():
+                    self._finish_future(*completed.get())
+                    running -= 1
+                self._report_progress()
+
+            while running:
+                self._finish_future(*completed.get())
+                running -= 1
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        # 작업자 스레드/프로세스의 완료 순서와 무관하게 경로 순(전위 순회) 정렬
+        self.projects[first:] = sorted(self.projects[first:], key=lambda p: self._path_key(p['path']))
+        self._report_progress(done=True)
+
+        stats = self.index_stats
+        print(f"    [*] Directories: {stats['dirs_reused']}/{stats['dirs']} listings reused, "
+              f"{stats['pruned']} pruned, config files: {stats['files_parsed']}/{stats['files']} parsed")
+        self._save_index()
         return self.projects
 
-    def _check_project(self, root: str, files: List[str]) -> Dict[str, Any] or None:
-        indicators = ['requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile', 'main.py', 'app.py']
-        detected = None
-        deps = []
-        for ind in indicators:
-            if ind in files:
-                if ind == 'requirements.txt':
-                    deps = self._parse_req(os.path.join(root, ind))
-                detected = ind
-                break
-        if detected:
-            return {
-                'name': os.path.basename(root),
-                'path': root,
-                'type': detected,
-                'dependencies': deps,
-                'python_files': [f for f in files if f.endswith('.py')],
-                'config_files': [f for f in files if f in indicators],
-            }
-        return None
+    def _load_index(self, full: bool):
+        self._old_dirs, self._old_cache = {}, {section: {} for section in CACHE_SECTIONS}
+        if full or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"    [!] Ignoring scan index {self.index_path}: {e}")
+            return
+        if index.get('version') != INDEX_VERSION or index.get('root') != str(self.root_path):
+            return
+        self._old_dirs = index.get('dirs', {})
+        self._old_cache = {section: index.get(section, {}) for section in CACHE_SECTIONS}
+
+    def _save_index(self):
+        index = {
+            'version': INDEX_VERSION,
+            'root': str(self.root_path),
+            'dirs': self._new_dirs,
+            **self._new_cache,
+        }
+        tmp_path = self.index_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"    [!] Could not save scan index {self.index_path}: {e}")
+
+    def _is_racy(self, mtime_ns: int) -> bool:
+        return self._scan_start_ns - mtime_ns < RACY_MTIME_NS
+
+    def _list_dir(self, path: str):
+        """디렉토리 mtime이 인덱스와 같으면 저장된 목록 재사용, 아니면 scandir. (files, 하위 디렉토리 이름)"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return [], [], False  # 읽을 수 없는 디렉토리는 건너뜀 (os.walk 기본 동작)
+
+        # 디렉토리 mtime은 직속 항목의 추가/삭제/이름 변경만 반영하므로 하위 디렉토리는 계속 확인
+        cached = self._old_dirs.get(path)
+        if cached and cached['mtime'] == mtime:
+            self._new_dirs[path] = cached
+            return cached['files'], cached['dirs'], True
+
+        subdirs, files = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        # 프로젝트 판별에 쓰는 파일만 인덱스에 저장
+                        if entry.name in INDICATORS or entry.name.endswith('.py') or \
+                                entry.name in ENV_MARKERS or entry.name == '.gitignore':
+                            files.append(entry.name)
+                    # os.walk(followlinks=False)와 같이 디렉토리 심볼릭 링크는 따라가지 않음
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.name)
+        except OSError:
+            pass
+
+        if not self._is_racy(mtime):
+            self._new_dirs[path] = {'mtime': mtime, 'files': files, 'dirs': subdirs}
+        return files, subdirs, False
+
+    def _path_key(self, path: str):
+        return Path(path).relative_to(self.root_path).parts
+
+    def _keep_dir(self, path: str, name: str, ignore_rules) -> bool:
+        if name.startswith('.') or name in PRUNE_DIRS:
+            return False
+        if self.excludes:
+            rel = path[len(str(self.root_path)):].replace(os.sep, '/').lstrip('/')
+            if any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel, p) for p in self.excludes):
+                return False
+        # 상위 .gitignore부터 차례로 적용, 마지막으로 일치한 규칙이 결정 (git과 동일)
+        ignored = False
+        for base, rules in ignore_rules:
+            rel = path[len(base):].replace(os.sep, '/').lstrip('/')
+            for regex, negate, anchored in rules:
+                if regex.match(rel if anchored else name):
+                    ignored = not negate
+        return not ignored
+
+    def _gitignore_rules(self, path: str, files: List[str], ignore_rules):
+        if not self.use_gitignore or '.gitignore' not in files:
+            return ignore_rules
+        rules = self._cached_parse(os.path.join(path, '.gitignore'), _parse_gitignore)
+        if not rules:
+            return ignore_rules
+        compiled = [(regex, negate, anchored) for regex, negate, anchored in
+                    ((_gitignore_regex(pattern), negate, anchored) for pattern, negate, anchored in rules)
+                    if regex is not None]
+        return ignore_rules + ((path, compiled),)
+
+    def _child_dirs(self, path: str, depth: int, files: List[str], names: List[str], ignore_rules):
+        if self.max_depth is not None and depth >= self.max_depth:
+            return []
+        # 매니페스트가 있는 프로젝트 루트 아래(데이터/빌드 폴더, 하위 main.py)는 보지 않음
+        if self.stop_at_project and MANIFESTS.intersection(files):
+            return []
+        ignore_rules = self._gitignore_rules(path, files, ignore_rules)
+        children = []
+        for name in names:
+            child = os.path.join(path, name)
+            if self._keep_dir(child, name, ignore_rules):
+                children.append((child, depth + 1, ignore_rules))
+        return children
+
+    def _walk(self):
+        """scandir 작업자 스레드가 공유 큐에서 디렉토리를 꺼내 병렬 순회, (root, files)를 도착 순으로 반환"""
+        dir_queue = queue.Queue()
+        results = queue.Queue()
+        lock = self._lock
+        pending = [1]  # 큐에 넣었지만 아직 처리되지 않은 디렉토리 수
+        stop = threading.Event()
+
+        def worker():
+            while True:
+                item = dir_queue.get()
+                if item is None:
+                    return
+                try:
+                    # 소비자가 중단(예외)된 뒤에는 남은 디렉토리를 순회하지 않고 비우기만 함
+                    if not stop.is_set():
+                        path, depth, ignore_rules = item
+                        files, names, reused = self._list_dir(path)
+                        if ENV_MARKERS.intersection(files) or ENV_MARKERS.intersection(names):
+                            files, subdirs = [], []
+                        else:
+                            subdirs = self._child_dirs(path, depth, files, names, ignore_rules)
+
+                        with lock:
+                            pending[0] += len(subdirs)
+                            self.index_stats['dirs'] += 1
+                            self.index_stats['dirs_reused'] += reused
+                            self.index_stats['pruned'] += len(names) - len(subdirs)
+                        for subdir in subdirs:
+                            dir_queue.put(subdir)
+                        results.put((path, files))
+                except Exception as e:
+                    # 예외는 소비자에게 전달해 scan()에서 다시 발생시킴
+                    results.put(e)
+                finally:
+                    with lock:
+                        pending[0] -= 1
+                        if pending[0] == 0:
+                            results.put(None)
+
+        dir_queue.put((str(self.root_path), 0, ()))
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            for _ in threads:
+                dir_queue.put(None)
+
+    def _project_task(self, root: str, files: List[str]) -> Dict[str, Any] or None:
+        detected = next((ind for ind in INDICATORS if ind in files), None)
+        if not detected:
+            return None
+
+        info = {
+            'name': os.path.basename(root),
+            'path': root,
+            'type': detected,
+            'dependencies': [],
+            'requirements': [],
+            'python_files': [f for f in files if f.endswith('.py')],
+            'config_files': [f for f in files if f in INDICATORS],
+        }
+        # 인덱스 조회(stat/해시)는 여기서, 바뀐 파일의 파싱만 프로세스 풀로 보냄
+        entries, cached = {}, {}
+        manifests = []
+        for manifest in MANIFEST_FILES:
+            if manifest in files:
+                path = os.path.join(root, manifest)
+                key = ('files', path)
+                cached[key], entries[key] = self._cache_lookup(path)
+                manifests.append([manifest, path, cached[key]])
 
-    def _parse_req(self, filepath: str) -> List[str]:
-        packages = []
+        # 저장된 매니페스트 중 하나라도 의존성을 선언하면 import 추정은 필요 없음.
+        # 파싱할 매니페스트가 있으면 필요 여부를 작업자가 판단하므로 소스 파일 인덱스 조회는 생략
+        sources = None
+        if self.infer_imports and info['python_files'] and not any(cached.values()):
+            known = all(value is not None for value in cached.values())
+            sources = []
+            for filename in info['python_files']:
+                path = os.path.join(root, filename)
+                key = ('imports', path)
+                if known:
+                    cached[key], entries[key] = self._cache_lookup(path, 'imports')
+                sources.append([path, cached.get(key)])
+
+        return {
+            'info': info,
+            'entries': entries,
+            'cached': cached,
+            'needs_parse': any(value is None for value in cached.values()) or any(
+                value is None for _, value in sources or []),
+            'job': {'root': root, 'python_files': info['python_files'], 'manifests': manifests, 'sources': sources},
+        }
+
+    def _finish_future(self, task: Dict[str, Any], future):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        pkg = line.split('==')[0].split('>=')[0].split('<=')[0].split('>')[0].split('<')[0].split('!=')[0].strip()
-                        if pkg:
-                            packages.append(pkg)
+            result = future.result()
         except Exception as e:
-            print(f"    [!] Error: {e}")
-        return packages
+            print(f"    [!] Error parsing {task['info']['path']}: {e}")
+            result = {'requirements': [], 'parsed': {section: {} for section in CACHE_SECTIONS}}
+        self._finish_project(task, result)
+
+    def _finish_project(self, task: Dict[str, Any], result: Dict[str, Any]):
+        entries = task['entries']
+        parsed = {(section, path): value for section in CACHE_SECTIONS
+                  for path, value in result['parsed'][section].items()}
+        for key in parsed:
+            if key not in entries:
+                entries[key] = self._cache_lookup(key[1], key[0])[1]
+        for (section, path), entry in entries.items():
+            value = parsed.get((section, path), task['cached'].get((section, path)))
+            if value is not None:
+                self._cache_store(path, entry, value, section)
+        with self._lock:
+            self.index_stats['files'] += len(entries)
+            self.index_stats['files_parsed'] += len(parsed)
+
+        info = task['info']
+        info['requirements'] = result['requirements']
+        # dependencies는 필수 의존성 이름만 (선택 그룹 제외)
+        info['dependencies'] = [req['name'] for req in result['requirements'] if req['group'] is None]
+        self.projects.append(info)
+        self._counts['parsed'] += 1
+        print(f"    [+] Found: {info['name']}")
+        self._report_progress(info)
+
+    def _report_progress(self, project: Dict[str, Any] = None, done: bool = False):
+        event = {
+            'dirs': self.index_stats['dirs'],
+            'candidates': self._counts['candidates'],
+            'parsed': self._counts['parsed'],
+            'project': project,
+            'done': done,
+        }
+        now = time.monotonic()
+        if project is None and not done and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        if self.progress is not None:
+            self.progress(event)
+        if project is None:
+            self._last_progress = now
+            print(f"    [*] {event['dirs']} dirs walked, {event['parsed']}/{event['candidates']} projects parsed")
+
+    def _cache_lookup(self, filepath: str, section: str = 'files'):
+        """stat(mtime, 크기)이나 해시가 인덱스와 같으면 (저장된 값, 항목), 아니면 (None, 새 항목)"""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None, None
+
+        cached = self._old_cache[section].get(filepath)
+        if cached and (cached['mtime'], cached['size']) == (stat.st_mtime_ns, stat.st_size):
+            return cached['value'], cached
+        digest = self._hash_file(filepath)
+        if cached and digest is not None and cached['sha256'] == digest:
+            return cached['value'], dict(cached, mtime=stat.st_mtime_ns, size=stat.st_size)
+        return None, {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+
+    def _cache_store(self, filepath: str, entry: Dict[str, Any], value: List[Any], section: str = 'files'):
+        if entry is None or entry['sha256'] is None or self._is_racy(entry['mtime']):
+            return
+        self._new_cache[section][filepath] = dict(entry, value=value)
+
+    def _cached_parse(self, filepath: str, parse) -> List[Any]:
+        """설정 파일 stat(mtime, 크기)이나 해시가 인덱스와 같으면 저장된 파싱 결과 재사용"""
+        value, entry = self._cache_lookup(filepath)
+        with self._lock:
+            self.index_stats['files'] += 1
+            self.index_stats['files_parsed'] += value is None
+        if value is None:
+            value = parse(filepath)
+        self._cache_store(filepath, entry, value)
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+
+    def _hash_file(self, filepath: str) -> str or None:
+        try:
+            with open(filepath, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
 
     def get_all_dependencies(self) -> Dict[str, int]:
+        # 매니페스트(PyYAML)와 import 추정(pyyaml) 이름을 같은 패키지로 집계 (프로젝트당 한 번)
         all_deps = {}
         for proj in self.projects:
-            for dep in proj['dependencies']:
+            for dep in dict.fromkeys(canonical_name(dep) for dep in proj['dependencies']):
                 all_deps[dep] = all_deps.get(dep, 0) + 1
         self.project_dependencies = all_deps
         return all_deps
@@ -98,7 +543,24 @@ def main():
     parser = argparse.ArgumentParser(description='Project Scanner')
     parser.add_argument('--root', default='D:/project', help='Root directory')
     parser.add_argument('--output', default=None, help='Output path')
+    parser.add_argument('--workers', type=int, default=None, help='Directory walker threads')
+    parser.add_argument('--index', default=None, help=f'Scan index path (default: per-root file in {INDEX_DIR})')
+    parser.add_argument('--full', action='store_true', help='Ignore the scan index and rescan everything')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='Glob of directory names or root-relative paths to skip (repeatable)')
+    parser.add_argument('--no-gitignore', action='store_true', help='Do not skip directories ignored by .gitignore')
+    parser.add_argument('--max-depth', type=int, default=None, help='Maximum directory depth below the root')
+    parser.add_argument('--stop-at-project', action='store_true',
+                        help='Do not descend below a directory with a requirements/setup/pyproject/Pipfile')
+    parser.add_argument('--no-imports', action='store_true',
+                        help='Do not infer dependencies from imports for projects without manifests')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                        help='Processes for manifest/source parsing (default: CPU count, 0 = in-process)')
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error(f"--workers must be >= 1 (got {args.workers})")
+    if args.parse_workers is not None and args.parse_workers < 0:
+        parser.error(f"--parse-workers must be >= 0 (got {args.parse_workers})")
     
     print("")
     print("="*70)
@@ -106,8 +568,11 @@ def main():
     print("="*70)
     print(f"Scanning: {args.root}")
     
-    scanner = ProjectScanner(args.root)
-    scanner.scan()
+    scanner = ProjectScanner(args.root, workers=args.workers, index_path=args.index,
+                             excludes=args.exclude, use_gitignore=not args.no_gitignore,
+                             max_depth=args.max_depth, stop_at_project=args.stop_at_project,
+                             infer_imports=not args.no_imports, parse_workers=args.parse_workers)
+    scanner.scan(full=args.full)
     scanner.print_summary()
     
     out = args.output or os.path.join(args.root, 'project_scan_report.json')
@@ -0,0 +1,171 @@
+"""
+Quantile Sketch - 병합 가능한 근사 분위수 스케치 (KLL)
+전체 점수 리스트를 보관하지 않고 고정 크기 메모리로 p1/p50/p99 등 분위수 추정
+"""
+
+import math
+import random
+from typing import Dict, List, Any, Iterable
+
+
+class KLLSketch:
+    """
+    KLL (Karnin-Lang-Liberty) 분위수 스케치
+
+    레벨 h의 항목은 가중치 2^h를 가지며, 레벨 용량을 넘으면 정렬 후 한 칸씩
+    건너뛰어 상위 레벨로 올린다. 메모리는 O(k)이고, 같은 k를 쓰는 스케치끼리
+    병합할 수 있으므로 병렬 작업자나 여러 실행 결과를 합칠 수 있다.
+    """
+
+    def __init__(self, k: int = 200, seed: int = None):
+        """
+        Args:
+            k: 정확도 파라미터 (클수록 정확, 순위 오차 약 1.65/k)
+            seed: 압축 시 사용할 난수 시드 (재현용)
+        """
+        self.k = k
+        self.n = 0
+        self.compactors = [[]]
+        self._random = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def add(self, value: float):
+        """값 하나 추가"""
+        self.compactors[0].append(value)
+        self.n += 1
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def update(self, values: Iterable[float]):
+        """여러 값 추가"""
+        for value in values:
+            self.add(value)
+
+    def _compress(self):
+        """용량을 넘은 레벨을 상위 레벨로 압축"""
+        level = 0
+        while level < len(self.compactors):
+            compactor = self.compactors[level]
+            if len(compactor) >= self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+
+                compactor.sort()
+                # 홀수 개면 마지막 하나는 현재 레벨에 남김
+                leftover = [compactor.pop()] if len(compactor) % 2 else []
+                offset = self._random.randint(0, 1)
+                self.compactors[level + 1].extend(compactor[offset::2])
+                self.compactors[level] = leftover
+
+                if self._size() < self._max_size():
+                    break
+            level += 1
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        다른 스케치를 현재 스케치에 병합
+
+        Args:
+            other: 병합할 스케치 (같은 k 권장)
+
+        Returns:
+            self
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+
+        self.n += other.n
+        while self._size() >= self._max_size():
+            self._compress()
+        return self
+
+    def _weighted_items(self) -> List[tuple]:
+        items = []
+        for level, compactor in enumerate(self.compactors):
+            weight = 1 << level
+            items.extend((value, weight) for value in compactor)
+        items.sort()
+        return items
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """
+        여러 분위수를 한 번의 정렬로 추정
+
+        Args:
+            qs: 분위 리스트 (0.0-1.0)
+
+        Returns:
+            추정 분위수 리스트 (데이터가 없으면 0.0)
+        """
+        items = self._weighted_items()
+        if not items:
+            return [0.0 for _ in qs]
+
+        total_weight = sum(weight for _, weight in items)
+        results = []
+        for q in qs:
+            target = q * total_weight
+            cumulative = 0
+            value = items[-1][0]
+            for item, weight in items:
+                cumulative += weight
+                if cumulative >= target:
+                    value = item
+                    break
+            results.append(value)
+        return results
+
+    def quantile(self, q: float) -> float:
+        """분위수 하나 추정"""
+        return self.quantiles([q])[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 딕셔너리 변환"""
+        return {
+            'k': self.k,
+            'n': self.n,
+            'compactors': [list(compactor) for compactor in self.compactors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'KLLSketch':
+        """to_dict() 결과로부터 복원"""
+        sketch = cls(k=data['k'])
+        sketch.n = data['n']
+        sketch.compactors = [list(compactor) for compactor in data['compactors']] or [[]]
+        return sketch
+
+
+def main():
+    """테스트 코드"""
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(200000)]
+
+    # 두 작업자로 나눠 스케치 후 병합
+    left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+    left.update(values[:100000])
+    right.update(values[100000:])
+    merged = left.merge(right)
+
+    exact = sorted(values)
+    print(f"Items retained: {merged._size()} / {merged.n}")
+    for q in (0.01, 0.5, 0.99):
+        estimate = merged.quantile(q)
+        true_value = exact[int(q * (len(exact) - 1))]
+        print(f"  p{int(q * 100):<3} estimate={estimate:.4f} exact={true_value:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Report Benchmark - 엑셀 리포트 생성 시간/메모리 측정
+합성 검출 결과로 'Detection Results' 시트를 10k/100k/1M 행 규모로 생성해
+write-only(스트리밍) 모드와 메모리 내 워크북 모드를 비교
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from typing import Dict, Any, Iterator
+
+from reporter import ExcelReporter
+
+DEFAULT_ROW_COUNTS = (10_000, 100_000, 1_000_000)
+
+
+def generate_detection_results(count: int, detections_per_image: int = 3) -> Iterator[Dict[str, Any]]:
+    """
+    합성 검출 결과 생성 (메모리에 모아두지 않도록 제너레이터)
+
+    Args:
+        count: 이미지 수 (= 시트 행 수)
+        detections_per_image: 이미지당 검출 수
+
+    Yields:
+        YOLODetector.detect_image() 형식의 결과 딕셔너리
+    """
+    for index in range(count):
+        detections = [
+            # 실제 검출처럼 거의 모든 신뢰도 값이 서로 다르도록 생성
+            {'class_name': f'class_{(index + k) % 10}',
+             'confidence': 0.25 + ((index * 2654435761 + k * 40503) % 750000) / 1000000}
+            for k in range(detections_per_image)
+        ]
+        yield {
+            'image_name': f'image_{index:07d}.jpg',
+            'image_size': {'width': 1920, 'height': 1080},
+            'total_detections': len(detections),
+            'unique_classes': len({d['class_name'] for d in detections}),
+            'detections': detections,
+        }
+
+
+def benchmark_detection_sheet(rows: int, write_only: bool = True, trace_memory: bool = False) -> Dict[str, Any]:
+    """
+    검출 결과 시트 생성/저장 시간 측정
+
+    Args:
+        rows: 행 수
+        write_only: ExcelReporter write-only 모드 여부
+        trace_memory: tracemalloc으로 최대 Python 메모리 측정 (측정 자체가 느려짐)
+
+    Returns:
+        {'rows', 'mode', 'seconds', 'rows_per_second', 'file_mb', 'peak_mb'}
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        if trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        reporter = ExcelReporter(output_dir, write_only=write_only)
+        reporter.create_detection_sheet(generate_detection_results(rows))
+        output_path = reporter.save_report('benchmark.xlsx')
+        elapsed = time.perf_counter() - start
+
+        peak_mb = None
+        if trace_memory:
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+
+        file_mb = os.path.getsize(output_path) / 1024 / 1024 if output_path else 0.0
+
+    return {
+        'rows': rows,
+        'mode': 'write-only' if write_only else 'in-memory',
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed > 0 else 0.0,
+        'file_mb': file_mb,
+        'peak_mb': peak_mb,
+    }
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='Excel report generation benchmark')
+    parser.add_argument('--rows', type=str, default=','.join(str(n) for n in DEFAULT_ROW_COUNTS),
+                        help='Comma-separated row counts (default: 10000,100000,1000000)')
+    parser.add_argument('--compare', action='store_true',
+                        help='Also run the in-memory workbook mode for comparison')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Measure peak Python memory with tracemalloc (slower)')
+    args = parser.parse_args()
+
+    row_counts = [int(value) for value in args.rows.split(',') if value.strip()]
+    modes = [True, False] if args.compare else [True]
+
+    results = []
+    for rows in row_counts:
+        for write_only in modes:
+            mode = 'write-only' if write_only else 'in-memory'
+            print(f"[*] Writing {rows:,} rows ({mode})...")
+            results.append(benchmark_detection_sheet(rows, write_only, args.trace_memory))
+
+    print(f"\n  {'Rows':>10} {'Mode':<11} {'Time (s)':>9} {'Rows/s':>10} {'File (MB)':>10} {'Peak (MB)':>10}")
+    for result in results:
+        peak = f"{result['peak_mb']:.1f}" if result['peak_mb'] is not None else '-'
+        print(f"  {result['rows']:>10,} {result['mode']:<11} {result['seconds']:>9.2f} "
+              f"{result['rows_per_second']:>10,.0f} {result['file_mb']:>10.1f} {peak:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
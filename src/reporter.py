@@ -1,395 +1,535 @@
 """
 Reporter - 분석 결과를 Excel 파일로 내보내기
+openpyxl write-only 모드로 행을 생성되는 대로 스트리밍 기록 (셀 객체를 메모리에 유지하지 않음)
 """
 
 import os
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 import json
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-except ImportError:
-    print("[!] openpyxl not installed. Install it with: pip install openpyxl")
-    Workbook = None
+from detail_writer import ShardedTableWriter, DEFAULT_SHARD_ROWS
+
+
+# 워크북에 한 번만 등록하고 이름으로 재사용하는 셀 스타일
+STYLE_TITLE = 'report_title'
+STYLE_HEADER = 'report_header'
+STYLE_SECTION = 'report_section'
+STYLE_DATA = 'report_data'
+STYLE_TOTAL = 'report_total'
+
+# 숫자 셀 표시 형식 (값은 숫자 그대로 기록, 비율은 0-1 분수로 기록)
+NUMBER_FORMATS = {
+    'integer': '#,##0',
+    'decimal': '0.0000',
+    'threshold': '0.00',
+    'percent': '0.00%',
+}
+
+# 검출 신뢰도 기록 자릿수 (표시 형식 0.0000과 동일, float 전체 자릿수는 파일 크기만 키움)
+CONFIDENCE_DIGITS = 4
+
+# 엑셀 시트에 직접 쓰는 상세 행 최대 수 (초과하면 사이드카 파일로 기록, 엑셀 한도 1,048,576행)
+DEFAULT_MAX_SHEET_ROWS = 100_000
+
+# 이미지별 검출 결과 상세 열 (사이드카 파일)
+DETECTION_DETAIL_COLUMNS = [
+    ('image_name', 'string'),
+    ('image_width', 'int'),
+    ('image_height', 'int'),
+    ('total_detections', 'int'),
+    ('unique_classes', 'int'),
+    ('confidence_min', 'float'),
+    ('confidence_max', 'float'),
+    ('confidence_avg', 'float'),
+]
+
+# 검출 단위 내보내기 열 (BI 도구용 사이드카 파일, match는 'TP'/'FP' 또는 빈 값)
+DETECTION_EXPORT_COLUMNS = [
+    ('image_name', 'string'),
+    ('file_classification', 'string'),
+    ('class', 'string'),
+    ('confidence', 'float'),
+    ('x1', 'float'),
+    ('y1', 'float'),
+    ('x2', 'float'),
+    ('y2', 'float'),
+    ('match', 'string'),
+    ('iou', 'float'),
+]
+
+
+def column_styles(base: str, formats: List[str]) -> List[str]:
+    """
+    열별 이름 있는 스타일 목록
+
+    Args:
+        base: 기본 스타일 (STYLE_DATA 또는 STYLE_TOTAL)
+        formats: 열별 NUMBER_FORMATS 키 (None이면 텍스트/일반)
+
+    Returns:
+        열별 스타일 이름 리스트
+    """
+    return [base if fmt is None else f'{base}_{fmt}' for fmt in formats]
 
 
 class ExcelReporter:
     """분석 결과를 Excel 파일로 생성하는 클래스"""
 
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, write_only: bool = True,
+                 max_sheet_rows: int = DEFAULT_MAX_SHEET_ROWS, detail_format: str = 'auto',
+                 detail_shard_rows: int = DEFAULT_SHARD_ROWS):
         """
         Args:
             output_dir: 엑셀 파일 저장 디렉토리
+            write_only: 스트리밍(write-only) 모드 사용 여부 (False면 메모리 내 워크북)
+            max_sheet_rows: 엑셀 시트에 직접 쓰는 상세 행 최대 수 (초과 시 사이드카 파일)
+            detail_format: 사이드카 형식 ('auto': pyarrow가 있으면 Parquet, 없으면 gzip CSV)
+            detail_shard_rows: 사이드카 샤드당 행 수
         """
         self.output_dir = output_dir or "D:/project/data-tools/outputs"
+        self.write_only = write_only
+        self.max_sheet_rows = max_sheet_rows
+        self.detail_format = detail_format
+        self.detail_shard_rows = detail_shard_rows
+        self._cell_cache = {}  # {(시트, 열, 스타일): 재사용 셀} (write-only 모드)
         os.makedirs(self.output_dir, exist_ok=True)
 
+        # openpyxl은 리포트 생성 단계에서만 로드 (CLI 시작 시간 단축)
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            print("[!] openpyxl not installed. Install it with: pip install openpyxl")
+            Workbook = None
+
         if Workbook is None:
             print("[!] Cannot create Excel reports without openpyxl")
             self.wb = None
         else:
-            self.wb = Workbook()
+            self.wb = Workbook(write_only=write_only)
+            if not write_only:
+                # 시트는 모두 create_sheet()로 생성 (write-only 모드와 시트 순서 동일)
+                self.wb.remove(self.wb.active)
+            self._register_styles()
 
-    def _get_styles(self):
-        """스타일 정의"""
-        header_font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    def _register_styles(self):
+        """이름 있는 셀 스타일을 워크북에 한 번 등록 (셀마다 Font/Border 객체를 만들지 않음)"""
+        from openpyxl.styles import NamedStyle, Font, PatternFill, Alignment, Border, Side
 
-        subheader_font = Font(name='Arial', size=10, bold=True)
+        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
         subheader_fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
-        subheader_alignment = Alignment(horizontal='center', vertical='center')
-
         data_alignment = Alignment(horizontal='center', vertical='center')
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        return {
-            'header_font': header_font,
-            'header_fill': header_fill,
-            'header_alignment': header_alignment,
-            'subheader_font': subheader_font,
-            'subheader_fill': subheader_fill,
-            'subheader_alignment': subheader_alignment,
-            'data_alignment': data_alignment,
-            'border': border,
-        }
-
-    def _apply_cell_style(self, cell, font=None, fill=None, alignment=None, border=None):
-        """셀에 스타일 적용"""
-        if font:
-            cell.font = font
-        if fill:
-            cell.fill = fill
-        if alignment:
-            cell.alignment = alignment
-        if border:
-            cell.border = border
-
-    def create_summary_sheet(self, results: Dict[str, Any], detector_summary: Dict[str, Any]):
-        """요약 시트 생성"""
-        if self.wb is None:
+        thin = Side(style='thin')
+        border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+        bold_font = Font(name='Arial', size=10, bold=True)
+        styles = [
+            NamedStyle(STYLE_TITLE, font=Font(name='Arial', size=14, bold=True),
+                       alignment=Alignment(horizontal='left', vertical='center')),
+            NamedStyle(STYLE_HEADER, font=Font(name='Arial', size=11, bold=True, color='FFFFFF'),
+                       fill=header_fill,
+                       alignment=Alignment(horizontal='center', vertical='center', wrap_text=True)),
+            NamedStyle(STYLE_SECTION, font=bold_font, fill=subheader_fill),
+            NamedStyle(STYLE_DATA, alignment=data_alignment, border=border),
+            NamedStyle(STYLE_TOTAL, font=bold_font, fill=subheader_fill, alignment=data_alignment, border=border),
+        ]
+        # 숫자 형식별 데이터/합계 스타일 (열 단위로 지정, 셀마다 형식 문자열을 만들지 않음)
+        for fmt, number_format in NUMBER_FORMATS.items():
+            styles.append(NamedStyle(f'{STYLE_DATA}_{fmt}', alignment=data_alignment, border=border,
+                                     number_format=number_format))
+            styles.append(NamedStyle(f'{STYLE_TOTAL}_{fmt}', font=bold_font, fill=subheader_fill,
+                                     alignment=data_alignment, border=border, number_format=number_format))
+        for style in styles:
+            self.wb.add_named_style(style)
+
+    def _create_sheet(self, title: str, column_widths: Dict[str, float]):
+        """
+        시트 생성 (write-only 모드는 첫 행 전에 열 너비를 지정해야 함)
+
+        Args:
+            title: 시트 이름
+            column_widths: {열 문자: 너비}
+
+        Returns:
+            워크시트
+        """
+        ws = self.wb.create_sheet(title)
+        for column, width in column_widths.items():
+            ws.column_dimensions[column].width = width
+        return ws
+
+    def _append_row(self, ws, values: List[Any], style=None):
+        """
+        행 추가
+
+        Args:
+            ws: 워크시트
+            values: 셀 값 리스트 (숫자는 숫자 그대로)
+            style: 이름 있는 스타일 (STYLE_*, 모든 셀) 또는 열별 스타일 리스트 (column_styles())
+        """
+        if style is None:
+            ws.append(values)
             return
 
-        ws = self.wb.active
-        ws.title = 'Summary'
+        styles = [style] * len(values) if isinstance(style, str) else style
+        cells = self._styled_cells(ws, styles)
+        for cell, value in zip(cells, values):
+            cell.value = value
+        ws.append(cells)
 
-        styles = self._get_styles()
+    def _styled_cells(self, ws, styles: List[str]) -> List[Any]:
+        """
+        열별 스타일이 적용된 셀 목록
+
+        write-only 모드는 append() 시점에 행을 바로 기록하므로 시트/열/스타일별 셀을
+        재사용한다 (셀마다 셀 생성과 스타일 조회를 반복하지 않음).
+        """
+        from openpyxl.cell import WriteOnlyCell
+
+        cells = []
+        for col_idx, style in enumerate(styles):
+            key = (ws.title, col_idx, style)
+            cell = self._cell_cache.get(key) if self.write_only else None
+            if cell is None:
+                cell = WriteOnlyCell(ws)
+                cell.style = style
+                if self.write_only:
+                    self._cell_cache[key] = cell
+            cells.append(cell)
+        return cells
+
+    def create_summary_sheet(self, results: Dict[str, Any], detector_summary: Dict[str, Any],
+                             detail_files: List[Dict[str, Any]] = None):
+        """
+        요약 시트 생성
+
+        Args:
+            results: 분석 결과
+            detector_summary: 검출 요약
+            detail_files: 사이드카 샤드 정보 (write_detection_details() 결과, 하이퍼링크로 표시)
+        """
+        if self.wb is None:
+            return
 
-        row = 1
+        ws = self._create_sheet('Summary', {'A': 20, 'B': 20, 'C': 15, 'D': 15})
 
         # 제목
-        ws.merge_cells(f'A{row}:D{row}')
-        cell = ws[f'A{row}']
-        cell.value = 'YOLO Detection Analysis Report'
-        cell.font = Font(name='Arial', size=14, bold=True)
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        row += 2
+        self._append_row(ws, ['YOLO Detection Analysis Report'], STYLE_TITLE)
+        ws.append([])
 
         # 생성 날짜
-        ws[f'A{row}'] = 'Report Generated:'
-        ws[f'B{row}'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        row += 2
+        ws.append(['Report Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+        ws.append([])
 
         # 전체 메트릭 섹션
-        ws[f'A{row}'] = 'Overall Metrics'
-        self._apply_cell_style(ws[f'A{row}'], font=styles['subheader_font'], fill=styles['subheader_fill'])
-        row += 1
+        self._append_row(ws, ['Overall Metrics'], STYLE_SECTION)
 
         overall = results['metrics']['overall']
-        metrics_data = [
-            ['Metric', 'Value'],
-            ['Precision', f"{overall['precision']:.4f}"],
-            ['Recall', f"{overall['recall']:.4f}"],
-            ['F1 Score', f"{overall['f1_score']:.4f}"],
-            ['True Positives (TP)', str(overall['tp'])],
-            ['False Positives (FP)', str(overall['fp'])],
-            ['False Negatives (FN)', str(overall['fn'])],
-        ]
-
-        for idx, data_row in enumerate(metrics_data):
-            ws[f'A{row}'] = data_row[0]
-            ws[f'B{row}'] = data_row[1]
-
-            if idx == 0:
-                self._apply_cell_style(ws[f'A{row}'], font=styles['header_font'], fill=styles['header_fill'],
-                                      alignment=styles['header_alignment'])
-                self._apply_cell_style(ws[f'B{row}'], font=styles['header_font'], fill=styles['header_fill'],
-                                      alignment=styles['header_alignment'])
-            row += 1
-
-        row += 1
-
-        # Detection Rate
-        ws[f'A{row}'] = 'Detection Rate (%)'
-        ws[f'B{row}'] = f"{results['detection_rate']:.2f}"
-        row += 2
+        decimal_row = column_styles(STYLE_DATA, [None, 'decimal'])
+        integer_row = column_styles(STYLE_DATA, [None, 'integer'])
+        self._append_row(ws, ['Metric', 'Value'], STYLE_HEADER)
+        self._append_row(ws, ['Precision', overall['precision']], decimal_row)
+        self._append_row(ws, ['Recall', overall['recall']], decimal_row)
+        self._append_row(ws, ['F1 Score', overall['f1_score']], decimal_row)
+        self._append_row(ws, ['True Positives (TP)', overall['tp']], integer_row)
+        self._append_row(ws, ['False Positives (FP)', overall['fp']], integer_row)
+        self._append_row(ws, ['False Negatives (FN)', overall['fn']], integer_row)
+        ws.append([])
+
+        # Detection Rate (분석 결과는 % 단위, 셀은 분수 + 백분율 형식)
+        self._append_row(ws, ['Detection Rate', results['detection_rate'] / 100],
+                         column_styles(STYLE_DATA, [None, 'percent']))
+        ws.append([])
 
         # 클래스별 메트릭
         if results['metrics']['per_class']:
-            ws[f'A{row}'] = 'Per-Class Metrics'
-            self._apply_cell_style(ws[f'A{row}'], font=styles['subheader_font'], fill=styles['subheader_fill'])
-            row += 1
-
-            class_metrics_data = [['Class', 'Precision', 'Recall', 'F1 Score', 'TP', 'FP', 'FN']]
+            self._append_row(ws, ['Per-Class Metrics'], STYLE_SECTION)
+            self._append_row(ws, ['Class', 'Precision', 'Recall', 'F1 Score', 'TP', 'FP', 'FN'], STYLE_HEADER)
 
+            row_styles = column_styles(STYLE_DATA, [None, 'decimal', 'decimal', 'decimal',
+                                                    'integer', 'integer', 'integer'])
             for class_name in sorted(results['metrics']['per_class'].keys()):
                 cm = results['metrics']['per_class'][class_name]
-                class_metrics_data.append([
+                self._append_row(ws, [
                     class_name,
-                    f"{cm['precision']:.4f}",
-                    f"{cm['recall']:.4f}",
-                    f"{cm['f1_score']:.4f}",
-                    str(cm['tp']),
-                    str(cm['fp']),
-                    str(cm['fn']),
-                ])
-
-            for idx, data_row in enumerate(class_metrics_data):
-                for col_idx, value in enumerate(data_row):
-                    cell = ws.cell(row=row, column=col_idx+1, value=value)
-                    if idx == 0:
-                        self._apply_cell_style(cell, font=styles['header_font'], fill=styles['header_fill'],
-                                              alignment=styles['header_alignment'])
-                    else:
-                        self._apply_cell_style(cell, alignment=styles['data_alignment'], border=styles['border'])
-                row += 1
-
-            row += 1
+                    cm['precision'],
+                    cm['recall'],
+                    cm['f1_score'],
+                    cm['tp'],
+                    cm['fp'],
+                    cm['fn'],
+                ], row_styles)
+
+            ws.append([])
 
         # AP Scores
         if results['ap_scores']:
-            ws[f'A{row}'] = 'Average Precision (AP)'
-            self._apply_cell_style(ws[f'A{row}'], font=styles['subheader_font'], fill=styles['subheader_fill'])
-            row += 1
-
-            ap_data = [['Class', 'AP Score']]
+            self._append_row(ws, ['Average Precision (AP)'], STYLE_SECTION)
+            self._append_row(ws, ['Class', 'AP Score'], STYLE_HEADER)
             for class_name in sorted(results['ap_scores'].keys()):
-                ap_data.append([class_name, f"{results['ap_scores'][class_name]:.4f}"])
-
-            for idx, data_row in enumerate(ap_data):
-                ws[f'A{row}'] = data_row[0]
-                ws[f'B{row}'] = data_row[1]
-
-                if idx == 0:
-                    self._apply_cell_style(ws[f'A{row}'], font=styles['header_font'], fill=styles['header_fill'],
-                                          alignment=styles['header_alignment'])
-                    self._apply_cell_style(ws[f'B{row}'], font=styles['header_font'], fill=styles['header_fill'],
-                                          alignment=styles['header_alignment'])
-                row += 1
-
-        # 열 너비 자동 조정
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
-
-    def create_detection_sheet(self, detection_results: List[Dict[str, Any]]):
-        """검출 결과 시트 생성"""
+                self._append_row(ws, [class_name, results['ap_scores'][class_name]], decimal_row)
+            ws.append([])
+
+        # 상세 데이터 사이드카 파일 (시트 행 한도 초과 시)
+        if detail_files:
+            from openpyxl.cell import WriteOnlyCell
+
+            self._append_row(ws, ['Detail Files'], STYLE_SECTION)
+            self._append_row(ws, ['File', 'Rows', 'Format'], STYLE_HEADER)
+            for shard in detail_files:
+                # 리포트 파일 기준 상대 경로 링크 (출력 폴더를 옮겨도 유지)
+                target = os.path.relpath(shard['path'], self.output_dir).replace(os.sep, '/')
+                if self.write_only:
+                    # write-only 셀은 append() 시점에 좌표가 정해지고 링크 ref도 그 좌표로 기록됨
+                    link = WriteOnlyCell(ws, value=target)
+                    link.hyperlink = target
+                    link.style = 'Hyperlink'
+                    ws.append([link, shard['rows'], shard['format']])
+                else:
+                    # 메모리 내 워크북은 분리된 셀의 링크 ref가 A1로 남으므로 추가된 셀에 설정
+                    ws.append([target, shard['rows'], shard['format']])
+                    link = ws.cell(row=ws.max_row, column=1)
+                    link.hyperlink = target
+                    link.style = 'Hyperlink'
+
+    @staticmethod
+    def _detection_detail_row(detection: Dict[str, Any]) -> List[Any]:
+        """이미지 검출 결과 → 상세 행 (DETECTION_DETAIL_COLUMNS 순서)"""
+        image_size = detection.get('image_size', {})
+
+        # 신뢰도 통계
+        confidences = [d['confidence'] for d in detection.get('detections', [])]
+        conf_min = round(min(confidences), CONFIDENCE_DIGITS) if confidences else 0
+        conf_max = round(max(confidences), CONFIDENCE_DIGITS) if confidences else 0
+        conf_avg = round(sum(confidences) / len(confidences), CONFIDENCE_DIGITS) if confidences else 0
+
+        return [
+            detection.get('image_name', 'Unknown'),
+            image_size.get('width', 0),
+            image_size.get('height', 0),
+            detection.get('total_detections', 0),
+            detection.get('unique_classes', 0),
+            conf_min,
+            conf_max,
+            conf_avg,
+        ]
+
+    def create_detection_sheet(self, detection_results: Iterable[Dict[str, Any]]):
+        """
+        검출 결과 시트 생성
+
+        Args:
+            detection_results: 이미지별 검출 결과 (리스트 또는 제너레이터, 한 행씩 바로 기록)
+        """
+        self._write_detection_sheet(self._detection_detail_row(detection) for detection in detection_results)
+
+    def _write_detection_sheet(self, detail_rows: Iterable[List[Any]]):
+        """상세 행(DETECTION_DETAIL_COLUMNS 순서)으로 검출 결과 시트 생성"""
         if self.wb is None:
             return
 
-        ws = self.wb.create_sheet('Detection Results')
-
-        styles = self._get_styles()
+        ws = self._create_sheet('Detection Results', {'A': 30, 'B': 15, 'C': 18, 'D': 18, 'E': 18, 'F': 18, 'G': 18})
 
         # 헤더
         headers = ['Image Name', 'Image Size', 'Total Detections', 'Classes', 'Confidence (Min)', 'Confidence (Max)', 'Confidence (Avg)']
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            self._apply_cell_style(cell, font=styles['header_font'], fill=styles['header_fill'],
-                                  alignment=styles['header_alignment'])
+        self._append_row(ws, headers, STYLE_HEADER)
 
         # 데이터
-        for row_idx, detection in enumerate(detection_results, 2):
-            image_name = detection.get('image_name', 'Unknown')
-            image_size = detection.get('image_size', {})
-            size_str = f"{image_size.get('width', 0)}x{image_size.get('height', 0)}"
-            total_det = detection.get('total_detections', 0)
-            classes = detection.get('unique_classes', 0)
-
-            # 신뢰도 통계
-            confidences = [d['confidence'] for d in detection.get('detections', [])]
-            conf_min = min(confidences) if confidences else 0
-            conf_max = max(confidences) if confidences else 0
-            conf_avg = sum(confidences) / len(confidences) if confidences else 0
-
-            row_data = [
+        row_styles = column_styles(STYLE_DATA, [None, None, 'integer', 'integer', 'decimal', 'decimal', 'decimal'])
+        for image_name, width, height, total_det, classes, conf_min, conf_max, conf_avg in detail_rows:
+            self._append_row(ws, [
                 image_name,
-                size_str,
-                str(total_det),
-                str(classes),
-                f"{conf_min:.4f}",
-                f"{conf_max:.4f}",
-                f"{conf_avg:.4f}",
-            ]
-
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                self._apply_cell_style(cell, alignment=styles['data_alignment'], border=styles['border'])
-
-        # 열 너비
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 15
-        for col in ['C', 'D', 'E', 'F', 'G']:
-            ws.column_dimensions[col].width = 18
+                f"{width}x{height}",
+                total_det,
+                classes,
+                conf_min,
+                conf_max,
+                conf_avg,
+            ], row_styles)
+
+    def write_detection_details(self, detection_results: Iterable[Dict[str, Any]],
+                                detail_dir: str) -> Tuple[Optional[List[List[Any]]], List[Dict[str, Any]]]:
+        """
+        검출 결과 상세 행을 시트용/사이드카용으로 분배
+
+        max_sheet_rows행까지는 메모리에 모아 시트용으로 반환하고, 초과하면 모은 행과
+        나머지 행을 모두 사이드카 샤드(detail_dir)로 스트리밍 기록한다.
+
+        Args:
+            detection_results: 이미지별 검출 결과 (리스트 또는 제너레이터)
+            detail_dir: 사이드카 샤드 디렉토리
+
+        Returns:
+            (시트에 쓸 상세 행 또는 None, 사이드카 샤드 정보 리스트)
+        """
+        rows = []
+        writer = None
+        for detection in detection_results:
+            row = self._detection_detail_row(detection)
+            if writer is not None:
+                writer.write_row(row)
+                continue
+
+            rows.append(row)
+            if len(rows) > self.max_sheet_rows:
+                writer = ShardedTableWriter(detail_dir, 'detection_results', DETECTION_DETAIL_COLUMNS,
+                                            shard_rows=self.detail_shard_rows, detail_format=self.detail_format)
+                writer.write_rows(rows)
+                rows = None
+
+        if writer is None:
+            return rows, []
+
+        shards = writer.close()
+        print(f"[+] {writer.total_rows:,} detection rows exceed {self.max_sheet_rows:,} sheet rows, "
+              f"written to {len(shards)} {writer.format} shard(s) in {detail_dir}")
+        return None, shards
 
     def create_class_distribution_sheet(self, class_distribution: Dict[str, int]):
         """클래스 분포 시트 생성"""
         if self.wb is None:
             return
 
-        ws = self.wb.create_sheet('Class Distribution')
-
-        styles = self._get_styles()
+        ws = self._create_sheet('Class Distribution', {'A': 25, 'B': 15, 'C': 15})
 
         # 헤더
-        headers = ['Class', 'Count', 'Percentage']
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            self._apply_cell_style(cell, font=styles['header_font'], fill=styles['header_fill'],
-                                  alignment=styles['header_alignment'])
+        self._append_row(ws, ['Class', 'Count', 'Percentage'], STYLE_HEADER)
 
         # 데이터
+        row_styles = column_styles(STYLE_DATA, [None, 'integer', 'percent'])
         total_count = sum(class_distribution.values())
-        for row_idx, (class_name, count) in enumerate(sorted(class_distribution.items(), key=lambda x: x[1], reverse=True), 2):
-            percentage = (count / total_count * 100) if total_count > 0 else 0
-
-            ws.cell(row=row_idx, column=1, value=class_name)
-            ws.cell(row=row_idx, column=2, value=count)
-            ws.cell(row=row_idx, column=3, value=f"{percentage:.2f}%")
-
-            for col in range(1, 4):
-                cell = ws.cell(row=row_idx, column=col)
-                self._apply_cell_style(cell, alignment=styles['data_alignment'], border=styles['border'])
+        for class_name, count in sorted(class_distribution.items(), key=lambda x: x[1], reverse=True):
+            fraction = count / total_count if total_count > 0 else 0
+            self._append_row(ws, [class_name, count, fraction], row_styles)
 
         # 합계
-        total_row = len(class_distribution) + 2
-        ws.cell(row=total_row, column=1, value='Total')
-        ws.cell(row=total_row, column=2, value=total_count)
-
-        for col in range(1, 4):
-            cell = ws.cell(row=total_row, column=col)
-            self._apply_cell_style(cell, font=styles['subheader_font'], fill=styles['subheader_fill'],
-                                  alignment=styles['data_alignment'], border=styles['border'])
-
-        # 열 너비
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
+        self._append_row(ws, ['Total', total_count, None], column_styles(STYLE_TOTAL, [None, 'integer', None]))
 
     def create_file_type_sheet(self, file_type_distribution: Dict[str, int]):
         """파일 종류 시트 생성"""
         if self.wb is None:
             return
 
-        ws = self.wb.create_sheet('File Types')
-
-        styles = self._get_styles()
+        ws = self._create_sheet('File Types', {'A': 20, 'B': 15, 'C': 15})
 
         # 헤더
-        headers = ['File Type', 'Count', 'Percentage']
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            self._apply_cell_style(cell, font=styles['header_font'], fill=styles['header_fill'],
-                                  alignment=styles['header_alignment'])
+        self._append_row(ws, ['File Type', 'Count', 'Percentage'], STYLE_HEADER)
 
         # 데이터
+        row_styles = column_styles(STYLE_DATA, [None, 'integer', 'percent'])
         total_count = sum(file_type_distribution.values())
-        for row_idx, (file_type, count) in enumerate(sorted(file_type_distribution.items(), key=lambda x: x[1], reverse=True), 2):
-            percentage = (count / total_count * 100) if total_count > 0 else 0
-
-            ws.cell(row=row_idx, column=1, value=file_type)
-            ws.cell(row=row_idx, column=2, value=count)
-            ws.cell(row=row_idx, column=3, value=f"{percentage:.2f}%")
-
-            for col in range(1, 4):
-                cell = ws.cell(row=row_idx, column=col)
-                self._apply_cell_style(cell, alignment=styles['data_alignment'], border=styles['border'])
-
-        # 열 너비
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
+        for file_type, count in sorted(file_type_distribution.items(), key=lambda x: x[1], reverse=True):
+            fraction = count / total_count if total_count > 0 else 0
+            self._append_row(ws, [file_type, count, fraction], row_styles)
 
     def create_file_classification_sheet(self, file_classification_stats: Dict[str, int],
-                                        file_classification_distribution: Dict[str, int] = None):
-        """파일명 분류 시트 생성"""
+                                        file_classification_distribution: Dict[str, int] = None,
+                                        file_classification_levels: Dict[str, Dict[str, Dict[str, int]]] = None):
+        """파일명 분류 시트 생성 (계층 레벨별 세부 집계 포함)"""
         if self.wb is None:
             return
 
-        ws = self.wb.create_sheet('File Classification')
-
-        styles = self._get_styles()
+        ws = self._create_sheet('File Classification', {
+            'A': 25,
+            'B': 25 if file_classification_levels else 15,
+            'C': 15,
+            'D': 15,
+        })
 
         # 헤더
         if file_classification_distribution:
             headers = ['Classification Type', 'Files Count', 'Objects Count', 'Percentage']
         else:
             headers = ['Classification Type', 'Count', 'Percentage']
-
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            self._apply_cell_style(cell, font=styles['header_font'], fill=styles['header_fill'],
-                                  alignment=styles['header_alignment'])
+        self._append_row(ws, headers, STYLE_HEADER)
 
         # 데이터
-        total_count = sum(file_classification_stats.values())
-        for row_idx, (classification, count) in enumerate(sorted(file_classification_stats.items(), key=lambda x: x[1], reverse=True), 2):
-            percentage = (count / total_count * 100) if total_count > 0 else 0
+        if file_classification_distribution:
+            formats = [None, 'integer', 'integer', 'percent']
+        else:
+            formats = [None, 'integer', 'percent']
+        row_styles = column_styles(STYLE_DATA, formats)
 
-            ws.cell(row=row_idx, column=1, value=classification)
-            ws.cell(row=row_idx, column=2, value=count)
+        total_count = sum(file_classification_stats.values())
+        for classification, count in sorted(file_classification_stats.items(), key=lambda x: x[1], reverse=True):
+            fraction = count / total_count if total_count > 0 else 0
 
             if file_classification_distribution:
                 obj_count = file_classification_distribution.get(classification, 0)
-                ws.cell(row=row_idx, column=3, value=obj_count)
-                ws.cell(row=row_idx, column=4, value=f"{percentage:.2f}%")
-
-                for col in range(1, 5):
-                    cell = ws.cell(row=row_idx, column=col)
-                    self._apply_cell_style(cell, alignment=styles['data_alignment'], border=styles['border'])
+                values = [classification, count, obj_count, fraction]
             else:
-                ws.cell(row=row_idx, column=3, value=f"{percentage:.2f}%")
-
-                for col in range(1, 4):
-                    cell = ws.cell(row=row_idx, column=col)
-                    self._apply_cell_style(cell, alignment=styles['data_alignment'], border=styles['border'])
+                values = [classification, count, fraction]
+            self._append_row(ws, values, row_styles)
 
         # 합계
-        total_row = len(file_classification_stats) + 2
-        ws.cell(row=total_row, column=1, value='Total')
-        ws.cell(row=total_row, column=2, value=total_count)
-
+        total_styles = column_styles(STYLE_TOTAL, formats[:-1] + [None])
         if file_classification_distribution:
             total_objects = sum(file_classification_distribution.values())
-            ws.cell(row=total_row, column=3, value=total_objects)
-
-            for col in range(1, 5):
-                cell = ws.cell(row=total_row, column=col)
-                self._apply_cell_style(cell, font=styles['subheader_font'], fill=styles['subheader_fill'],
-                                      alignment=styles['data_alignment'], border=styles['border'])
+            self._append_row(ws, ['Total', total_count, total_objects, None], total_styles)
         else:
-            for col in range(1, 4):
-                cell = ws.cell(row=total_row, column=col)
-                self._apply_cell_style(cell, font=styles['subheader_font'], fill=styles['subheader_fill'],
-                                      alignment=styles['data_alignment'], border=styles['border'])
-
-        # 열 너비
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 15
-        if file_classification_distribution:
-            ws.column_dimensions['C'].width = 15
-            ws.column_dimensions['D'].width = 15
+            self._append_row(ws, ['Total', total_count, None], total_styles)
+
+        # 계층 레벨별 세부 집계 (line → product → lot)
+        if file_classification_levels:
+            ws.append([])
+            self._append_row(ws, ['Hierarchy Breakdown'], STYLE_SECTION)
+            self._append_row(ws, ['Level', 'Key', 'Files Count', 'Objects Count'], STYLE_HEADER)
+
+            level_styles = column_styles(STYLE_DATA, [None, None, 'integer', 'integer'])
+            for level, breakdown in file_classification_levels.items():
+                for key, counts in breakdown.items():
+                    self._append_row(ws, [level, key, counts['files'], counts['objects']], level_styles)
+
+    def create_threshold_sweep_sheet(self, sweep_rows: List[Dict[str, Any]]):
+        """신뢰도 임계값 스윕 시트 생성 (임계값별 메트릭 표)"""
+        if self.wb is None or not sweep_rows:
+            return
+
+        # Ground Truth가 없으면 검출 수 열만 포함
+        has_metrics = 'precision' in sweep_rows[0]
+        if has_metrics:
+            headers = ['Confidence', 'Precision', 'Recall', 'F1 Score', 'mAP', 'TP', 'FP', 'FN',
+                       'Detections', 'Images with Detections']
+            formats = ['threshold', 'decimal', 'decimal', 'decimal', 'decimal',
+                       'integer', 'integer', 'integer', 'integer', 'integer']
         else:
-            ws.column_dimensions['C'].width = 15
+            headers = ['Confidence', 'Detections', 'Images with Detections', 'Detection Rate']
+            formats = ['threshold', 'integer', 'integer', 'percent']
+        row_styles = column_styles(STYLE_DATA, formats)
+        best_styles = column_styles(STYLE_TOTAL, formats)
+
+        column_widths = {chr(64 + col_idx): 15 for col_idx in range(1, len(headers) + 1)}
+        column_widths[chr(64 + len(headers))] = 22
+        ws = self._create_sheet('Threshold Sweep', column_widths)
+
+        self._append_row(ws, headers, STYLE_HEADER)
+
+        # 최고 F1 임계값 행 강조
+        best_index = max(range(len(sweep_rows)), key=lambda i: sweep_rows[i]['f1_score']) if has_metrics else None
+
+        for index, row in enumerate(sweep_rows):
+            if has_metrics:
+                values = [
+                    row['confidence'],
+                    row['precision'],
+                    row['recall'],
+                    row['f1_score'],
+                    row['mAP'],
+                    row['tp'],
+                    row['fp'],
+                    row['fn'],
+                    row['detections'],
+                    row['images_with_detections'],
+                ]
+            else:
+                values = [
+                    row['confidence'],
+                    row['detections'],
+                    row['images_with_detections'],
+                    row['detection_rate'] / 100,
+                ]
+
+            self._append_row(ws, values, best_styles if index == best_index else row_styles)
 
     def save_report(self, filename: str = None) -> str:
         """엑셀 파일 저장"""
@@ -411,17 +551,61 @@ class ExcelReporter:
             print(f"[!] Error saving Excel report: {e}")
             return None
 
+    def write_detection_export(self, export_rows: Iterable[Tuple], detail_dir: str) -> List[Dict[str, Any]]:
+        """
+        검출 단위 내보내기 (모든 박스를 DETECTION_EXPORT_COLUMNS 순서로 사이드카 샤드에 기록)
+
+        Args:
+            export_rows: DETECTION_EXPORT_COLUMNS 순서의 행 튜플 (제너레이터 권장)
+            detail_dir: 사이드카 샤드 디렉토리
+
+        Returns:
+            사이드카 샤드 정보 리스트
+        """
+        with ShardedTableWriter(detail_dir, 'detections', DETECTION_EXPORT_COLUMNS,
+                                shard_rows=self.detail_shard_rows, detail_format=self.detail_format) as writer:
+            writer.write_rows(export_rows)
+
+        print(f"[+] Exported {writer.total_rows:,} detections to {len(writer.shards)} {writer.format} "
+              f"shard(s) in {detail_dir}")
+        return writer.shards
+
     def generate_full_report(self, results: Dict[str, Any], detection_results: List[Dict[str, Any]] = None,
-                           detector_summary: Dict[str, Any] = None, filename: str = None) -> str:
-        """전체 리포트 생성"""
+                           detector_summary: Dict[str, Any] = None, filename: str = None,
+                           detection_export_rows: Iterable[Tuple] = None) -> str:
+        """
+        전체 리포트 생성
+
+        Args:
+            results: 분석 결과
+            detection_results: 이미지별 검출 결과
+            detector_summary: 검출 요약
+            filename: 리포트 파일 이름 (None이면 시각 기반)
+            detection_export_rows: 검출 단위 내보내기 행 (지정하면 사이드카로 기록하고 요약 시트에서 링크)
+
+        Returns:
+            저장된 리포트 경로
+        """
         print("[*] Generating Excel report...")
 
+        if filename is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f'YOLO_Analysis_Report_{timestamp}.xlsx'
+
+        # 검출 상세 (시트 행 한도를 넘으면 '<리포트명>_detail/' 사이드카로, 요약 시트에서 링크)
+        detail_dir = os.path.join(self.output_dir, os.path.splitext(filename)[0] + '_detail')
+        sheet_rows, detail_files = None, []
+        if detection_results:
+            sheet_rows, detail_files = self.write_detection_details(detection_results, detail_dir)
+        if detection_export_rows is not None:
+            detail_files = detail_files + self.write_detection_export(detection_export_rows, detail_dir)
+
         # 요약 시트
-        self.create_summary_sheet(results, detector_summary)
+        self.create_summary_sheet(results, detector_summary, detail_files)
 
         # 검출 결과 시트
-        if detection_results:
-            self.create_detection_sheet(detection_results)
+        if sheet_rows:
+            self._write_detection_sheet(sheet_rows)
 
         # 클래스 분포 시트
         if detector_summary and 'class_distribution' in detector_summary:
@@ -435,9 +619,14 @@ class ExcelReporter:
         if detector_summary and 'file_classification_stats' in detector_summary:
             self.create_file_classification_sheet(
                 detector_summary['file_classification_stats'],
-                detector_summary.get('file_classification_distribution', {})
+                detector_summary.get('file_classification_distribution', {}),
+                detector_summary.get('file_classification_levels', {})
             )
 
+        # 신뢰도 임계값 스윕 시트
+        if results.get('threshold_sweep'):
+            self.create_threshold_sweep_sheet(results['threshold_sweep'])
+
         # 저장
         return self.save_report(filename)
 
@@ -494,6 +683,27 @@ def main():
     report_path = reporter.generate_full_report(sample_results, sample_detections, sample_summary)
     print(f"[+] Report generated: {report_path}")
 
+    # 사이드카 링크: write-only / 메모리 내 모드의 링크 위치와 대상이 같은지 확인
+    import tempfile
+    from openpyxl import load_workbook
+
+    links = {}
+    for write_only in (True, False):
+        with tempfile.TemporaryDirectory() as output_dir:
+            mode_reporter = ExcelReporter(output_dir, write_only=write_only)
+            detail_files = [{'path': os.path.join(output_dir, 'details', f'part-{index:05d}.csv.gz'),
+                             'rows': 1000, 'format': 'csv.gz'} for index in range(3)]
+            mode_reporter.create_summary_sheet(sample_results, sample_summary, detail_files)
+            workbook = load_workbook(mode_reporter.save_report('links.xlsx'))
+            links[write_only] = [(cell.coordinate, cell.value, cell.hyperlink.target)
+                                 for row in workbook['Summary'].iter_rows() for cell in row if cell.hyperlink]
+            workbook.close()
+
+    if links[True] == links[False] and len(links[True]) == 3 and all(value == target for _, value, target in links[True]):
+        print(f"[+] Detail file links match in both modes: {[coordinate for coordinate, _, _ in links[True]]}")
+    else:
+        print(f"[!] Detail file links differ: write-only={links[True]} in-memory={links[False]}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,155 @@
+"""
+Run Metrics - 파이프라인 단계별 시간/처리량 계측 모듈
+단계별 wall/CPU 시간, 이미지 처리 속도, 이미지별 지연 분위수, 최대 메모리(RSS) 기록
+"""
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any
+
+from quantile_sketch import KLLSketch
+
+
+def get_peak_rss_mb() -> float:
+    """
+    현재 프로세스의 최대 RSS (MB)
+
+    Returns:
+        최대 RSS (측정할 수 없으면 None)
+    """
+    try:
+        import psutil
+
+        memory_info = psutil.Process().memory_info()
+        # Windows만 최대 값(peak_wset)을 제공 (다른 OS의 rss는 현재 값이므로 사용하지 않음)
+        if hasattr(memory_info, 'peak_wset'):
+            return memory_info.peak_wset / (1024 * 1024)
+    except ImportError:
+        pass
+
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 bytes, Linux는 KB 단위
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        return None
+
+
+class RunMetrics:
+    """파이프라인 실행 계측 기록기"""
+
+    def __init__(self):
+        """초기화"""
+        self.stages = {}  # {stage_name: {'wall': float, 'cpu': float, 'calls': int}}
+        self.image_latency = KLLSketch()  # 이미지별 검출 지연 (초)
+        self.images = 0
+        self.started_at = datetime.now()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def add_stage_time(self, name: str, wall: float, cpu: float = 0.0):
+        """
+        단계 시간 누적
+
+        Args:
+            name: 단계 이름 (예: 'inference')
+            wall: 경과 시간 (초)
+            cpu: CPU 시간 (초)
+        """
+        stage = self.stages.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'calls': 0})
+        stage['wall'] += wall
+        stage['cpu'] += cpu
+        stage['calls'] += 1
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        with 블록의 wall/CPU 시간을 단계 시간으로 누적
+
+        Args:
+            name: 단계 이름
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    def record_image(self, latency: float):
+        """
+        이미지 한 장 처리 완료 기록
+
+        Args:
+            latency: 이미지 처리 지연 (초)
+        """
+        self.images += 1
+        self.image_latency.add(latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 계측 결과"""
+        total_wall = time.perf_counter() - self._wall_start
+        total_cpu = time.process_time() - self._cpu_start
+        detection_wall = sum(self.stages.get(name, {}).get('wall', 0.0)
+                             for name in ('decode', 'inference', 'postprocess', 'remote_detection'))
+        p50, p95 = self.image_latency.quantiles([0.5, 0.95])
+
+        return {
+            'started_at': self.started_at.isoformat(),
+            'total_wall_seconds': total_wall,
+            'total_cpu_seconds': total_cpu,
+            'images': self.images,
+            'images_per_second': self.images / detection_wall if detection_wall > 0 else 0.0,
+            'image_latency_ms': {
+                'p50': p50 * 1000,
+                'p95': p95 * 1000,
+            },
+            'peak_rss_mb': get_peak_rss_mb(),
+            'stages': {
+                name: {
+                    'wall_seconds': stage['wall'],
+                    'cpu_seconds': stage['cpu'],
+                    'calls': stage['calls'],
+                }
+                for name, stage in self.stages.items()
+            },
+        }
+
+    def save(self, output_dir: str, filename: str = 'run_metrics.json') -> str:
+        """
+        계측 결과를 JSON으로 저장
+
+        Args:
+            output_dir: 저장 디렉토리 (리포트와 같은 위치)
+            filename: 파일명
+
+        Returns:
+            저장된 파일 경로
+        """
+        output_path = os.path.join(output_dir, filename)
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return output_path
+
+    def print_summary(self):
+        """계측 요약 출력"""
+        data = self.to_dict()
+
+        print(f"\nRun Metrics:")
+        print(f"  - Total time: {data['total_wall_seconds']:.2f}s wall, {data['total_cpu_seconds']:.2f}s CPU")
+        print(f"  - Throughput: {data['images_per_second']:.2f} images/sec ({data['images']} images)")
+        print(f"  - Per-image latency: p50 {data['image_latency_ms']['p50']:.1f}ms, "
+              f"p95 {data['image_latency_ms']['p95']:.1f}ms")
+        if data['peak_rss_mb'] is not None:
+            print(f"  - Peak RSS: {data['peak_rss_mb']:.1f} MB")
+
+        print(f"  {'Stage':<18} {'Wall (s)':>10} {'CPU (s)':>10} {'Calls':>8}")
+        for name, stage in data['stages'].items():
+            print(f"  {name:<18} {stage['wall_seconds']:>10.3f} {stage['cpu_seconds']:>10.3f} {stage['calls']:>8}")
@@ -0,0 +1,107 @@
+"""
+Startup Benchmark - CLI 시작 시간(import 비용) 측정 및 예산 검사
+`python -X importtime`으로 main.py import 비용을 측정하고, 무거운 의존성이
+시작 시점에 로드되지 않는지 확인 (예산 초과 시 종료 코드 1)
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시점에 로드되면 안 되는 모듈 (해당 단계에서만 로드)
+HEAVY_MODULES = ('cv2', 'numpy', 'matplotlib', 'openpyxl', 'torch', 'ultralytics', 'onnxruntime', 'openvino')
+
+DEFAULT_BUDGET_MS = 300.0
+
+
+def measure_import_time(module: str = 'main') -> Tuple[float, Dict[str, float]]:
+    """
+    새 인터프리터에서 모듈 import 비용 측정
+
+    Args:
+        module: import할 모듈 이름 (PROJECT_ROOT 기준)
+
+    Returns:
+        (전체 누적 시간 ms, {모듈명: 누적 시간 ms})
+    """
+    code = f"import {module}"
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{completed.stderr}")
+
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        cumulative[name.strip()] = int(cumulative_us) / 1000.0
+
+    return cumulative.get(module, 0.0), cumulative
+
+
+def measure_help_time(runs: int = 3) -> float:
+    """
+    `main.py --help` 실행 시간 측정 (인터프리터 시작 포함, 최소값)
+
+    Args:
+        runs: 반복 횟수
+
+    Returns:
+        최소 실행 시간 (ms)
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, 'main.py'), '--help'],
+                       cwd=PROJECT_ROOT, capture_output=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def find_heavy_imports(cumulative: Dict[str, float]) -> List[str]:
+    """시작 시점에 로드된 무거운 모듈 목록"""
+    return sorted({name.split('.')[0] for name in cumulative} & set(HEAVY_MODULES))
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='CLI startup time benchmark')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Import time budget for main.py in ms (default: {DEFAULT_BUDGET_MS:.0f})')
+    parser.add_argument('--top', type=int, default=10, help='Number of slowest imports to show')
+    args = parser.parse_args()
+
+    print("[*] Measuring main.py import time (python -X importtime)...")
+    total_ms, cumulative = measure_import_time('main')
+    help_ms = measure_help_time()
+
+    print(f"    [+] import main: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"    [+] main.py --help: {help_ms:.1f} ms (including interpreter startup)")
+
+    print(f"\n  {'Module':<40} {'Cumulative (ms)':>16}")
+    slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+    for name, ms in slowest[1:args.top + 1]:
+        print(f"  {name:<40} {ms:>16.1f}")
+
+    failed = False
+    heavy = find_heavy_imports(cumulative)
+    if heavy:
+        print(f"\n[!] Heavy modules imported at startup: {', '.join(heavy)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"\n[!] Startup import time over budget: {total_ms:.1f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+
+    if not failed:
+        print("\n[+] Startup benchmark passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,35 +3,749 @@ Visualizer - 분석 결과 시각화 모듈 (그래프, 차트)
 """
 
 import os
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import numpy as np
-from typing import Dict, List, Any
+import re
+import json
+import hashlib
+from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple
 from pathlib import Path
+from detection_stats import ConfidenceHistogram
+
+# 차트 기본 저장 설정 (차트별로 chart_options에서 변경 가능)
+DEFAULT_CHART_DPI = 300
+DEFAULT_CHART_FORMAT = 'png'
+CHART_FORMATS = ('png', 'svg')
+
+# 클래스가 많은 차트 설정: 상위 K개 + Other, 전체 클래스는 페이지별 차트로 분할
+DEFAULT_TOP_K = 20
+DEFAULT_PAGE_SIZE = 50
+OTHER_LABEL = 'Other'
+# 막대 값 라벨(bar_label)을 표시할 최대 막대 수
+MAX_BAR_LABELS = 40
+
+# 그리기 함수의 스타일/레이아웃이 바뀌면 올려서 기존 캐시 무효화
+CHART_CACHE_VERSION = 2
+CHART_CACHE_MANIFEST = 'chart_cache.json'
+# 페이지 차트({이름}_pNN) 기본 이름 (이번 실행에서 만들지 않은 페이지는 이전 실행의 잔여물)
+PAGED_CHARTS = ('per_class_metrics', 'detection_class_distribution', 'defect_type_distribution')
+_PAGE_FILE_PATTERN = re.compile(r'^(%s)_p\d{2,}\.(%s)$' % ('|'.join(PAGED_CHARTS), '|'.join(CHART_FORMATS)))
+
+
+def _setup_fonts():
+    """한글 폰트 설정"""
+    import matplotlib
+
+    try:
+        # Windows 기본 한글 폰트
+        matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans']
+        matplotlib.rcParams['axes.unicode_minus'] = False
+    except:
+        pass
+
+
+def _colormap(name: str, count: int):
+    """컬러맵에서 count개의 색 추출"""
+    import matplotlib
+    import numpy as np
+
+    return matplotlib.colormaps[name](np.linspace(0, 1, count))
+
+
+def top_k_with_other(distribution: Dict[str, int], k: int = None) -> Dict[str, int]:
+    """
+    값이 큰 상위 K개 항목 + 나머지 합계('Other')
+
+    Args:
+        distribution: {라벨: 개수}
+        k: 남길 항목 수 (None이거나 항목 수가 K 이하면 그대로 반환)
+
+    Returns:
+        축약된 분포 (상위 K개는 개수 내림차순, 마지막에 Other)
+    """
+    if k is None or len(distribution) <= k:
+        return dict(distribution)
+
+    items = sorted(distribution.items(), key=lambda item: item[1], reverse=True)
+    reduced = dict(items[:k])
+    reduced[OTHER_LABEL] = reduced.get(OTHER_LABEL, 0) + sum(count for _, count in items[k:])
+    return reduced
+
+
+def top_k_class_metrics(per_class: Dict[str, Dict[str, float]], ap_scores: Dict[str, float],
+                        k: int = None) -> Tuple[Dict[str, Dict[str, float]], Dict[str, float]]:
+    """
+    샘플 수(TP+FN) 기준 상위 K개 클래스의 메트릭 + 나머지 클래스 'Other' 집계
+
+    Other의 precision/recall은 나머지 클래스 TP/FP/FN 합으로 계산(micro average)하고,
+    AP는 나머지 클래스 AP 평균을 사용한다.
+
+    Args:
+        per_class: 클래스별 메트릭
+        ap_scores: 클래스별 AP
+        k: 남길 클래스 수
+
+    Returns:
+        (축약된 per_class, 축약된 ap_scores)
+    """
+    names = list(dict.fromkeys(list(per_class) + list(ap_scores)))
+    if k is None or len(names) <= k:
+        return dict(per_class), dict(ap_scores)
+
+    def support(name):
+        metrics = per_class.get(name, {})
+        return metrics.get('tp', 0) + metrics.get('fn', 0)
+
+    ranked = sorted(names, key=support, reverse=True)
+    top, rest = ranked[:k], ranked[k:]
+
+    reduced_metrics = {name: per_class[name] for name in top if name in per_class}
+    reduced_ap = {name: ap_scores[name] for name in top if name in ap_scores}
+
+    rest_metrics = [per_class[name] for name in rest if name in per_class]
+    if rest_metrics:
+        tp = sum(m.get('tp', 0) for m in rest_metrics)
+        fp = sum(m.get('fp', 0) for m in rest_metrics)
+        fn = sum(m.get('fn', 0) for m in rest_metrics)
+        if tp + fp + fn:
+            precision = tp / (tp + fp) if tp + fp else 0.0
+            recall = tp / (tp + fn) if tp + fn else 0.0
+        else:
+            precision = sum(m['precision'] for m in rest_metrics) / len(rest_metrics)
+            recall = sum(m['recall'] for m in rest_metrics) / len(rest_metrics)
+        reduced_metrics[OTHER_LABEL] = {'precision': precision, 'recall': recall, 'tp': tp, 'fp': fp, 'fn': fn}
+
+    rest_ap = [ap_scores[name] for name in rest if name in ap_scores]
+    if rest_ap:
+        reduced_ap[OTHER_LABEL] = sum(rest_ap) / len(rest_ap)
+
+    return reduced_metrics, reduced_ap
+
+
+def paginate(items: List[Any], page_size: int) -> List[List[Any]]:
+    """리스트를 page_size개씩 나누기"""
+    return [items[start:start + page_size] for start in range(0, len(items), page_size)]
+
+
+def _grouped_bar(ax, labels: List[str], series: List[Tuple[str, List[float], str]], width: float = 0.8):
+    """
+    여러 계열의 묶음 막대를 bar 한 번 호출로 그리기
+
+    Args:
+        ax: Axes
+        labels: x축 라벨
+        series: [(계열 이름, 값 리스트, 색)]
+        width: 한 묶음 전체 폭
+    """
+    import numpy as np
+    from matplotlib.patches import Patch
+
+    n_series = len(series)
+    bar_width = width / n_series
+    x = np.arange(len(labels))
+    offsets = (np.arange(n_series) - (n_series - 1) / 2) * bar_width
+
+    positions = np.concatenate([x + offset for offset in offsets])
+    heights = np.concatenate([np.asarray(values, dtype=float) for _, values, _ in series])
+    colors = np.repeat([color for _, _, color in series], len(labels))
+
+    ax.bar(positions, heights, bar_width, color=colors, alpha=0.8)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=45, ha='right')
+    ax.legend(handles=[Patch(color=color, alpha=0.8, label=name) for name, _, color in series])
+
+
+def _draw_metrics_summary(fig, overall: Dict[str, Any], per_class: Dict[str, Dict[str, float]],
+                          ap_scores: Dict[str, float]):
+    """성능 메트릭 요약 (2x2)"""
+    axes = fig.subplots(2, 2)
+    fig.suptitle('Detection Performance Metrics', fontsize=16, fontweight='bold')
+
+    # 1. Overall Metrics (Precision, Recall, F1)
+    metrics = ['Precision', 'Recall', 'F1 Score']
+    values = [overall['precision'], overall['recall'], overall['f1_score']]
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+
+    bars = axes[0, 0].bar(metrics, values, color=colors, alpha=0.7, edgecolor='black')
+    axes[0, 0].bar_label(bars, fmt='%.3f', padding=2, fontweight='bold')
+    axes[0, 0].set_ylabel('Score')
+    axes[0, 0].set_title('Overall Metrics')
+    axes[0, 0].set_ylim([0, 1.1])
+
+    # 2. Confusion Matrix (TP, FP, FN)
+    tp = overall['tp']
+    fp = overall['fp']
+    fn = overall['fn']
+    confusion_values = [tp, fp, fn]
+    confusion_labels = [f'TP\n{tp}', f'FP\n{fp}', f'FN\n{fn}']
+    colors2 = ['#2ECC71', '#E74C3C', '#F39C12']
+
+    axes[0, 1].bar(confusion_labels, confusion_values, color=colors2, alpha=0.7, edgecolor='black')
+    axes[0, 1].set_ylabel('Count')
+    axes[0, 1].set_title('Confusion Matrix')
+
+    # 3. Per-Class Precision & Recall (상위 K개 + Other, 막대는 bar 한 번 호출)
+    if per_class:
+        class_names = list(per_class.keys())
+        _grouped_bar(axes[1, 0], class_names, [
+            ('Precision', [per_class[c]['precision'] for c in class_names], '#3498DB'),
+            ('Recall', [per_class[c]['recall'] for c in class_names], '#E67E22'),
+        ], width=0.7)
+        axes[1, 0].set_ylabel('Score')
+        axes[1, 0].set_title('Per-Class Metrics')
+        axes[1, 0].set_ylim([0, 1.1])
+
+    # 4. AP Scores
+    if ap_scores:
+        ap_names = list(ap_scores.keys())
+        ap_values = list(ap_scores.values())
+
+        bars = axes[1, 1].barh(ap_names, ap_values, color='#9B59B6', alpha=0.7, edgecolor='black')
+        if len(ap_values) <= MAX_BAR_LABELS:
+            axes[1, 1].bar_label(bars, fmt='%.3f', padding=2, fontweight='bold')
+        axes[1, 1].set_xlabel('AP Score')
+        axes[1, 1].set_title('Average Precision (AP) by Class')
+        axes[1, 1].set_xlim([0, 1.1])
+
+
+def _draw_per_class_metrics(fig, class_names: List[str], precisions: List[float], recalls: List[float],
+                            ap_values: List[float], title: str):
+    """클래스별 Precision/Recall/AP 페이지 차트"""
+    ax = fig.subplots()
+
+    _grouped_bar(ax, class_names, [
+        ('Precision', precisions, '#3498DB'),
+        ('Recall', recalls, '#E67E22'),
+        ('AP', ap_values, '#9B59B6'),
+    ])
+    ax.set_ylabel('Score', fontweight='bold')
+    ax.set_ylim([0, 1.1])
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+
+
+def _draw_detection_rate(fig, detection_rate: float):
+    """검출률 원형 차트"""
+    ax = fig.subplots()
+
+    sizes = [detection_rate, 100 - detection_rate]
+    labels = [f'Detected\n{detection_rate:.1f}%', f'Not Detected\n{100-detection_rate:.1f}%']
+    colors = ['#2ECC71', '#E74C3C']
+    explode = (0.05, 0)
+
+    wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+                                        explode=explode, startangle=90, textprops={'fontsize': 12})
+
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+
+    ax.set_title('Object Detection Rate', fontsize=14, fontweight='bold', pad=20)
+
+
+def _draw_class_distribution(fig, class_distribution: Dict[str, int], title: str):
+    """클래스 분포 막대 그래프 (bar 한 번 호출, 값 라벨은 bar_label)"""
+    ax = fig.subplots()
+
+    classes = list(class_distribution.keys())
+    counts = list(class_distribution.values())
+
+    bars = ax.bar(range(len(classes)), counts, color=_colormap('Set3', len(classes)), alpha=0.8, edgecolor='black')
+
+    # 값 표시
+    if len(classes) <= MAX_BAR_LABELS:
+        ax.bar_label(bars, fmt='%d', fontweight='bold')
+
+    ax.set_xlabel('Class', fontweight='bold')
+    ax.set_ylabel('Count', fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    ax.set_xticks(range(len(classes)))
+    ax.set_xticklabels(classes, rotation=45, ha='right')
+
+
+def _draw_confidence_distribution(fig, bin_edges: List[float], counts: List[int], mean: float,
+                                  median: float, p1: float = None, p99: float = None):
+    """신뢰도 히스토그램"""
+    import numpy as np
+
+    ax = fig.subplots()
+    bin_edges = np.asarray(bin_edges)
+
+    ax.bar(bin_edges[:-1], counts, width=np.diff(bin_edges), align='edge',
+           color='#3498DB', alpha=0.7, edgecolor='black')
+
+    ax.axvline(mean, color='#E74C3C', linestyle='--', linewidth=2, label=f'Mean: {mean:.3f}')
+    ax.axvline(median, color='#F39C12', linestyle='--', linewidth=2, label=f'Median: {median:.3f}')
+    if p1 is not None:
+        ax.axvline(p1, color='#7F8C8D', linestyle=':', linewidth=1.5, label=f"P1: {p1:.3f}")
+    if p99 is not None:
+        ax.axvline(p99, color='#7F8C8D', linestyle='-.', linewidth=1.5, label=f"P99: {p99:.3f}")
+
+    ax.set_xlabel('Confidence Score', fontweight='bold')
+    ax.set_ylabel('Frequency', fontweight='bold')
+    ax.set_title('Confidence Score Distribution', fontsize=14, fontweight='bold', pad=20)
+    ax.legend()
+
+
+def _draw_file_type_analysis(fig, file_type_distribution: Dict[str, int]):
+    """파일 종류 원형 차트"""
+    ax = fig.subplots()
+
+    file_types = list(file_type_distribution.keys())
+    counts = list(file_type_distribution.values())
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
+    if len(file_types) > len(colors):
+        colors = colors + list(_colormap('Set2', len(file_types) - len(colors)))
+
+    wedges, texts, autotexts = ax.pie(counts, labels=file_types, colors=colors[:len(file_types)],
+                                       autopct='%1.1f%%', startangle=90)
+
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+
+    ax.set_title('File Type Distribution', fontsize=14, fontweight='bold', pad=20)
+
+
+def _draw_file_classification_analysis(fig, file_classification_stats: Dict[str, int],
+                                       file_classification_distribution: Dict[str, int] = None):
+    """파일명 분류별 파일 수 / 객체 수"""
+    axes = fig.subplots(1, 2 if file_classification_distribution else 1, squeeze=False)[0]
+
+    # 1. 파일명 분류별 파일 수
+    classifications = list(file_classification_stats.keys())
+    file_counts = list(file_classification_stats.values())
+    colors = _colormap('Set3', len(classifications))
+
+    bars = axes[0].bar(classifications, file_counts, color=colors, alpha=0.8, edgecolor='black')
+    if len(classifications) <= MAX_BAR_LABELS:
+        axes[0].bar_label(bars, fmt='%d', fontweight='bold')
+    axes[0].set_xlabel('File Classification', fontweight='bold')
+    axes[0].set_ylabel('Number of Files', fontweight='bold')
+    axes[0].set_title('Files by Classification Type', fontsize=12, fontweight='bold')
+    axes[0].tick_params(axis='x', rotation=45)
+
+    # 2. 파일명 분류별 객체 수
+    if file_classification_distribution:
+        object_counts = [file_classification_distribution.get(c, 0) for c in classifications]
+        bars = axes[1].bar(classifications, object_counts, color=colors, alpha=0.8, edgecolor='black')
+        if len(classifications) <= MAX_BAR_LABELS:
+            axes[1].bar_label(bars, fmt='%d', fontweight='bold')
+        axes[1].set_xlabel('File Classification', fontweight='bold')
+        axes[1].set_ylabel('Number of Objects', fontweight='bold')
+        axes[1].set_title('Objects Detected by Classification Type', fontsize=12, fontweight='bold')
+        axes[1].tick_params(axis='x', rotation=45)
+
+
+def _draw_pr_curves(fig, pr_curves: Dict[str, Dict[str, List[float]]], overall_pr_curve: Dict[str, List[float]] = None):
+    """클래스별 Precision-Recall 곡선"""
+    ax = fig.subplots()
+    colors = _colormap('tab20', max(len(pr_curves), 1))
+
+    for color, (class_name, curve) in zip(colors, pr_curves.items()):
+        ax.plot(curve['recall'], curve['precision'], color=color, linewidth=1.2, alpha=0.8, label=class_name)
+    if overall_pr_curve:
+        ax.plot(overall_pr_curve['recall'], overall_pr_curve['precision'], color='black', linewidth=2.5,
+                label='All classes')
+
+    ax.set_xlabel('Recall', fontweight='bold')
+    ax.set_ylabel('Precision', fontweight='bold')
+    ax.set_xlim([0, 1.0])
+    ax.set_ylim([0, 1.05])
+    ax.grid(alpha=0.3)
+    ax.set_title('Precision-Recall Curve', fontsize=14, fontweight='bold', pad=20)
+    ax.legend(loc='center left', bbox_to_anchor=(1.01, 0.5), fontsize=8)
+
+
+def _draw_f1_confidence(fig, pr_curves: Dict[str, Dict[str, List[float]]], overall_pr_curve: Dict[str, List[float]] = None,
+                        best_confidence: Dict[str, float] = None):
+    """신뢰도 임계값별 F1 곡선 (최적 임계값 표시)"""
+    ax = fig.subplots()
+    colors = _colormap('tab20', max(len(pr_curves), 1))
+
+    for color, (class_name, curve) in zip(colors, pr_curves.items()):
+        ax.plot(curve['confidence'], curve['f1'], color=color, linewidth=1.2, alpha=0.8, label=class_name)
+    if overall_pr_curve:
+        ax.plot(overall_pr_curve['confidence'], overall_pr_curve['f1'], color='black', linewidth=2.5,
+                label='All classes')
+    if best_confidence:
+        ax.axvline(best_confidence['confidence'], color='#E74C3C', linestyle='--', linewidth=1.5,
+                   label=f"Best: {best_confidence['confidence']:.3f} (F1 {best_confidence['f1_score']:.3f})")
+
+    ax.set_xlabel('Confidence Threshold', fontweight='bold')
+    ax.set_ylabel('F1 Score', fontweight='bold')
+    ax.set_xlim([0, 1.0])
+    ax.set_ylim([0, 1.05])
+    ax.grid(alpha=0.3)
+    ax.set_title('F1 Score vs Confidence Threshold', fontsize=14, fontweight='bold', pad=20)
+    ax.legend(loc='center left', bbox_to_anchor=(1.01, 0.5), fontsize=8)
+
+
+# 차트 종류별 그리기 함수 (작업자 프로세스에서 이름으로 조회)
+CHART_RENDERERS = {
+    'metrics_summary': _draw_metrics_summary,
+    'detection_rate': _draw_detection_rate,
+    'per_class_metrics': _draw_per_class_metrics,
+    'class_distribution': _draw_class_distribution,
+    'confidence_distribution': _draw_confidence_distribution,
+    'file_type_analysis': _draw_file_type_analysis,
+    'file_classification_analysis': _draw_file_classification_analysis,
+    'pr_curves': _draw_pr_curves,
+    'f1_confidence': _draw_f1_confidence,
+}
+
+
+def render_chart(task: Dict[str, Any]) -> str:
+    """
+    차트 하나를 렌더링하여 저장 (프로세스 풀 작업 단위)
+
+    pyplot 전역 상태 대신 Figure 객체와 Agg 캔버스를 직접 사용하므로
+    여러 프로세스/스레드에서 동시에 호출해도 안전하다.
+
+    Args:
+        task: {'kind', 'data', 'figsize', 'dpi', 'format', 'output_path'}
+
+    Returns:
+        저장된 파일 경로
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    _setup_fonts()
+
+    fig = Figure(figsize=task['figsize'])
+    FigureCanvasAgg(fig)
+    CHART_RENDERERS[task['kind']](fig, **task['data'])
+    fig.tight_layout()
+    fig.savefig(task['output_path'], dpi=task['dpi'], format=task['format'], bbox_inches='tight')
+    return task['output_path']
+
+
+class ChartRenderCache:
+    """
+    차트 렌더링 캐시
+
+    차트 입력 데이터와 스타일 파라미터(종류, 크기, DPI, 형식)의 해시를 매니페스트에
+    기록하고, 같은 해시의 이미지가 출력 디렉토리에 그대로 있으면 렌더링을 건너뛴다.
+    """
+
+    def __init__(self, output_dir: str, filename: str = CHART_CACHE_MANIFEST):
+        """
+        Args:
+            output_dir: 차트 출력 디렉토리 (매니페스트도 같은 위치에 저장)
+            filename: 매니페스트 파일명
+        """
+        self.manifest_path = os.path.join(output_dir, filename)
+        self.charts = {}  # {파일명: {'hash', 'size', 'kind', 'rendered_at'}}
+        self.total_hits = 0
+        self.total_misses = 0
+        self.hits = 0  # 이번 실행
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+
+        if manifest.get('version') != CHART_CACHE_VERSION:
+            return
+        self.charts = manifest.get('charts', {})
+        self.total_hits = manifest.get('stats', {}).get('total_hits', 0)
+        self.total_misses = manifest.get('stats', {}).get('total_misses', 0)
+
+    @staticmethod
+    def task_hash(task: Dict[str, Any]) -> str:
+        """차트 작업의 입력 데이터 + 스타일 파라미터 해시"""
+        key = {
+            'version': CHART_CACHE_VERSION,
+            'kind': task['kind'],
+            'data': task['data'],
+            'figsize': list(task['figsize']),
+            'dpi': task['dpi'],
+            'format': task['format'],
+        }
+        encoded = json.dumps(key, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def lookup(self, task: Dict[str, Any]) -> bool:
+        """
+        캐시된 최신 이미지가 있는지 확인하고 hit/miss 집계
+
+        Args:
+            task: render_chart() 작업
+
+        Returns:
+            렌더링을 건너뛸 수 있으면 True
+        """
+        task['hash'] = self.task_hash(task)
+        entry = self.charts.get(os.path.basename(task['output_path']))
+
+        hit = False
+        if entry and entry['hash'] == task['hash']:
+            try:
+                hit = os.path.getsize(task['output_path']) == entry['size']
+            except OSError:
+                hit = False
+
+        if hit:
+            self.hits += 1
+            self.total_hits += 1
+        else:
+            self.misses += 1
+            self.total_misses += 1
+        return hit
+
+    def store(self, task: Dict[str, Any]):
+        """렌더링 완료된 차트 기록"""
+        self.charts[os.path.basename(task['output_path'])] = {
+            'hash': task.get('hash') or self.task_hash(task),
+            'size': os.path.getsize(task['output_path']),
+            'kind': task['kind'],
+            'rendered_at': datetime.now().isoformat(),
+        }
+
+    def forget(self, filename: str):
+        """삭제된 차트 기록 제거"""
+        self.charts.pop(filename, None)
+
+    def save(self):
+        """매니페스트 저장"""
+        manifest = {
+            'version': CHART_CACHE_VERSION,
+            'charts': self.charts,
+            'stats': {
+                'hits': self.hits,
+                'misses': self.misses,
+                'total_hits': self.total_hits,
+                'total_misses': self.total_misses,
+            },
+        }
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
 
 
 class ResultVisualizer:
     """분석 결과를 시각화하는 클래스"""
 
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, dpi: int = DEFAULT_CHART_DPI, chart_format: str = DEFAULT_CHART_FORMAT,
+                 chart_options: Dict[str, Dict[str, Any]] = None, max_workers: int = None,
+                 use_cache: bool = True, top_k: int = DEFAULT_TOP_K, page_size: int = DEFAULT_PAGE_SIZE):
         """
         Args:
             output_dir: 그래프 저장 디렉토리
+            dpi: 기본 저장 해상도
+            chart_format: 기본 저장 형식 ('png' 또는 'svg')
+            chart_options: 차트별 저장 설정 (예: {'metrics_summary': {'dpi': 150, 'format': 'svg'}})
+            max_workers: 렌더링 프로세스 수 (None이면 CPU 수, 0이면 현재 프로세스에서 순차 렌더링)
+            use_cache: 입력 데이터가 같은 차트의 재렌더링 생략 여부
+            top_k: 클래스별 차트에 표시할 최대 클래스 수 (나머지는 'Other'로 합산, None이면 전체)
+            page_size: 클래스가 top_k보다 많을 때 전체 클래스를 나눠 그릴 페이지당 클래스 수 (0이면 페이지 차트 생략)
         """
         self.output_dir = output_dir or "D:/project/data-tools/outputs"
         os.makedirs(self.output_dir, exist_ok=True)
 
-        # 한글 폰트 설정
-        self._setup_fonts()
+        if chart_format not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format: {chart_format} (use one of {CHART_FORMATS})")
 
-    def _setup_fonts(self):
-        """한글 폰트 설정"""
-        try:
-            # Windows 기본 한글 폰트
-            plt.rcParams['font.sans-serif'] = ['DejaVu Sans']
-            plt.rcParams['axes.unicode_minus'] = False
-        except:
-            pass
+        self.dpi = dpi
+        self.chart_format = chart_format
+        self.chart_options = chart_options or {}
+        self.max_workers = max_workers
+        self.top_k = top_k
+        self.page_size = page_size
+        self.cache = ChartRenderCache(self.output_dir) if use_cache else None
+        self._executor = None
+
+    def _make_task(self, name: str, kind: str, data: Dict[str, Any], figsize: Tuple[float, float]) -> Dict[str, Any]:
+        """
+        렌더링 작업 생성
+
+        Args:
+            name: 차트 이름 (파일명 및 chart_options 키)
+            kind: CHART_RENDERERS 키
+            data: 그리기 함수 인자
+            figsize: 그림 크기 (인치)
+
+        Returns:
+            render_chart() 작업 딕셔너리
+        """
+        options = self.chart_options.get(name, {})
+        chart_format = options.get('format', self.chart_format)
+        if chart_format not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format for {name}: {chart_format}")
+
+        return {
+            'name': name,
+            'kind': kind,
+            'data': data,
+            'figsize': figsize,
+            'dpi': options.get('dpi', self.dpi),
+            'format': chart_format,
+            'output_path': os.path.join(self.output_dir, f'{name}.{chart_format}'),
+        }
+
+    def _needs_pages(self, count: int) -> bool:
+        return bool(self.page_size) and self.top_k is not None and count > self.top_k
+
+    def _metrics_summary_task(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        per_class, ap_scores = top_k_class_metrics(results['metrics']['per_class'], results['ap_scores'], self.top_k)
+        return self._make_task('metrics_summary', 'metrics_summary', {
+            'overall': results['metrics']['overall'],
+            'per_class': per_class,
+            'ap_scores': ap_scores,
+        }, (14, 10))
+
+    def _per_class_metrics_tasks(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """클래스가 top_k보다 많을 때 전체 클래스 메트릭 페이지 차트"""
+        per_class = results['metrics']['per_class']
+        ap_scores = results['ap_scores']
+        class_names = sorted(per_class)
+        if not self._needs_pages(len(class_names)):
+            return []
+
+        pages = paginate(class_names, self.page_size)
+        return [
+            self._make_task(f'per_class_metrics_p{index:02d}', 'per_class_metrics', {
+                'class_names': names,
+                'precisions': [per_class[c]['precision'] for c in names],
+                'recalls': [per_class[c]['recall'] for c in names],
+                'ap_values': [ap_scores.get(c, 0.0) for c in names],
+                'title': f'Per-Class Metrics ({index}/{len(pages)})',
+            }, (16, 6))
+            for index, names in enumerate(pages, 1)
+        ]
+
+    def _detection_rate_task(self, detection_rate: float) -> Dict[str, Any]:
+        return self._make_task('detection_rate', 'detection_rate',
+                               {'detection_rate': detection_rate}, (10, 6))
+
+    def _pr_curve_tasks(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Precision-Recall 곡선 / F1-신뢰도 곡선 (Ground Truth 기반 분석 결과가 있을 때만)"""
+        pr_curves = results.get('pr_curves')
+        overall_pr_curve = results.get('overall_pr_curve')
+        if not pr_curves and not overall_pr_curve:
+            return []
+
+        # 클래스가 많으면 샘플 수(TP+FN) 상위 K개 클래스만 표시
+        pr_curves = pr_curves or {}
+        if self.top_k is not None and len(pr_curves) > self.top_k:
+            per_class = results['metrics']['per_class']
+            ranked = sorted(pr_curves, key=lambda c: per_class.get(c, {}).get('tp', 0) + per_class.get(c, {}).get('fn', 0),
+                            reverse=True)
+            pr_curves = {class_name: pr_curves[class_name] for class_name in ranked[:self.top_k]}
+        else:
+            pr_curves = dict(sorted(pr_curves.items()))
+
+        return [
+            self._make_task('pr_curves', 'pr_curves', {
+                'pr_curves': pr_curves,
+                'overall_pr_curve': overall_pr_curve,
+            }, (12, 8)),
+            self._make_task('f1_confidence', 'f1_confidence', {
+                'pr_curves': pr_curves,
+                'overall_pr_curve': overall_pr_curve,
+                'best_confidence': results.get('best_confidence'),
+            }, (12, 8)),
+        ]
+
+    def _class_distribution_tasks(self, class_distribution: Dict[str, int], title: str) -> List[Dict[str, Any]]:
+        """클래스 분포 차트 (상위 K개 + Other) 및 전체 클래스 페이지 차트"""
+        if not class_distribution:
+            print("[!] No class distribution data to visualize")
+            return []
+
+        name = title.lower().replace(" ", "_")
+        tasks = [self._make_task(name, 'class_distribution', {
+            'class_distribution': top_k_with_other(class_distribution, self.top_k),
+            'title': title,
+        }, (12, 6))]
+
+        if self._needs_pages(len(class_distribution)):
+            items = sorted(class_distribution.items(), key=lambda item: item[1], reverse=True)
+            pages = paginate(items, self.page_size)
+            tasks.extend(
+                self._make_task(f'{name}_p{index:02d}', 'class_distribution', {
+                    'class_distribution': dict(page),
+                    'title': f'{title} ({index}/{len(pages)})',
+                }, (16, 6))
+                for index, page in enumerate(pages, 1)
+            )
+        return tasks
+
+    def _confidence_distribution_task(self, confidence_scores: List[float] = None,
+                                      confidence_histogram: Dict[str, Any] = None,
+                                      confidence_stats: Dict[str, float] = None) -> Dict[str, Any]:
+        if confidence_histogram is None and confidence_scores:
+            histogram = ConfidenceHistogram()
+            for score in confidence_scores:
+                histogram.add(score)
+            confidence_histogram = histogram.to_dict()
+
+        if not confidence_histogram or not confidence_histogram['count']:
+            print("[!] No confidence scores to visualize")
+            return None
+
+        if confidence_stats and 'p50' in confidence_stats:
+            median = confidence_stats['p50']
+        else:
+            median = ConfidenceHistogram.from_dict(confidence_histogram).quantile(0.5)
+
+        return self._make_task('confidence_distribution', 'confidence_distribution', {
+            'bin_edges': confidence_histogram['bin_edges'],
+            'counts': confidence_histogram['counts'],
+            'mean': confidence_histogram['sum'] / confidence_histogram['count'],
+            'median': median,
+            'p1': confidence_stats.get('p1') if confidence_stats else None,
+            'p99': confidence_stats.get('p99') if confidence_stats else None,
+        }, (12, 6))
+
+    def _file_type_task(self, file_type_distribution: Dict[str, int]) -> Dict[str, Any]:
+        if not file_type_distribution:
+            print("[!] No file type data to visualize")
+            return None
+
+        return self._make_task('file_type_distribution', 'file_type_analysis',
+                               {'file_type_distribution': file_type_distribution}, (10, 8))
+
+    def _file_classification_task(self, file_classification_stats: Dict[str, int],
+                                  file_classification_distribution: Dict[str, int] = None) -> Dict[str, Any]:
+        if not file_classification_stats:
+            print("[!] No file classification data to visualize")
+            return None
+
+        reduced_stats = top_k_with_other(file_classification_stats, self.top_k)
+        reduced_distribution = None
+        if file_classification_distribution:
+            reduced_distribution = {key: file_classification_distribution.get(key, 0)
+                                    for key in reduced_stats if key in file_classification_stats}
+            if len(reduced_distribution) < len(reduced_stats):
+                kept = set(reduced_distribution)
+                reduced_distribution[OTHER_LABEL] = sum(count for key, count in file_classification_distribution.items()
+                                                        if key not in kept)
+
+        return self._make_task('file_classification_analysis', 'file_classification_analysis', {
+            'file_classification_stats': reduced_stats,
+            'file_classification_distribution': reduced_distribution,
+        }, (14, 6) if file_classification_distribution else (10, 6))
+
+    def _render_now(self, task: Dict[str, Any], label: str) -> str:
+        """현재 프로세스에서 바로 렌더링 (개별 plot_* 호출용)"""
+        if task is None:
+            return None
+
+        if self.cache is not None and self.cache.lookup(task):
+            print(f"[*] {label} unchanged, using cached {task['output_path']}")
+            self.cache.save()
+            return task['output_path']
+
+        output_path = render_chart(task)
+        print(f"[+] {label} saved to {output_path}")
+        if self.cache is not None:
+            self.cache.store(task)
+            self.cache.save()
+        return output_path
 
     def plot_metrics_summary(self, results: Dict[str, Any]) -> str:
         """
@@ -43,71 +757,9 @@ class ResultVisualizer:
         Returns:
             저장된 파일 경로
         """
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle('Detection Performance Metrics', fontsize=16, fontweight='bold')
-
-        # 1. Overall Metrics (Precision, Recall, F1)
-        overall = results['metrics']['overall']
-        metrics = ['Precision', 'Recall', 'F1 Score']
-        values = [overall['precision'], overall['recall'], overall['f1_score']]
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-
-        axes[0, 0].bar(metrics, values, color=colors, alpha=0.7, edgecolor='black')
-        axes[0, 0].set_ylabel('Score')
-        axes[0, 0].set_title('Overall Metrics')
-        axes[0, 0].set_ylim([0, 1.1])
-        for i, v in enumerate(values):
-            axes[0, 0].text(i, v + 0.02, f'{v:.3f}', ha='center', fontweight='bold')
-
-        # 2. Confusion Matrix (TP, FP, FN)
-        tp = overall['tp']
-        fp = overall['fp']
-        fn = overall['fn']
-        confusion_values = [tp, fp, fn]
-        confusion_labels = [f'TP\n{tp}', f'FP\n{fp}', f'FN\n{fn}']
-        colors2 = ['#2ECC71', '#E74C3C', '#F39C12']
-
-        axes[0, 1].bar(confusion_labels, confusion_values, color=colors2, alpha=0.7, edgecolor='black')
-        axes[0, 1].set_ylabel('Count')
-        axes[0, 1].set_title('Confusion Matrix')
-
-        # 3. Per-Class Precision & Recall
-        if results['metrics']['per_class']:
-            class_names = list(results['metrics']['per_class'].keys())
-            precisions = [results['metrics']['per_class'][c]['precision'] for c in class_names]
-            recalls = [results['metrics']['per_class'][c]['recall'] for c in class_names]
-
-            x = np.arange(len(class_names))
-            width = 0.35
-
-            axes[1, 0].bar(x - width/2, precisions, width, label='Precision', alpha=0.8, color='#3498DB')
-            axes[1, 0].bar(x + width/2, recalls, width, label='Recall', alpha=0.8, color='#E67E22')
-            axes[1, 0].set_ylabel('Score')
-            axes[1, 0].set_title('Per-Class Metrics')
-            axes[1, 0].set_xticks(x)
-            axes[1, 0].set_xticklabels(class_names, rotation=45, ha='right')
-            axes[1, 0].legend()
-            axes[1, 0].set_ylim([0, 1.1])
-
-        # 4. AP Scores
-        if results['ap_scores']:
-            ap_names = list(results['ap_scores'].keys())
-            ap_values = list(results['ap_scores'].values())
-
-            axes[1, 1].barh(ap_names, ap_values, color='#9B59B6', alpha=0.7, edgecolor='black')
-            axes[1, 1].set_xlabel('AP Score')
-            axes[1, 1].set_title('Average Precision (AP) by Class')
-            axes[1, 1].set_xlim([0, 1.1])
-            for i, v in enumerate(ap_values):
-                axes[1, 1].text(v + 0.02, i, f'{v:.3f}', va='center', fontweight='bold')
-
-        plt.tight_layout()
-        output_path = os.path.join(self.output_dir, 'metrics_summary.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        print(f"[+] Metrics summary saved to {output_path}")
-        return output_path
+        for task in self._per_class_metrics_tasks(results):
+            self._render_now(task, 'Per-class metrics page')
+        return self._render_now(self._metrics_summary_task(results), 'Metrics summary')
 
     def plot_detection_rate(self, detection_rate: float) -> str:
         """
@@ -119,30 +771,7 @@ class ResultVisualizer:
         Returns:
             저장된 파일 경로
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        # 원형 차트
-        sizes = [detection_rate, 100 - detection_rate]
-        labels = [f'Detected\n{detection_rate:.1f}%', f'Not Detected\n{100-detection_rate:.1f}%']
-        colors = ['#2ECC71', '#E74C3C']
-        explode = (0.05, 0)
-
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
-                                            explode=explode, startangle=90, textprops={'fontsize': 12})
-
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-
-        ax.set_title('Object Detection Rate', fontsize=14, fontweight='bold', pad=20)
-
-        plt.tight_layout()
-        output_path = os.path.join(self.output_dir, 'detection_rate.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        print(f"[+] Detection rate visualization saved to {output_path}")
-        return output_path
+        return self._render_now(self._detection_rate_task(detection_rate), 'Detection rate visualization')
 
     def plot_class_distribution(self, class_distribution: Dict[str, int], title: str = 'Class Distribution') -> str:
         """
@@ -155,71 +784,38 @@ class ResultVisualizer:
         Returns:
             저장된 파일 경로
         """
-        if not class_distribution:
-            print("[!] No class distribution data to visualize")
-            return None
-
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        classes = list(class_distribution.keys())
-        counts = list(class_distribution.values())
-        colors = plt.cm.Set3(np.linspace(0, 1, len(classes)))
-
-        bars = ax.bar(classes, counts, color=colors, alpha=0.8, edgecolor='black')
-
-        # 값 표시
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontweight='bold')
+        paths = [self._render_now(task, 'Class distribution')
+                 for task in self._class_distribution_tasks(class_distribution, title)]
+        return paths[0] if paths else None
 
-        ax.set_xlabel('Class', fontweight='bold')
-        ax.set_ylabel('Count', fontweight='bold')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        plt.xticks(rotation=45, ha='right')
-
-        plt.tight_layout()
-        output_path = os.path.join(self.output_dir, f'{title.lower().replace(" ", "_")}.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        print(f"[+] Class distribution saved to {output_path}")
-        return output_path
-
-    def plot_confidence_distribution(self, confidence_scores: List[float]) -> str:
+    def plot_confidence_distribution(self, confidence_scores: List[float] = None,
+                                     confidence_histogram: Dict[str, Any] = None,
+                                     confidence_stats: Dict[str, float] = None) -> str:
         """
         신뢰도 분포 시각화
 
         Args:
             confidence_scores: 신뢰도 점수 리스트
+            confidence_histogram: 고정 bin 히스토그램 (ConfidenceHistogram.to_dict() 형식)
+            confidence_stats: 분위수 스케치 기반 통계 (p1/p50/p99, 있으면 히스토그램 추정 대신 사용)
 
         Returns:
             저장된 파일 경로
         """
-        if not confidence_scores:
-            print("[!] No confidence scores to visualize")
-            return None
-
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        ax.hist(confidence_scores, bins=30, color='#3498DB', alpha=0.7, edgecolor='black')
+        task = self._confidence_distribution_task(confidence_scores, confidence_histogram, confidence_stats)
+        return self._render_now(task, 'Confidence distribution')
 
-        ax.axvline(np.mean(confidence_scores), color='#E74C3C', linestyle='--', linewidth=2, label=f'Mean: {np.mean(confidence_scores):.3f}')
-        ax.axvline(np.median(confidence_scores), color='#F39C12', linestyle='--', linewidth=2, label=f'Median: {np.median(confidence_scores):.3f}')
-
-        ax.set_xlabel('Confidence Score', fontweight='bold')
-        ax.set_ylabel('Frequency', fontweight='bold')
-        ax.set_title('Confidence Score Distribution', fontsize=14, fontweight='bold', pad=20)
-        ax.legend()
+    def plot_pr_curves(self, results: Dict[str, Any]) -> List[str]:
+        """
+        Precision-Recall 곡선 및 F1-신뢰도 곡선 시각화
 
-        plt.tight_layout()
-        output_path = os.path.join(self.output_dir, 'confidence_distribution.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        Args:
+            results: DetectionAnalyzer.analyze_all() 결과 (pr_curves 포함)
 
-        print(f"[+] Confidence distribution saved to {output_path}")
-        return output_path
+        Returns:
+            저장된 파일 경로 리스트
+        """
+        return [self._render_now(task, 'Curve') for task in self._pr_curve_tasks(results)]
 
     def plot_file_type_analysis(self, file_type_distribution: Dict[str, int]) -> str:
         """
@@ -231,33 +827,7 @@ class ResultVisualizer:
         Returns:
             저장된 파일 경로
         """
-        if not file_type_distribution:
-            print("[!] No file type data to visualize")
-            return None
-
-        fig, ax = plt.subplots(figsize=(10, 8))
-
-        file_types = list(file_type_distribution.keys())
-        counts = list(file_type_distribution.values())
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
-        colors = colors[:len(file_types)] + [plt.cm.Set2(i) for i in range(max(0, len(file_types) - 5))]
-
-        wedges, texts, autotexts = ax.pie(counts, labels=file_types, colors=colors[:len(file_types)],
-                                           autopct='%1.1f%%', startangle=90)
-
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-
-        ax.set_title('File Type Distribution', fontsize=14, fontweight='bold', pad=20)
-
-        plt.tight_layout()
-        output_path = os.path.join(self.output_dir, 'file_type_distribution.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        print(f"[+] File type distribution saved to {output_path}")
-        return output_path
+        return self._render_now(self._file_type_task(file_type_distribution), 'File type distribution')
 
     def plot_defect_type_analysis(self, defect_distribution: Dict[str, int]) -> str:
         """
@@ -283,48 +853,159 @@ class ResultVisualizer:
         Returns:
             저장된 파일 경로
         """
-        if not file_classification_stats:
-            print("[!] No file classification data to visualize")
-            return None
-
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-
-        # 1. 파일명 분류별 파일 수
-        classifications = list(file_classification_stats.keys())
-        file_counts = list(file_classification_stats.values())
-        colors = plt.cm.Set3(np.linspace(0, 1, len(classifications)))
+        task = self._file_classification_task(file_classification_stats, file_classification_distribution)
+        return self._render_now(task, 'File classification analysis')
+
+    def _build_report_tasks(self, results: Dict[str, Any], detector_summary: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """create_full_report()에서 생성할 차트 작업 목록"""
+        tasks = [
+            # 1. 메트릭 요약
+            self._metrics_summary_task(results),
+            # 2. 검출률
+            self._detection_rate_task(results['detection_rate']),
+        ]
+        # 클래스가 많으면 전체 클래스 메트릭 페이지
+        tasks.extend(self._per_class_metrics_tasks(results))
+        # Precision-Recall / F1-신뢰도 곡선
+        tasks.extend(self._pr_curve_tasks(results))
+
+        if detector_summary:
+            # 3. 클래스 분포
+            if 'class_distribution' in detector_summary:
+                tasks.extend(self._class_distribution_tasks(detector_summary['class_distribution'],
+                                                            'Detection Class Distribution'))
+
+            # 4. 신뢰도 분포 (detector_summary의 히스토그램 사용)
+            if 'confidence_histogram' in detector_summary or 'all_confidences' in detector_summary:
+                tasks.append(self._confidence_distribution_task(
+                    detector_summary.get('all_confidences'),
+                    confidence_histogram=detector_summary.get('confidence_histogram'),
+                    confidence_stats=detector_summary.get('confidence_stats')
+                ))
+
+            # 5. 파일 종류 분포
+            if 'file_type_distribution' in detector_summary:
+                tasks.append(self._file_type_task(detector_summary['file_type_distribution']))
+
+            # 6. 불량 유형 분포 (클래스 분포와 동일)
+            if 'class_distribution' in detector_summary:
+                tasks.extend(self._class_distribution_tasks(detector_summary['class_distribution'],
+                                                            'Defect Type Distribution'))
+
+            # 7. 파일명 분류 분석
+            if 'file_classification_stats' in detector_summary:
+                tasks.append(self._file_classification_task(
+                    detector_summary['file_classification_stats'],
+                    detector_summary.get('file_classification_distribution', {})
+                ))
+
+        return [task for task in tasks if task is not None]
+
+    def submit_full_report(self, results: Dict[str, Any],
+                           detector_summary: Dict[str, Any] = None) -> List[Tuple[Dict[str, Any], Future]]:
+        """
+        전체 리포트 차트를 프로세스 풀에 제출하고 바로 반환 (엑셀 생성 등과 동시 진행용)
 
-        axes[0].bar(classifications, file_counts, color=colors, alpha=0.8, edgecolor='black')
-        axes[0].set_xlabel('File Classification', fontweight='bold')
-        axes[0].set_ylabel('Number of Files', fontweight='bold')
-        axes[0].set_title('Files by Classification Type', fontsize=12, fontweight='bold')
-        axes[0].tick_params(axis='x', rotation=45)
+        Args:
+            results: 분석 결과
+            detector_summary: 검출기 요약 정보
 
-        for i, v in enumerate(file_counts):
-            axes[0].text(i, v + 0.1, str(v), ha='center', fontweight='bold')
+        Returns:
+            (작업, Future) 리스트 - wait_for_report()로 완료 대기
+        """
+        tasks = self._build_report_tasks(results, detector_summary)
+        self._remove_stale_pages(tasks)
+        pending = []
+
+        # 캐시 hit는 렌더링 없이 완료 처리
+        if self.cache is not None:
+            remaining = []
+            for task in tasks:
+                if self.cache.lookup(task):
+                    future = Future()
+                    future.set_result(task['output_path'])
+                    task['cached'] = True
+                    pending.append((task, future))
+                else:
+                    remaining.append(task)
+            tasks = remaining
+
+        if not tasks:
+            return pending
+
+        if self.max_workers == 0:
+            for task in tasks:
+                future = Future()
+                try:
+                    future.set_result(render_chart(task))
+                except Exception as e:
+                    future.set_exception(e)
+                pending.append((task, future))
+            return pending
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        for task in tasks:
+            pending.append((task, self._executor.submit(render_chart, task)))
+        return pending
+
+    def _remove_stale_pages(self, tasks: List[Dict[str, Any]]):
+        """
+        이번 리포트에 없는 페이지 차트 파일과 캐시 기록 삭제 (클래스 수가 줄어 페이지가 줄어든 경우 등)
 
-        # 2. 파일명 분류별 객체 수
-        if file_classification_distribution:
-            object_counts = list(file_classification_distribution.values())
-            axes[1].bar(classifications, object_counts, color=colors, alpha=0.8, edgecolor='black')
-            axes[1].set_xlabel('File Classification', fontweight='bold')
-            axes[1].set_ylabel('Number of Objects', fontweight='bold')
-            axes[1].set_title('Objects Detected by Classification Type', fontsize=12, fontweight='bold')
-            axes[1].tick_params(axis='x', rotation=45)
-
-            for i, v in enumerate(object_counts):
-                axes[1].text(i, v + 0.5, str(v), ha='center', fontweight='bold')
-        else:
-            axes[1].remove()
-            fig.set_size_inches(10, 6)
+        Args:
+            tasks: 이번 리포트의 차트 작업
+        """
+        current = {os.path.basename(task['output_path']) for task in tasks}
+        try:
+            filenames = os.listdir(self.output_dir)
+        except OSError:
+            return
+
+        removed = 0
+        for filename in filenames:
+            if filename in current or not _PAGE_FILE_PATTERN.match(filename):
+                continue
+            try:
+                os.remove(os.path.join(self.output_dir, filename))
+            except OSError as e:
+                print(f"[!] Could not remove stale page chart {filename}: {e}")
+                continue
+            if self.cache is not None:
+                self.cache.forget(filename)
+            removed += 1
+        if removed:
+            print(f"[*] Removed {removed} stale page chart(s)")
+
+    def wait_for_report(self, pending: List[Tuple[Dict[str, Any], Future]]) -> List[str]:
+        """
+        제출한 차트 렌더링 완료 대기
 
-        plt.tight_layout()
-        output_path = os.path.join(self.output_dir, 'file_classification_analysis.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        Args:
+            pending: submit_full_report() 결과
 
-        print(f"[+] File classification analysis saved to {output_path}")
-        return output_path
+        Returns:
+            생성된 파일 경로 리스트 (실패한 차트 제외)
+        """
+        generated_files = []
+        for task, future in pending:
+            try:
+                output_path = future.result()
+            except Exception as e:
+                print(f"[!] Error rendering {task['name']}: {e}")
+                continue
+            if task.get('cached'):
+                print(f"[*] Chart unchanged, using cached {output_path}")
+            else:
+                print(f"[+] Chart saved to {output_path}")
+                if self.cache is not None:
+                    self.cache.store(task)
+            generated_files.append(output_path)
+
+        if self.cache is not None:
+            self.cache.save()
+            print(f"[*] Chart cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es)")
+        return generated_files
 
     def create_full_report(self, results: Dict[str, Any], detector_summary: Dict[str, Any] = None) -> List[str]:
         """
@@ -337,51 +1018,43 @@ class ResultVisualizer:
         Returns:
             생성된 파일 경로 리스트
         """
-        generated_files = []
+        return self.wait_for_report(self.submit_full_report(results, detector_summary))
 
-        # 1. 메트릭 요약
-        file1 = self.plot_metrics_summary(results)
-        generated_files.append(file1)
-
-        # 2. 검출률
-        file2 = self.plot_detection_rate(results['detection_rate'])
-        generated_files.append(file2)
-
-        # 3. 클래스 분포
-        if detector_summary and 'class_distribution' in detector_summary:
-            file3 = self.plot_class_distribution(detector_summary['class_distribution'], title='Detection Class Distribution')
-            generated_files.append(file3)
-
-        # 4. 신뢰도 분포 (detector_summary에서 추출)
-        if detector_summary and 'all_confidences' in detector_summary:
-            file4 = self.plot_confidence_distribution(detector_summary['all_confidences'])
-            generated_files.append(file4)
-
-        # 5. 파일 종류 분포
-        if detector_summary and 'file_type_distribution' in detector_summary:
-            file5 = self.plot_file_type_analysis(detector_summary['file_type_distribution'])
-            generated_files.append(file5)
-
-        # 6. 불량 유형 분포 (클래스 분포와 동일)
-        if detector_summary and 'class_distribution' in detector_summary:
-            file6 = self.plot_defect_type_analysis(detector_summary['class_distribution'])
-            generated_files.append(file6)
-
-        # 7. 파일명 분류 분석
-        if detector_summary and 'file_classification_stats' in detector_summary:
-            file7 = self.plot_file_classification_analysis(
-                detector_summary['file_classification_stats'],
-                detector_summary.get('file_classification_distribution', {})
-            )
-            if file7:
-                generated_files.append(file7)
+    def shutdown(self):
+        """렌더링 프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
-        return generated_files
+
+def parse_chart_options(specs: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    차트별 저장 설정 문자열 파싱
+
+    Args:
+        specs: 'NAME=FORMAT[:DPI]' 리스트 (예: ['metrics_summary=svg', 'detection_rate=png:150'])
+
+    Returns:
+        ResultVisualizer chart_options 딕셔너리
+    """
+    options = {}
+    for spec in specs or []:
+        name, _, value = spec.partition('=')
+        chart_format, _, dpi = value.partition(':')
+        if not name or chart_format not in CHART_FORMATS:
+            raise ValueError(f"Invalid chart option: {spec} (expected NAME=png|svg[:DPI])")
+
+        options[name] = {'format': chart_format}
+        if dpi:
+            options[name]['dpi'] = int(dpi)
+    return options
 
 
 def main():
     """테스트 코드"""
-    visualizer = ResultVisualizer()
+    import numpy as np
+
+    visualizer = ResultVisualizer(chart_options={'metrics_summary': {'format': 'svg'}})
 
     # 샘플 데이터
     sample_results = {
@@ -416,6 +1089,7 @@ def main():
 
     # 전체 리포트 생성
     files = visualizer.create_full_report(sample_results, sample_detector_summary)
+    visualizer.shutdown()
     print(f"\n[+] Generated {len(files)} visualization files")
 
 
@@ -0,0 +1,351 @@
+"""
+YOLO Ops - 내보낸(export) YOLO 모델용 NumPy 전처리/후처리 모듈
+letterbox 전처리 (버퍼 재사용), YOLOv8/YOLOv5 출력 디코딩, 클래스별 벡터화 NMS
+torch 없이 동작하므로 추론 전용 배포에서 PyTorch 의존성이 필요 없음
+"""
+
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+
+# ultralytics와 동일한 기본값
+LETTERBOX_COLOR = 114
+MAX_WH = 7680  # 클래스별 NMS를 한 번에 처리하기 위한 좌표 오프셋
+MAX_NMS = 30000  # NMS 전 최대 후보 수
+MAX_DET = 300  # 이미지당 최대 검출 수
+
+
+class Letterbox:
+    """
+    비율 유지 리사이즈 + 패딩 + 정규화 + HWC(BGR) → NCHW(RGB) 변환
+
+    캔버스/리사이즈/입력 텐서 버퍼를 이미지 간에 재사용한다.
+    반환되는 입력 배열은 내부 버퍼이므로 다음 호출 전에 모델에 넘겨야 한다.
+    """
+
+    def __init__(self, input_size: Tuple[int, int] = (640, 640), batch_size: int = 1):
+        """
+        Args:
+            input_size: 모델 입력 크기 (height, width)
+            batch_size: 입력 텐서 배치 크기
+        """
+        self.input_size = tuple(input_size)
+        height, width = self.input_size
+        self.canvas = np.full((height, width, 3), LETTERBOX_COLOR, dtype=np.uint8)
+        self.blob = np.empty((batch_size, 3, height, width), dtype=np.float32)
+        self._resized = {}  # {(w, h): 리사이즈 버퍼}
+        self._layout = None  # 마지막 패딩 배치 (left, top, w, h)
+
+    def compute_meta(self, image_shape: Tuple[int, int]) -> Tuple[float, int, int, int, int]:
+        """
+        원본 크기에 대한 (scale, left, top, new_w, new_h) 계산 (ultralytics와 동일한 반올림)
+
+        Args:
+            image_shape: 원본 이미지 (height, width)
+        """
+        target_h, target_w = self.input_size
+        height, width = image_shape[:2]
+        scale = min(target_h / height, target_w / width)
+        new_w, new_h = int(round(width * scale)), int(round(height * scale))
+        pad_x, pad_y = (target_w - new_w) / 2, (target_h - new_h) / 2
+        return scale, int(round(pad_x - 0.1)), int(round(pad_y - 0.1)), new_w, new_h
+
+    def fill(self, image: np.ndarray, index: int = 0) -> Tuple[float, int, int]:
+        """
+        이미지를 입력 텐서의 index 번째 슬롯에 기록
+
+        Args:
+            image: BGR 이미지 (H, W, 3) uint8
+            index: 배치 내 위치
+
+        Returns:
+            좌표 복원 정보 (scale, pad_x, pad_y)
+        """
+        scale, left, top, new_w, new_h = self.compute_meta(image.shape)
+
+        # 패딩 배치가 바뀌었을 때만 캔버스 전체를 다시 채움
+        layout = (left, top, new_w, new_h)
+        if layout != self._layout:
+            self.canvas.fill(LETTERBOX_COLOR)
+            self._layout = layout
+
+        if (new_w, new_h) == (image.shape[1], image.shape[0]):
+            self.canvas[top:top + new_h, left:left + new_w] = image
+        else:
+            resized = self._resized.get((new_w, new_h))
+            if resized is None:
+                resized = np.empty((new_h, new_w, 3), dtype=np.uint8)
+                self._resized[(new_w, new_h)] = resized
+            cv2.resize(image, (new_w, new_h), dst=resized, interpolation=cv2.INTER_LINEAR)
+            self.canvas[top:top + new_h, left:left + new_w] = resized
+
+        # BGR → RGB, HWC → CHW, [0, 255] → [0, 1] (새 배열 할당 없이 버퍼에 기록)
+        np.multiply(self.canvas[:, :, ::-1].transpose(2, 0, 1), np.float32(1.0 / 255.0), out=self.blob[index])
+        return scale, left, top
+
+    def __call__(self, image: np.ndarray) -> Tuple[np.ndarray, Tuple[float, int, int]]:
+        """
+        단일 이미지 전처리
+
+        Returns:
+            (입력 텐서 (1, 3, H, W), 좌표 복원 정보)
+        """
+        meta = self.fill(image, 0)
+        return self.blob[:1], meta
+
+
+def prediction_layout(shape: Tuple[int, ...], num_classes: int) -> str:
+    """
+    배치 차원이 제거된 출력 shape로 YOLO 출력 형식 판별
+
+    Args:
+        shape: 출력 shape (행, 열)
+        num_classes: 클래스 수 (0이면 알 수 없음: 메타데이터 없는 export 모델)
+
+    Returns:
+        'v5' (N, 5 + nc) 또는 'v8' ((4 + nc, N) 또는 전치된 (N, 4 + nc))
+
+    Raises:
+        ValueError: 클래스 수 없이 행 우선 출력이 들어온 경우 (YOLOv5와 전치된 YOLOv8을 구분할 수 없음)
+    """
+    rows, columns = shape[-2], shape[-1]
+    if num_classes > 0:
+        return 'v5' if columns == num_classes + 5 else 'v8'
+
+    # 클래스 수를 모르면 방향으로만 판별 (채널 우선 출력은 YOLOv8 export뿐)
+    if rows < columns:
+        return 'v8'
+    raise ValueError(f"Cannot decode output of shape {tuple(shape)} without the class count: "
+                     f"YOLOv5 (N, 5 + nc) and YOLOv8 (N, 4 + nc) layouts are ambiguous "
+                     f"(provide class names, e.g. the export's metadata.yaml)")
+
+
+def decode_predictions(outputs: np.ndarray, num_classes: int, confidence: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    YOLO 원시 출력 한 장을 xyxy 박스/점수/클래스로 디코딩 (신뢰도 필터 포함)
+
+    Args:
+        outputs: YOLOv8 (4 + nc, N) 또는 YOLOv5 (N, 5 + nc) 출력
+        num_classes: 클래스 수 (0이면 출력 방향으로 형식 판별, prediction_layout() 참고)
+        confidence: 신뢰도 임계값
+
+    Returns:
+        (boxes (M, 4) xyxy, scores (M,), class_ids (M,))
+    """
+    predictions = np.asarray(outputs)
+
+    if prediction_layout(predictions.shape, num_classes) == 'v5':
+        # YOLOv5: [cx, cy, w, h, obj, cls...]
+        boxes = predictions[:, :4]
+        class_scores = predictions[:, 5:] * predictions[:, 4:5]
+    else:
+        # YOLOv8: [cx, cy, w, h, cls...] (채널 우선)
+        if predictions.shape[0] < predictions.shape[1]:
+            predictions = predictions.T
+        boxes = predictions[:, :4]
+        class_scores = predictions[:, 4:]
+
+    class_ids = class_scores.argmax(axis=1)
+    scores = np.take_along_axis(class_scores, class_ids[:, None], axis=1)[:, 0]
+    keep = scores > confidence
+    boxes, scores, class_ids = boxes[keep], scores[keep], class_ids[keep]
+
+    xyxy = np.empty_like(boxes)
+    half_w, half_h = boxes[:, 2] / 2, boxes[:, 3] / 2
+    xyxy[:, 0] = boxes[:, 0] - half_w
+    xyxy[:, 1] = boxes[:, 1] - half_h
+    xyxy[:, 2] = boxes[:, 0] + half_w
+    xyxy[:, 3] = boxes[:, 1] + half_h
+    return xyxy, scores, class_ids
+
+
+def _rank_within_class(class_ids: np.ndarray) -> np.ndarray:
+    """점수 내림차순으로 정렬된 배열에서 각 항목의 클래스 내 순위"""
+    order = np.argsort(class_ids, kind='stable')
+    sorted_ids = class_ids[order]
+    group_start = np.r_[0, np.flatnonzero(np.diff(sorted_ids)) + 1]
+    group_sizes = np.diff(np.r_[group_start, len(sorted_ids)])
+    ranks_sorted = np.arange(len(sorted_ids)) - np.repeat(group_start, group_sizes)
+    ranks = np.empty_like(ranks_sorted)
+    ranks[order] = ranks_sorted
+    return ranks
+
+
+def non_max_suppression(boxes: np.ndarray, scores: np.ndarray, class_ids: np.ndarray, iou_threshold: float,
+                        max_det: int = MAX_DET, max_per_class: int = None, max_nms: int = MAX_NMS) -> np.ndarray:
+    """
+    클래스별 벡터화 NMS
+
+    클래스마다 좌표를 MAX_WH 만큼 이동시켜 한 번의 NMS로 클래스 간 억제를 막는다.
+    각 반복에서 남은 후보 전체와의 IoU를 한 번에 계산한다.
+
+    Args:
+        boxes: (N, 4) xyxy 박스
+        scores: (N,) 점수
+        class_ids: (N,) 클래스 ID
+        iou_threshold: IoU 임계값
+        max_det: 최대 검출 수
+        max_per_class: 클래스별 최대 검출 수 (None이면 제한 없음, NMS 전후 모두 적용)
+        max_nms: NMS 전 최대 후보 수
+
+    Returns:
+        유지할 인덱스 (점수 내림차순)
+    """
+    if len(scores) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    order = np.argsort(-scores, kind='stable')[:max_nms]
+
+    # 클래스별 top-k 후보만 NMS에 사용
+    if max_per_class is not None:
+        order = order[_rank_within_class(class_ids[order]) < max_per_class]
+
+    offset_boxes = boxes[order] + (class_ids[order, None] * MAX_WH).astype(boxes.dtype)
+    x1, y1, x2, y2 = offset_boxes.T
+    areas = (x2 - x1) * (y2 - y1)
+
+    keep = []
+    candidates = np.arange(len(order))
+    while candidates.size and len(keep) < max_det:
+        best = candidates[0]
+        keep.append(best)
+        rest = candidates[1:]
+
+        inter_w = np.clip(np.minimum(x2[best], x2[rest]) - np.maximum(x1[best], x1[rest]), 0, None)
+        inter_h = np.clip(np.minimum(y2[best], y2[rest]) - np.maximum(y1[best], y1[rest]), 0, None)
+        inter = inter_w * inter_h
+        iou = inter / np.maximum(areas[best] + areas[rest] - inter, 1e-9)
+        candidates = rest[iou <= iou_threshold]
+
+    kept = order[np.asarray(keep, dtype=np.int64)]
+
+    if max_per_class is not None:
+        kept = kept[_rank_within_class(class_ids[kept]) < max_per_class]
+    return kept
+
+
+def scale_boxes(boxes: np.ndarray, meta: Tuple[float, int, int], image_shape: Tuple[int, int]) -> np.ndarray:
+    """
+    letterbox 좌표를 원본 이미지 좌표로 복원 (이미지 경계로 클리핑, in-place)
+
+    Args:
+        boxes: (N, 4) xyxy 박스
+        meta: Letterbox가 반환한 (scale, pad_x, pad_y)
+        image_shape: 원본 이미지 (height, width)
+    """
+    scale, pad_x, pad_y = meta
+    boxes[:, [0, 2]] = (boxes[:, [0, 2]] - pad_x) / scale
+    boxes[:, [1, 3]] = (boxes[:, [1, 3]] - pad_y) / scale
+    boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, image_shape[1])
+    boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, image_shape[0])
+    return boxes
+
+
+def postprocess(outputs: np.ndarray, meta: Tuple[float, int, int], image_shape: Tuple[int, int],
+                num_classes: int, confidence: float, iou: float,
+                max_det: int = MAX_DET, max_per_class: int = None) -> np.ndarray:
+    """
+    원시 출력 한 장 → (N, 6) [x1, y1, x2, y2, confidence, class_id] (원본 좌표)
+
+    Args:
+        outputs: 배치 차원이 제거된 모델 출력
+        meta: Letterbox 좌표 복원 정보
+        image_shape: 원본 이미지 (height, width)
+        num_classes: 클래스 수
+        confidence: 신뢰도 임계값
+        iou: NMS IOU 임계값
+        max_det: 최대 검출 수
+        max_per_class: 클래스별 최대 검출 수
+    """
+    boxes, scores, class_ids = decode_predictions(outputs, num_classes, confidence)
+    keep = non_max_suppression(boxes, scores, class_ids, iou, max_det=max_det, max_per_class=max_per_class)
+    if len(keep) == 0:
+        return np.zeros((0, 6), dtype=np.float32)
+
+    detections = np.empty((len(keep), 6), dtype=np.float32)
+    detections[:, :4] = scale_boxes(boxes[keep].astype(np.float32), meta, image_shape)
+    detections[:, 4] = scores[keep]
+    detections[:, 5] = class_ids[keep]
+    return detections
+
+
+def _reference_nms(boxes: np.ndarray, scores: np.ndarray, class_ids: np.ndarray, iou_threshold: float) -> List[int]:
+    """검증용 단순 클래스별 NMS (반복문 구현)"""
+    def iou(a, b):
+        w = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+        h = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+        inter = w * h
+        union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+        return inter / union if union > 0 else 0.0
+
+    keep = []
+    for i in np.argsort(-scores, kind='stable'):
+        if all(class_ids[j] != class_ids[i] or iou(boxes[i], boxes[j]) <= iou_threshold for j in keep):
+            keep.append(int(i))
+    return keep
+
+
+def main():
+    """테스트 코드"""
+    rng = np.random.default_rng(0)
+
+    print("\n" + "="*70)
+    print("YOLO OPS TEST")
+    print("="*70)
+
+    # NMS: 벡터화 구현과 단순 구현 비교
+    all_pass = True
+    for trial in range(20):
+        n = int(rng.integers(1, 400))
+        xy = rng.uniform(0, 600, (n, 2))
+        wh = rng.uniform(10, 120, (n, 2))
+        boxes = np.concatenate([xy, xy + wh], axis=1).astype(np.float32)
+        scores = rng.uniform(0, 1, n).astype(np.float32)
+        class_ids = rng.integers(0, 5, n)
+
+        fast = non_max_suppression(boxes, scores, class_ids, 0.45, max_det=n).tolist()
+        reference = _reference_nms(boxes, scores, class_ids, 0.45)
+        if fast != reference:
+            all_pass = False
+            print(f"[FAIL] NMS trial {trial}: {len(fast)} vs {len(reference)}")
+
+    # 클래스별 top-k
+    boxes = np.array([[0, 0, 10, 10], [20, 20, 30, 30], [40, 40, 50, 50], [0, 0, 10, 10]], dtype=np.float32)
+    kept = non_max_suppression(boxes, np.array([0.9, 0.8, 0.7, 0.6], dtype=np.float32),
+                               np.array([0, 0, 0, 1]), 0.45, max_per_class=2)
+    if kept.tolist() != [0, 1, 3]:
+        all_pass = False
+        print(f"[FAIL] per-class top-k: {kept.tolist()}")
+
+    # letterbox 좌표 왕복
+    letterbox = Letterbox((640, 640))
+    image = rng.integers(0, 255, (480, 960, 3), dtype=np.uint8)
+    blob, meta = letterbox(image)
+    box = np.array([[100.0, 50.0, 300.0, 200.0]], dtype=np.float32)
+    scale, pad_x, pad_y = meta
+    letterboxed = box * scale + np.array([pad_x, pad_y, pad_x, pad_y], dtype=np.float32)
+    restored = scale_boxes(letterboxed, meta, image.shape)
+    if blob.shape != (1, 3, 640, 640) or not np.allclose(restored, box, atol=1e-3):
+        all_pass = False
+        print(f"[FAIL] letterbox round trip: {restored}")
+
+    # 출력 형식 판별: 클래스 수를 모르면 채널 우선(YOLOv8)만 허용, YOLOv5는 명시적 오류
+    layouts = [prediction_layout((25200, 85), 80), prediction_layout((84, 8400), 80),
+               prediction_layout((8400, 84), 80), prediction_layout((84, 8400), 0)]
+    try:
+        prediction_layout((25200, 85), 0)
+        layouts.append('decoded')
+    except ValueError:
+        layouts.append('error')
+    if layouts != ['v5', 'v8', 'v8', 'v8', 'error']:
+        all_pass = False
+        print(f"[FAIL] prediction layout: {layouts}")
+
+    print("[+] All tests passed!" if all_pass else "[!] Some tests failed!")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()